@@ -16,3 +16,4 @@ from .textcorpus import TextCorpus
 from .ucicorpus import UciCorpus
 from .malletcorpus import MalletCorpus
 from .sharded_corpus import ShardedCorpus
+from .csccorpus import CscCorpus
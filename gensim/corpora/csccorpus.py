@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015 Radim Rehurek <radimrehurek@seznam.cz>
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+
+"""
+Corpus stored in a binary, columnar format: the three arrays (`indptr`, `indices`
+and `data`) of a scipy.sparse.csc_matrix with documents as columns.
+
+Unlike the text-based formats (Matrix Market etc.), nothing needs to be parsed
+when reading the corpus back. The arrays are memory-mapped, so that `corpus[docno]`
+and slicing are O(1) with no data copies, and iteration is typically an order of
+magnitude faster than `MmCorpus`:
+
+>>> CscCorpus.serialize('corpus.csc', MmCorpus('corpus.mm'))
+>>> corpus = CscCorpus('corpus.csc')  # mmap'ed read-only by default
+>>> print(corpus[42])  # retrieve document no. 42, etc.
+>>> for block in corpus.iter_chunks(chunksize=10000):  # scipy.sparse blocks, no tuples
+...     pass
+
+On disk, the corpus consists of a small pickled header stored in `fname`, plus
+the raw arrays in `fname.indptr`, `fname.indices` and `fname.data`.
+"""
+
+
+from __future__ import with_statement
+
+import copy
+import logging
+import os
+
+import numpy
+import scipy.sparse
+
+from gensim import utils
+from gensim.corpora import IndexedCorpus
+
+from six.moves import xrange
+
+
+logger = logging.getLogger('gensim.corpora.csccorpus')
+
+
+class CscCorpus(IndexedCorpus):
+    """
+    Corpus stored as memory-mapped arrays of a sparse csc matrix (documents = columns).
+
+    `corpus.index` holds the offset of each document into the `indices`/`data`
+    arrays (the same role byte offsets play for the text-based formats).
+    """
+    def __init__(self, fname, mmap='r'):
+        """
+        Load a corpus previously stored with `CscCorpus.serialize`.
+
+        `mmap` is passed to `numpy.memmap`; the default 'r' maps the arrays
+        read-only, so that the corpus can be larger than the available RAM and
+        its pages are shared between processes. Use `mmap=None` to load the
+        arrays fully into memory instead.
+        """
+        logger.info("loading sparse csc corpus from %s" % fname)
+        self.fname = fname
+        header = utils.unpickle(fname)
+        self.num_terms, self.num_nnz = header['num_terms'], header['num_nnz']
+        self.dtype = numpy.dtype(header['dtype'])
+        self.indptr = _load_array(fname + '.indptr', header['indptr_dtype'], header['num_docs'] + 1, mmap)
+        self.indices = _load_array(fname + '.indices', header['indices_dtype'], self.num_nnz, mmap)
+        self.data = _load_array(fname + '.data', self.dtype, self.num_nnz, mmap)
+        self.index = self.indptr[:-1]
+        logger.info("accepted corpus with %i documents, %i features, %i non-zero entries" %
+                    (self.num_docs, self.num_terms, self.num_nnz))
+
+    @property
+    def num_docs(self):
+        return len(self.indptr) - 1
+
+    def __len__(self):
+        return self.num_docs
+
+    def __str__(self):
+        return ("CscCorpus(%i documents, %i features, %i non-zero entries)" %
+                (self.num_docs, self.num_terms, self.num_nnz))
+
+    def __iter__(self):
+        """
+        Iterate over the corpus, yielding one document (list of 2-tuples) at a time.
+
+        Documents are converted from the underlying arrays in large blocks, which
+        avoids any per-value work in Python other than forming the 2-tuples.
+        """
+        chunksize = 4096
+        for chunk_start in xrange(0, self.num_docs, chunksize):
+            ptrs = self.indptr[chunk_start: chunk_start + chunksize + 1].tolist()
+            start = ptrs[0]
+            indices = self.indices[start: ptrs[-1]].tolist()
+            data = self.data[start: ptrs[-1]].tolist()
+            for prev, now in zip(ptrs, ptrs[1:]):
+                yield list(zip(indices[prev - start: now - start], data[prev - start: now - start]))
+
+    def iter_chunks(self, chunksize=None):
+        """
+        Iterate over the corpus in blocks of `chunksize` documents, yielding
+        each block as a scipy.sparse.csc_matrix of shape `num_terms x len(block)`.
+
+        The blocks share their `indices` and `data` with the underlying (mmap'ed)
+        arrays, no data is copied. With `chunksize=None`, the whole corpus is
+        returned as a single block.
+        """
+        if chunksize is None:
+            chunksize = max(self.num_docs, 1)
+        for chunk_start in xrange(0, self.num_docs, chunksize):
+            chunk_end = min(self.num_docs, chunk_start + chunksize)
+            yield self._block(chunk_start, chunk_end)
+
+    def _block(self, start, end):
+        """Return documents `start`..`end` as a csc matrix, without copying their data."""
+        indptr = self.indptr[start: end + 1]
+        first, last = int(indptr[0]), int(indptr[-1])
+        indptr = indptr - first
+        if last - first <= numpy.iinfo(self.indices.dtype).max:
+            # use the same integer type for indptr and indices, so that scipy doesn't
+            # feel the need to copy (=upcast) the indices
+            indptr = indptr.astype(self.indices.dtype)
+        return scipy.sparse.csc_matrix(
+            (self.data[first: last], self.indices[first: last], indptr),
+            shape=(self.num_terms, end - start), copy=False)
+
+    def docbyoffset(self, offset, end):
+        """Return the document stored at positions `offset`..`end` of the arrays."""
+        return list(zip(self.indices[offset: end].tolist(), self.data[offset: end].tolist()))
+
+    def __getitem__(self, docno):
+        """
+        Return document `docno` (an int), or a sub-corpus selected by a slice,
+        list or numpy array of document numbers.
+
+        Simple slices (step 1) return a view into the same arrays; fancy indexing
+        copies the selected documents into memory, like in numpy.
+        """
+        if isinstance(docno, (int, numpy.integer)):
+            if docno < 0:
+                docno += self.num_docs
+            if not 0 <= docno < self.num_docs:
+                raise IndexError("document %i out of range for corpus of %i documents" % (docno, self.num_docs))
+            return self.docbyoffset(int(self.indptr[docno]), int(self.indptr[docno + 1]))
+        if isinstance(docno, slice):
+            start, stop, step = docno.indices(self.num_docs)
+            if step == 1:
+                result = copy.copy(self)
+                result.indptr = self.indptr[start: max(start, stop) + 1]
+                result.index = result.indptr[:-1]
+                result.num_nnz = int(result.indptr[-1] - result.indptr[0])
+                return result
+            docno = numpy.arange(start, stop, step)
+        if isinstance(docno, (list, numpy.ndarray)):
+            return self._take(numpy.asarray(docno, dtype=numpy.int64))
+        raise ValueError('Unrecognised value for docno, use either a single integer, a slice or a numpy.ndarray')
+
+    def _take(self, docnos):
+        """Return a new in-memory corpus holding only documents `docnos` (fancy indexing)."""
+        docnos = numpy.where(docnos < 0, docnos + self.num_docs, docnos)
+        starts, ends = self.indptr[docnos], self.indptr[docnos + 1]
+        lens = ends - starts
+        indptr = numpy.zeros(len(docnos) + 1, dtype=self.indptr.dtype)
+        numpy.cumsum(lens, out=indptr[1:])
+        # position of each selected value in the original arrays
+        positions = numpy.arange(indptr[-1], dtype=numpy.int64) + numpy.repeat(starts - indptr[:-1], lens)
+        result = copy.copy(self)
+        result.indptr, result.indices, result.data = indptr, self.indices[positions], self.data[positions]
+        result.index = result.indptr[:-1]
+        result.num_nnz = int(indptr[-1])
+        return result
+
+    @classmethod
+    def serialize(serializer, fname, corpus, id2word=None, index_fname=None, progress_cnt=None, labels=None, metadata=False):
+        """
+        Store `corpus` (any iterable of sparse documents) to `fname`.
+
+        The stored arrays act as their own index, so no separate index file is
+        written and `index_fname` is ignored. See `save_corpus` for details.
+        """
+        if getattr(corpus, 'fname', None) == fname:
+            raise ValueError("identical input vs. output corpus filename, refusing to serialize: %s" % fname)
+        if progress_cnt is not None:
+            serializer.save_corpus(fname, corpus, id2word, progress_cnt=progress_cnt, metadata=metadata)
+        else:
+            serializer.save_corpus(fname, corpus, id2word, metadata=metadata)
+
+    @staticmethod
+    def save_corpus(fname, corpus, id2word=None, progress_cnt=10000, metadata=False, dtype=numpy.float64, chunksize=10000):
+        """
+        Save a corpus in the csc format to disk, in a single pass over `corpus`
+        (which can be a once-only stream, larger than the available RAM).
+
+        `dtype` is the type used to store the feature weights. If `corpus`
+        supports `iter_chunks` (such as another `CscCorpus`), its scipy.sparse blocks
+        are written out directly.
+
+        Feature ids are stored as 32bit integers, or as 64bit integers if `id2word`
+        (or `corpus.num_terms`) holds more than 2**31 features; a feature id beyond
+        the chosen type raises a ValueError.
+
+        This function is automatically called by `CscCorpus.serialize`; don't
+        call it directly, call `serialize` instead.
+        """
+        if fname.endswith('.gz') or fname.endswith('.bz2'):
+            raise NotImplementedError("compressed output not supported with CscCorpus")
+        logger.info("storing corpus in sparse csc format to %s" % fname)
+
+        if hasattr(corpus, 'metadata'):
+            orig_metadata = corpus.metadata
+            corpus.metadata = metadata
+        else:
+            metadata = False
+        if metadata:
+            docno2metadata = {}
+
+        # 32bit feature ids, unless the known number of features needs more
+        num_terms = len(id2word) if id2word is not None else getattr(corpus, 'num_terms', None)
+        if num_terms is not None and num_terms > numpy.iinfo(numpy.int32).max + 1:
+            index_dtype = numpy.dtype(numpy.int64)
+        else:
+            index_dtype = numpy.dtype(numpy.int32)
+        num_docs, num_nnz, max_id = 0, 0, -1
+        with utils.smart_open(fname + '.indptr', 'wb') as fptr:
+            with utils.smart_open(fname + '.indices', 'wb') as find:
+                with utils.smart_open(fname + '.data', 'wb') as fdata:
+                    numpy.zeros(1, dtype=numpy.int64).tofile(fptr)
+                    if hasattr(corpus, 'iter_chunks') and not metadata:
+                        blocks = corpus.iter_chunks(chunksize)
+                    else:
+                        blocks = (_chunk2block(chunk, first_docno, docno2metadata if metadata else None)
+                                  for first_docno, chunk in _enumerate_chunks(corpus, chunksize))
+                    for block in blocks:
+                        block = block.tocsc()
+                        if num_docs // progress_cnt != (num_docs + block.shape[1]) // progress_cnt:
+                            logger.info("PROGRESS: saving document #%i" % num_docs)
+                        indptr = block.indptr[:block.shape[1] + 1].astype(numpy.int64)
+                        indices, data = block.indices[: indptr[-1]], block.data[: indptr[-1]]
+                        if len(indices):
+                            max_id = max(max_id, int(indices.max()))
+                        if max_id > numpy.iinfo(index_dtype).max:
+                            raise ValueError("feature id %i doesn't fit into %s; pass an `id2word` that covers "
+                                             "all feature ids, to store them as 64bit" % (max_id, index_dtype))
+                        (indptr[1:] + num_nnz).tofile(fptr)
+                        indices.astype(index_dtype).tofile(find)
+                        data.astype(dtype).tofile(fdata)
+                        num_docs += block.shape[1]
+                        num_nnz += len(indices)
+
+        if metadata:
+            utils.pickle(docno2metadata, fname + '.metadata.cpickle')
+            corpus.metadata = orig_metadata
+
+        num_terms = max(num_terms or 0, max_id + 1)
+        header = {
+            'num_docs': num_docs, 'num_terms': num_terms, 'num_nnz': num_nnz,
+            'dtype': numpy.dtype(dtype).str, 'indptr_dtype': numpy.dtype(numpy.int64).str,
+            'indices_dtype': index_dtype.str,
+        }
+        utils.pickle(header, fname)
+        logger.info("saved %ix%i csc corpus with %i non-zero entries to %s" %
+                    (num_terms, num_docs, num_nnz, fname))
+#endclass CscCorpus
+
+
+def _load_array(fname, dtype, length, mmap):
+    """Load a raw 1d array of `length` elements from `fname`, possibly through mmap."""
+    if mmap and length > 0:  # empty files cannot be mmap'ed
+        return numpy.memmap(fname, dtype=dtype, mode=mmap, shape=(length,))
+    result = numpy.fromfile(fname, dtype=dtype) if os.path.getsize(fname) else numpy.empty(0, dtype=dtype)
+    assert len(result) == length, "mismatch between header and size of %s" % fname
+    return result
+
+
+def _enumerate_chunks(corpus, chunksize):
+    """Yield `(number of documents before this chunk, chunk)` for chunks of `corpus`."""
+    docno = 0
+    for chunk in utils.grouper(corpus, chunksize):
+        yield docno, chunk
+        docno += len(chunk)
+
+
+def _chunk2block(chunk, first_docno, docno2metadata=None):
+    """
+    Convert a list of gensim sparse documents into a csc matrix (documents = columns).
+
+    If `docno2metadata` is set, the documents are `(bow, metadata)` pairs; metadata
+    are stored into `docno2metadata` under their document number.
+    """
+    if docno2metadata is not None:
+        for docno, (bow, data) in enumerate(chunk):
+            docno2metadata[first_docno + docno] = data
+        chunk = [bow for bow, _ in chunk]
+    indptr = numpy.zeros(len(chunk) + 1, dtype=numpy.int64)
+    numpy.cumsum([len(doc) for doc in chunk], out=indptr[1:])
+    indices = numpy.fromiter((termid for doc in chunk for termid, _ in doc), dtype=numpy.int64, count=indptr[-1])
+    data = numpy.fromiter((weight for doc in chunk for _, weight in doc), dtype=numpy.float64, count=indptr[-1])
+    num_terms = int(indices.max()) + 1 if len(indices) else 0
+    return scipy.sparse.csc_matrix((data, indices, indptr), shape=(num_terms, len(chunk)))
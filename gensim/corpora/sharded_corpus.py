@@ -589,104 +589,106 @@ class ShardedCorpus(IndexedCorpus):
             return l_result
 
         elif isinstance(offset, slice):
-            start = offset.start
-            stop = offset.stop
-            if stop > self.n_docs:
-                raise IndexError('Requested slice offset {0} out of range'
-                                 ' ({1} docs)'.format(stop, self.n_docs))
-
-            # - get range of shards over which to iterate
-            first_shard = self.shard_by_offset(start)
-
-            last_shard = self.n_shards - 1
-            if not stop == self.n_docs:
-                last_shard = self.shard_by_offset(stop)
-                # This fails on one-past
-                # slice indexing; that's why there's a code branch here.
-
-            #logger.debug('ShardedCorpus: Retrieving slice {0}: '
-            #              'shard {1}'.format((offset.start, offset.stop),
-            #                                 (first_shard, last_shard)))
-
-            self.load_shard(first_shard)
-
-            # The easy case: both in one shard.
-            if first_shard == last_shard:
-                s_result = self.current_shard[start - self.current_offset:
-                                            stop - self.current_offset]
-                # Handle different sparsity settings:
-                s_result = self._getitem_format(s_result)
-
-                return s_result
-
-            # The hard case: the slice is distributed across multiple shards
-            # - initialize numpy.zeros()
-            s_result = numpy.zeros((stop - start, self.dim),
-                                   dtype=self.current_shard.dtype)
-            if self.sparse_serialization:
-                s_result = sparse.csr_matrix((0, self.dim),
-                                             dtype=self.current_shard.dtype)
-
-            # - gradually build it up. We will be using three set of start:stop
-            #   indexes:
-            #    - into the dataset (these are the indexes the caller works with)
-            #    - into the current shard
-            #    - into the result
-
-            # Indexes into current result rows. These are always smaller than
-            # the dataset indexes by `start` (as we move over the shards,
-            # we're moving by the same number of rows through the result).
-            result_start = 0
-            result_stop = self.offsets[self.current_shard_n + 1] - start
-
-            # Indexes into current shard. These are trickiest:
-            #  - if in starting shard, these are from (start - current_offset)
-            #    to self.shardsize
-            #  - if in intermediate shard, these are from 0 to self.shardsize
-            #  - if in ending shard, these are from 0
-            #    to (stop - current_offset)
-            shard_start = start - self.current_offset
-            shard_stop = self.offsets[self.current_shard_n + 1] - \
-                         self.current_offset
-
-            #s_result[result_start:result_stop] = self.current_shard[
-            #                                         shard_start:shard_stop]
-            s_result = self.__add_to_slice(s_result, result_start, result_stop,
-                                           shard_start, shard_stop)
-
-            # First and last get special treatment, these are in between
-            for shard_n in xrange(first_shard+1, last_shard):
-                self.load_shard(shard_n)
+            s_result = self._getitem_slice(offset.start, offset.stop)
+            return self._getitem_format(s_result)
 
-                result_start = result_stop
-                result_stop += self.shardsize
-                shard_start = 0
-                shard_stop = self.shardsize
+        else:
+            s_result = self.get_by_offset(offset)
+            s_result = self._getitem_format(s_result)
 
-                s_result = self.__add_to_slice(s_result, result_start,
-                                               result_stop, shard_start,
-                                               shard_stop)
+            return s_result
 
-            # Last shard
-            self.load_shard(last_shard)
-            result_start = result_stop
-            result_stop += stop - self.current_offset
-            shard_start = 0
-            shard_stop = stop - self.current_offset
+    def _getitem_slice(self, start, stop):
+        """
+        Retrieve rows `start` to `stop` of the dataset, in the format in which
+        they are serialized (numpy ndarray or scipy.sparse csr matrix).
 
-            s_result = self.__add_to_slice(s_result, result_start, result_stop,
-                                           shard_start, shard_stop)
+        """
+        if stop > self.n_docs:
+            raise IndexError('Requested slice offset {0} out of range'
+                             ' ({1} docs)'.format(stop, self.n_docs))
 
-            s_result = self._getitem_format(s_result)
+        # - get range of shards over which to iterate
+        first_shard = self.shard_by_offset(start)
 
-            return s_result
+        last_shard = self.n_shards - 1
+        if not stop == self.n_docs:
+            last_shard = self.shard_by_offset(stop)
+            # This fails on one-past
+            # slice indexing; that's why there's a code branch here.
 
-        else:
-            s_result = self.get_by_offset(offset)
-            s_result = self._getitem_format(s_result)
+        #logger.debug('ShardedCorpus: Retrieving slice {0}: '
+        #              'shard {1}'.format((start, stop),
+        #                                 (first_shard, last_shard)))
+
+        self.load_shard(first_shard)
 
+        # The easy case: both in one shard.
+        if first_shard == last_shard:
+            s_result = self.current_shard[start - self.current_offset:
+                                        stop - self.current_offset]
             return s_result
 
+        # The hard case: the slice is distributed across multiple shards
+        # - initialize numpy.zeros()
+        s_result = numpy.zeros((stop - start, self.dim),
+                               dtype=self.current_shard.dtype)
+        if self.sparse_serialization:
+            s_result = sparse.csr_matrix((0, self.dim),
+                                         dtype=self.current_shard.dtype)
+
+        # - gradually build it up. We will be using three set of start:stop
+        #   indexes:
+        #    - into the dataset (these are the indexes the caller works with)
+        #    - into the current shard
+        #    - into the result
+
+        # Indexes into current result rows. These are always smaller than
+        # the dataset indexes by `start` (as we move over the shards,
+        # we're moving by the same number of rows through the result).
+        result_start = 0
+        result_stop = self.offsets[self.current_shard_n + 1] - start
+
+        # Indexes into current shard. These are trickiest:
+        #  - if in starting shard, these are from (start - current_offset)
+        #    to self.shardsize
+        #  - if in intermediate shard, these are from 0 to self.shardsize
+        #  - if in ending shard, these are from 0
+        #    to (stop - current_offset)
+        shard_start = start - self.current_offset
+        shard_stop = self.offsets[self.current_shard_n + 1] - \
+                     self.current_offset
+
+        #s_result[result_start:result_stop] = self.current_shard[
+        #                                         shard_start:shard_stop]
+        s_result = self.__add_to_slice(s_result, result_start, result_stop,
+                                       shard_start, shard_stop)
+
+        # First and last get special treatment, these are in between
+        for shard_n in xrange(first_shard+1, last_shard):
+            self.load_shard(shard_n)
+
+            result_start = result_stop
+            result_stop += self.shardsize
+            shard_start = 0
+            shard_stop = self.shardsize
+
+            s_result = self.__add_to_slice(s_result, result_start,
+                                           result_stop, shard_start,
+                                           shard_stop)
+
+        # Last shard
+        self.load_shard(last_shard)
+        result_start = result_stop
+        result_stop += stop - self.current_offset
+        shard_start = 0
+        shard_stop = stop - self.current_offset
+
+        s_result = self.__add_to_slice(s_result, result_start, result_stop,
+                                       shard_start, shard_stop)
+
+        return s_result
+
     def __add_to_slice(self, s_result, result_start, result_stop, start, stop):
         """
         Add the rows of the current shard from `start` to `stop`
@@ -772,6 +774,23 @@ class ShardedCorpus(IndexedCorpus):
         for i in xrange(len(self)):
             yield self[i]
 
+    def iter_chunks(self, chunksize=None):
+        """
+        Yield the dataset in blocks of `chunksize` documents, each block as a
+        scipy.sparse.csc_matrix of shape `dim x len(block)` (documents as columns),
+        regardless of the `gensim` and `sparse_retrieval` settings.
+
+        With `chunksize=None`, yield the whole dataset as a single block.
+
+        """
+        if chunksize is None:
+            chunksize = max(len(self), 1)
+        for start in xrange(0, len(self), chunksize):
+            stop = min(len(self), start + chunksize)
+            block = self._getitem_slice(start, stop)
+            # the transpose of a csr matrix is a csc matrix, no data copying involved
+            yield sparse.csr_matrix(block).T
+
     def save(self, *args, **kwargs):
         """
         Save itself (the wrapper) in clean state (after calling `reset()`)
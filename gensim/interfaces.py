@@ -16,7 +16,9 @@ from __future__ import with_statement
 import logging
 import itertools
 
-from gensim import utils, matutils
+import numpy
+
+from gensim import utils, matutils, topk
 from six.moves import xrange
 
 
@@ -43,6 +45,18 @@ class CorpusABC(utils.SaveLoad):
 
     See the :mod:`gensim.corpora.svmlightcorpus` module for an example of a corpus.
 
+    Corpora that can hand out their documents in bulk may optionally also implement
+    an `iter_chunks(chunksize=None)` method, which yields consecutive blocks of
+    `chunksize` documents as scipy.sparse matrices with documents as columns
+    (a single block with all documents if `chunksize` is None):
+
+    >>> for block in corpus.iter_chunks(chunksize=1000):
+    >>>     # block is a scipy.sparse.csc_matrix of shape num_terms x 1000
+
+    Models that process documents in chunks (LSI, LDA...) detect this method and
+    use the blocks directly, skipping the conversion to and from lists of 2-tuples.
+    See :class:`gensim.corpora.CscCorpus` for an example.
+
     Saving the corpus with the `save` method (inherited from `utils.SaveLoad`) will
     only store the *in-memory* (binary, pickled) object representation=the stream
     state, and **not** the documents themselves. See the `save_corpus` static method
@@ -113,7 +127,12 @@ class TransformedCorpus(CorpusABC):
         return len(self.corpus)
 
     def __iter__(self):
-        if self.chunksize:
+        if self.chunksize and hasattr(self.corpus, 'iter_chunks'):
+            # feed the transformation scipy.sparse blocks straight from the corpus
+            for chunk in self.corpus.iter_chunks(self.chunksize):
+                for transformed in self.obj.__getitem__(chunk, chunksize=None):
+                    yield transformed
+        elif self.chunksize:
             for chunk in utils.grouper(self.corpus, self.chunksize):
                 for transformed in self.obj.__getitem__(chunk, chunksize=None):
                     yield transformed
@@ -222,7 +241,10 @@ class SimilarityABC(utils.SaveLoad):
 
         # if the input query was a corpus (=more documents), compute the top-n
         # most similar for each document in turn
-        if matutils.ismatrix(result):
+        if isinstance(result, numpy.ndarray) and result.ndim == 2:
+            # select the top-n of all rows at once
+            return topk.clip_rows(result, self.num_best)
+        elif matutils.ismatrix(result):
             return [matutils.full2sparse_clipped(v, self.num_best) for v in result]
         else:
             # otherwise, return top-n of the single input document
@@ -11,10 +11,11 @@ This module contains math helper functions.
 from __future__ import with_statement
 
 
+import itertools
 import logging
 import math
 
-from gensim import utils
+from gensim import utils, topk
 
 import numpy
 import scipy.sparse
@@ -51,19 +52,10 @@ def argsort(x, topn=None, reverse=False):
 
     If reverse is True, return the greatest elements instead, in descending order.
 
+    See `gensim.topk.argtopk`, which can also skip a set of excluded indices.
+
     """
-    x = numpy.asarray(x)  # unify code path for when `x` is not a numpy array (list, tuple...)
-    if topn is None:
-        topn = x.size
-    if topn <= 0:
-        return []
-    if reverse:
-        x = -x
-    if topn >= x.size or not hasattr(numpy, 'argpartition'):
-        return numpy.argsort(x)[:topn]
-    # numpy >= 1.8 has a fast partial argsort, use that!
-    most_extreme = numpy.argpartition(x, topn)[:topn]
-    return most_extreme.take(numpy.argsort(x.take(most_extreme)))  # resort topn into order
+    return topk.argtopk(x, topn=topn, reverse=reverse)
 
 
 def corpus2csc(corpus, num_terms=None, dtype=numpy.float64, num_docs=None, num_nnz=None, printprogress=0):
@@ -79,6 +71,10 @@ def corpus2csc(corpus, num_terms=None, dtype=numpy.float64, num_docs=None, num_n
     This is the mirror function to `Sparse2Corpus`.
 
     """
+    if hasattr(corpus, 'iter_chunks') and num_docs is None and num_nnz is None and not printprogress:
+        # the corpus can hand out scipy.sparse blocks directly (e.g. CscCorpus), so
+        # don't bother converting them to lists of 2-tuples and back
+        return chunks2csc(corpus.iter_chunks(), num_terms=num_terms, dtype=dtype)
     try:
         # if the input corpus has the `num_nnz`, `num_docs` and `num_terms` attributes
         # (as is the case with MmCorpus for example), we can use a more efficient code path
@@ -127,6 +123,62 @@ def corpus2csc(corpus, num_terms=None, dtype=numpy.float64, num_docs=None, num_n
     return result
 
 
+def chunks2csc(blocks, num_terms=None, dtype=numpy.float64):
+    """
+    Stack a sequence of scipy.sparse blocks (documents as columns) into a single
+    scipy.sparse.csc_matrix.
+
+    The number of rows is `num_terms` if given, otherwise the largest number of
+    rows among the blocks.
+
+    """
+    blocks = [block.tocsc() for block in blocks]
+    if num_terms is None:
+        num_terms = max([block.shape[0] for block in blocks] or [0])
+    if len(blocks) == 1 and blocks[0].shape[0] == num_terms:
+        return blocks[0].astype(dtype)
+    indptr, posnow = [numpy.zeros(1, dtype=numpy.int64)], 0
+    for block in blocks:
+        indptr.append(block.indptr[1:] + posnow)
+        posnow += block.indptr[-1]
+    data = numpy.concatenate([block.data[: block.indptr[-1]] for block in blocks] or [[]]).astype(dtype)
+    indices = numpy.concatenate([block.indices[: block.indptr[-1]] for block in blocks] or [[]]).astype(numpy.int32)
+    indptr = numpy.concatenate(indptr)
+    return scipy.sparse.csc_matrix((data, indices, indptr), shape=(num_terms, len(indptr) - 1), dtype=dtype)
+
+
+def corpus2csc_chunks(corpus, chunksize, num_terms=None, dtype=numpy.float64):
+    """
+    Iterate over `corpus` in chunks of `chunksize` documents, yielding each chunk
+    as a scipy.sparse.csc_matrix with documents as columns.
+
+    If the corpus supports the `iter_chunks` protocol (see `interfaces.CorpusABC`),
+    its blocks are used directly. Otherwise, the chunks are built from the
+    documents with `corpus2csc`.
+
+    """
+    if hasattr(corpus, 'iter_chunks'):
+        for block in corpus.iter_chunks(chunksize):
+            if num_terms is not None and block.shape[0] != num_terms or block.dtype != dtype:
+                block = chunks2csc([block], num_terms=num_terms, dtype=dtype)
+            yield block
+    else:
+        for chunk in utils.grouper(corpus, chunksize):
+            num_nnz = sum(len(doc) for doc in chunk)
+            yield corpus2csc(chunk, num_terms=num_terms, num_docs=len(chunk), num_nnz=num_nnz, dtype=dtype)
+
+
+def chunk_len(chunk):
+    """
+    Return the number of documents in `chunk`, which is either a sequence of
+    documents or a scipy.sparse matrix with documents as columns.
+
+    """
+    if scipy.sparse.issparse(chunk):
+        return chunk.shape[1]
+    return len(chunk)
+
+
 def pad(mat, padrow, padcol):
     """
     Add additional rows/columns to a numpy.matrix `mat`. The new rows/columns
@@ -309,6 +361,17 @@ class Sparse2Corpus(object):
 
     def __len__(self):
         return self.sparse.shape[1]
+
+    def iter_chunks(self, chunksize=None):
+        """
+        Iterate over the matrix in blocks of `chunksize` documents, yielding
+        each block as a scipy.sparse.csc_matrix (documents as columns).
+        With `chunksize=None`, yield the whole matrix as a single block.
+        """
+        if chunksize is None:
+            chunksize = max(len(self), 1)
+        for chunk_start in xrange(0, len(self), chunksize):
+            yield self.sparse[:, chunk_start: chunk_start + chunksize]
 #endclass Sparse2Corpus
 
 
@@ -364,6 +427,42 @@ def unitvec(vec):
         raise ValueError("unknown input type")
 
 
+def unitvec_rows(vectors, out=None, blocksize=65536, workers=1):
+    """
+    Scale each row of the 2d numpy array `vectors` to unit length, storing the result
+    into `out` (a new array of the same shape and dtype, if not given), and return `out`.
+    Rows of zeros are left unchanged.
+
+    `out` may be `vectors` itself, to normalize in place, or a `numpy.memmap`. The rows
+    are processed `blocksize` rows at a time, so only one block per worker is ever in RAM,
+    even when `vectors` and `out` are memory-mapped arrays larger than RAM; with `workers` > 1,
+    that many threads normalize blocks in parallel.
+    """
+    if out is None:
+        out = numpy.empty(vectors.shape, dtype=vectors.dtype)
+
+    def normalize_block(start):
+        block = vectors[start: start + blocksize]
+        # accumulate in (at least) single precision, also for float16 vectors
+        accumulator = numpy.promote_types(block.dtype, numpy.float32)
+        lengths = numpy.sqrt(numpy.einsum('ij,ij->i', block, block, dtype=accumulator))
+        lengths[lengths == 0.0] = 1.0
+        numpy.divide(block, lengths[:, numpy.newaxis], out=out[start: start + blocksize])
+
+    starts = xrange(0, len(vectors), blocksize)
+    if workers > 1 and len(vectors) > blocksize:
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(workers)  # numpy releases the GIL for the heavy lifting
+        try:
+            pool.map(normalize_block, starts, chunksize=1)
+        finally:
+            pool.terminate()
+    else:
+        for start in starts:
+            normalize_block(start)
+    return out
+
+
 def cossim(vec1, vec2):
     """
     Return cosine similarity between two sparse vectors.
@@ -661,6 +760,56 @@ class MmReader(object):
         for previd in xrange(previd + 1, self.num_docs):
             yield previd, []
 
+    def iter_chunks(self, chunksize=None, buffer_lines=100000):
+        """
+        Iterate over the matrix in blocks of `chunksize` documents, yielding
+        each block as a scipy.sparse.csc_matrix of shape `num_terms x len(block)`
+        (documents as columns). With `chunksize=None`, yield a single block.
+
+        Unlike `__iter__`, this parses the input file `buffer_lines` lines at a
+        time with numpy, instead of going line by line and forming 2-tuples in
+        Python, so it's much faster.
+        """
+        if chunksize is None:
+            chunksize = max(self.num_docs, 1)
+        if not self.transposed:
+            # documents are not sorted in the file => no streaming, go through the slow path
+            for chunk in utils.grouper((doc for _, doc in self), chunksize):
+                yield corpus2csc(chunk, num_terms=self.num_terms, num_docs=len(chunk))
+            return
+
+        pending = []  # arrays of parsed (docid, termid, value) triples, not emitted yet
+        last_docid = -1
+        chunk_start = 0
+        with utils.file_or_filename(self.input) as lines:
+            self.skip_headers(lines)
+            while chunk_start < self.num_docs:
+                buffer = list(itertools.islice(lines, buffer_lines))
+                if buffer:
+                    # parse all "docid termid value" triples in the buffer at once
+                    triples = numpy.fromstring(b''.join(buffer), sep=' ').reshape(-1, 3)
+                    if len(triples):
+                        pending.append(triples)
+                        last_docid = triples[-1, 0] - 1  # -1 because MM format counts from 1
+                    if last_docid < chunk_start + chunksize:
+                        continue  # the current block isn't complete yet
+                # emit all blocks that are complete; at the end of input, that's all of them.
+                # the pending buffers are concatenated only here, once per emit, not once per buffer
+                triples = numpy.concatenate(pending) if pending else numpy.empty((0, 3))
+                docids = triples[:, 0] - 1
+                start = 0
+                while chunk_start < self.num_docs and (not buffer or last_docid >= chunk_start + chunksize):
+                    chunk_end = min(self.num_docs, chunk_start + chunksize)
+                    split = numpy.searchsorted(docids, chunk_end)
+                    counts = numpy.bincount(docids[start:split].astype(numpy.int64) - chunk_start, minlength=chunk_end - chunk_start)
+                    indptr = numpy.concatenate([[0], numpy.cumsum(counts)])
+                    termids = (triples[start:split, 1] - 1).astype(numpy.int32)  # HACK assume feature ids fit in 32bit integer
+                    yield scipy.sparse.csc_matrix(
+                        (triples[start:split, 2], termids, indptr), shape=(self.num_terms, chunk_end - chunk_start))
+                    start = split
+                    chunk_start = chunk_end
+                pending = [triples[start:]]
+
 
     def docbyoffset(self, offset):
         """Return document at file offset `offset` (in bytes)"""
@@ -34,8 +34,12 @@ The model can also be instantiated from an existing file on disk in the word2vec
 
 """
 
+import hashlib
 import logging
 import os
+import struct
+import sys
+import threading
 import warnings
 
 try:
@@ -48,12 +52,13 @@ from timeit import default_timer
 
 from numpy import zeros, random, sum as np_sum, add as np_add, concatenate, \
     repeat as np_repeat, array, float32 as REAL, empty, ones, memmap as np_memmap, \
-    sqrt, newaxis, ndarray, dot, vstack, dtype, divide as np_divide
+    sqrt, newaxis, ndarray, dot, vstack, dtype, divide as np_divide, int64, uint64, uint8, arange, \
+    flatnonzero, unique as np_unique, integer as np_integer
 
-from gensim import utils, matutils  # utility fnc for pickling, common scipy operations etc
+from gensim import utils, matutils, topk  # utility fnc for pickling, common scipy operations etc
 from gensim.models.word2vec import Word2Vec, Vocab, train_cbow_pair, train_sg_pair, train_sentence_sg
 from six.moves import xrange, zip
-from six import string_types, integer_types, itervalues
+from six import string_types, integer_types, itervalues, reraise
 
 logger = logging.getLogger(__name__)
 
@@ -284,8 +289,8 @@ class DocvecsArray(utils.SaveLoad):
 
     def note_doctag(self, key, document_no, document_length):
         """Note a document tag during initial corpus scan, for structure sizing."""
-        if isinstance(key, int):
-            self.count = max(self.count, key+1)
+        if isinstance(key, integer_types + (np_integer,)):
+            self.count = max(self.count, int(key) + 1)
         else:
             if key in self.doctags:
                 self.doctags[key] = self.doctags[key].repeat(document_length)
@@ -306,7 +311,7 @@ class DocvecsArray(utils.SaveLoad):
 
     def _int_index(self, index, missing=None):
         """Return int index for either string or int index"""
-        if isinstance(index, int):
+        if isinstance(index, integer_types + (np_integer,)):
             return index
         else:
             return self.doctags[index].index if index in self.doctags else missing
@@ -328,7 +333,7 @@ class DocvecsArray(utils.SaveLoad):
         If a list, return designated tags' vector representations as a
         2D numpy array: #tags x #vector_size.
         """
-        if isinstance(index, string_types + (int,)):
+        if isinstance(index, string_types + integer_types + (np_integer,)):
             return self.doctag_syn0[self._int_index(index)]
 
         return vstack([self[i] for i in index])
@@ -337,7 +342,7 @@ class DocvecsArray(utils.SaveLoad):
         return self.count
 
     def __contains__(self, index):
-        if isinstance(index, int):
+        if isinstance(index, integer_types + (np_integer,)):
             return index < self.count
         else:
             return index in self.doctags
@@ -371,7 +376,7 @@ class DocvecsArray(utils.SaveLoad):
             seed = "%d %s" % (model.seed, self.index2doctag[i] if len(self.index2doctag) > 0 else str(i))
             self.doctag_syn0[i] = model.seeded_vector(seed)
 
-    def init_sims(self, replace=False):
+    def init_sims(self, replace=False, blocksize=65536, workers=1):
         """
         Precompute L2-normalized vectors.
 
@@ -381,22 +386,22 @@ class DocvecsArray(utils.SaveLoad):
         Note that you **cannot continue training** after doing a replace. The model becomes
         effectively read-only = you can call `most_similar`, `similarity` etc., but not `train`.
 
+        The vectors are normalized `blocksize` rows at a time, by `workers` threads
+        (see `matutils.unitvec_rows`), into a memory-mapped file if `mapfile_path` is set.
+
         """
         if getattr(self, 'doctag_syn0norm', None) is None or replace:
             logger.info("precomputing L2-norms of doc weight vectors")
             if replace:
-                for i in xrange(self.doctag_syn0.shape[0]):
-                    self.doctag_syn0[i, :] /= sqrt((self.doctag_syn0[i, :] ** 2).sum(-1))
-                self.doctag_syn0norm = self.doctag_syn0
+                out = self.doctag_syn0
+            elif self.mapfile_path:
+                out = np_memmap(self.mapfile_path+'.doctag_syn0norm', dtype=REAL,
+                                mode='w+', shape=self.doctag_syn0.shape)
             else:
-                if self.mapfile_path:
-                    self.doctag_syn0norm = np_memmap(self.mapfile_path+'.doctag_syn0norm', dtype=REAL,
-                                                     mode='w+', shape=self.doctag_syn0.shape)
-                else:
-                    self.doctag_syn0norm = empty(self.doctag_syn0.shape, dtype=REAL)
-                np_divide(self.doctag_syn0, sqrt((self.doctag_syn0 ** 2).sum(-1))[..., newaxis], self.doctag_syn0norm)
+                out = empty(self.doctag_syn0.shape, dtype=REAL)
+            self.doctag_syn0norm = matutils.unitvec_rows(self.doctag_syn0, out=out, blocksize=blocksize, workers=workers)
 
-    def most_similar(self, positive=[], negative=[], topn=10, clip_start=0, clip_end=None):
+    def most_similar(self, positive=[], negative=[], topn=10, clip_start=0, clip_end=None, indexer=None):
         """
         Find the top-N most similar docvecs known from training. Positive docs contribute
         positively towards the similarity, negative docs negatively.
@@ -409,6 +414,10 @@ class DocvecsArray(utils.SaveLoad):
         The 'clip_start' and 'clip_end' allow limiting results to a particular contiguous
         range of the underlying doctag_syn0norm vectors. (This may be useful if the ordering
         there was chosen to be significant, such as more popular tag IDs in lower indexes.)
+
+        If `indexer` is given (e.g. a `gensim.similarities.index.RandomProjectionIndexer`
+        built over these docvecs), the most similar docs are looked up approximately
+        through the indexer. Clipping is then applied to the indexer's results.
         """
         self.init_sims()
         clip_end = clip_end or len(self.doctag_syn0norm)
@@ -437,13 +446,19 @@ class DocvecsArray(utils.SaveLoad):
             raise ValueError("cannot compute similarity with no input")
         mean = matutils.unitvec(array(mean).mean(axis=0)).astype(REAL)
 
+        if indexer is not None and topn:
+            best = indexer.most_similar(mean, topn + len(all_docs))
+            # ignore (don't return) docs from the input, or from outside of the clipped range
+            result = [(self._key_index(sim), dist) for sim, dist in best
+                      if sim not in all_docs and clip_start <= sim < clip_end]
+            return result[:topn]
+
         dists = dot(self.doctag_syn0norm[clip_start:clip_end], mean)
         if not topn:
             return dists
-        best = matutils.argsort(dists, topn=topn + len(all_docs), reverse=True)
         # ignore (don't return) docs from the input
-        result = [(self._key_index(sim), float(dists[sim])) for sim in best if sim not in all_docs]
-        return result[:topn]
+        best = topk.argtopk(dists, topn=topn, reverse=True, exclude=all_docs)
+        return [(self._key_index(sim), float(dists[sim])) for sim in best]
 
     def doesnt_match(self, docs):
         """
@@ -482,6 +497,257 @@ class DocvecsArray(utils.SaveLoad):
         return dot(matutils.unitvec(array(v1).mean(axis=0)), matutils.unitvec(array(v2).mean(axis=0)))
 
 
+class CompactDocvecsArray(DocvecsArray):
+    """
+    Storage of doc vectors like `DocvecsArray`, with a compact store of string document
+    tags, for corpora with very many (hundreds of millions of) tags.
+
+    Instead of a dict of `Doctag` objects and a list of tags, the tags are kept in a few
+    flat numpy arrays: the utf8-encoded tags concatenated together, their 64-bit hashes,
+    word and document counts, and an open-addressing hash table from tag to index. That's
+    about 50 bytes per tag on top of the tag itself, instead of several hundred bytes of
+    Python objects. The arrays are stored as separate files by `save()` (given a low enough
+    `sep_limit`), so the tags can be memory-mapped back by `load(fname, mmap='r')`.
+
+    The initial doc vectors are computed from the tag hashes and the model seed, many
+    vectors at a time, instead of by one `seeded_vector()` call per tag. They are just as
+    deterministic, but different from those of `DocvecsArray`.
+
+    `doctags` and `index2doctag` are read-only views, which support the same lookups
+    as the dict and list of `DocvecsArray`.
+
+    >>> model = Doc2Vec(documents, docvecs=CompactDocvecsArray())
+
+    """
+    def __init__(self, mapfile_path=None):
+        self.count = 0
+        self.mapfile_path = mapfile_path
+        self.num_tags = 0
+        self.tag_hashes = zeros(0, dtype=int64)  # tag index => 64-bit hash of the tag
+        self.tag_offsets = zeros(1, dtype=int64)  # tag index => start of the tag in `tag_bytes`
+        self.tag_bytes = zeros(0, dtype=uint8)  # all tags, utf8-encoded and concatenated
+        self.word_counts = zeros(0, dtype=int64)
+        self.doc_counts = zeros(0, dtype=int64)
+        self.tag_table = empty(8, dtype=int64)  # hash table slot => tag index, -1 for empty slots
+        self.tag_table.fill(-1)
+
+    @property
+    def doctags(self):
+        return _DoctagsView(self)
+
+    @property
+    def index2doctag(self):
+        return _Index2DoctagView(self)
+
+    @staticmethod
+    def tag_hash(tag_bytes):
+        """Return the (stable) 64-bit hash of a utf8-encoded tag, as a signed int."""
+        return struct.unpack('<q', hashlib.md5(tag_bytes).digest()[:8])[0]
+
+    def tag(self, index):
+        """Return the string tag of the tag with index `index`."""
+        return utils.to_unicode(self.tag_bytes[self.tag_offsets[index]: self.tag_offsets[index + 1]].tobytes())
+
+    def lookup(self, key):
+        """Return the index of string tag `key`, or -1 if there's no such tag."""
+        key_bytes = utils.to_utf8(key)
+        return self._lookup(key_bytes, self.tag_hash(key_bytes))[0]
+
+    def _lookup(self, key_bytes, key_hash):
+        # return the (index of the tag or -1, hash table slot of the tag or the empty slot to insert it into)
+        mask = len(self.tag_table) - 1
+        slot = key_hash & mask
+        while True:
+            index = self.tag_table[slot]
+            if index < 0:
+                return -1, slot
+            if self.tag_hashes[index] == key_hash and \
+                    self.tag_bytes[self.tag_offsets[index]: self.tag_offsets[index + 1]].tobytes() == key_bytes:
+                return index, slot
+            slot = (slot + 1) & mask
+
+    @staticmethod
+    def build_table(hashes, size):
+        """
+        Return a linear-probing hash table with `size` slots (a power of two) of the
+        (distinct) tags with `hashes`, inserting all tags at once.
+
+        """
+        table = empty(size, dtype=int64)
+        table.fill(-1)
+        pending = arange(len(hashes))
+        slots = hashes & (size - 1)
+        while len(pending):
+            # the first pending tag for each free slot takes it; all others move on to the next slot
+            free = flatnonzero(table[slots] == -1)
+            free_slots, first = np_unique(slots[free], return_index=True)
+            table[free_slots] = pending[free[first]]
+            moved = ones(len(pending), dtype=bool)
+            moved[free[first]] = False
+            pending, slots = pending[moved], (slots[moved] + 1) & (size - 1)
+        return table
+
+    def _reserve(self, num_tags, num_bytes):
+        # make room for `num_tags` tags in total, of `num_bytes` bytes in total, growing arrays geometrically;
+        # return True if the hash table had to be rebuilt
+        if num_tags < len(self.tag_offsets) and num_bytes <= len(self.tag_bytes) and 2 * num_tags <= len(self.tag_table):
+            return False  # fast path: enough room already
+        def grown(arr, length):
+            if len(arr) >= length:
+                return arr
+            result = zeros(max(length, 2 * len(arr)), dtype=arr.dtype)
+            result[:len(arr)] = arr
+            return result
+        self.tag_hashes = grown(self.tag_hashes, num_tags)
+        self.tag_offsets = grown(self.tag_offsets, num_tags + 1)
+        self.word_counts = grown(self.word_counts, num_tags)
+        self.doc_counts = grown(self.doc_counts, num_tags)
+        self.tag_bytes = grown(self.tag_bytes, num_bytes)
+        if 2 * num_tags <= len(self.tag_table):
+            return False
+        self.tag_table = self.build_table(self.tag_hashes[:self.num_tags], 2 * len(self.tag_table))
+        return True
+
+    def note_doctag(self, key, document_no, document_length):
+        """Note a document tag during initial corpus scan, for structure sizing."""
+        if isinstance(key, integer_types + (np_integer,)):
+            self.count = max(self.count, int(key) + 1)
+            return
+        key_bytes = utils.to_utf8(key)
+        key_hash = self.tag_hash(key_bytes)
+        index, slot = self._lookup(key_bytes, key_hash)
+        if index < 0:
+            start = self.tag_offsets[self.num_tags]
+            if self._reserve(self.num_tags + 1, start + len(key_bytes)):
+                index, slot = self._lookup(key_bytes, key_hash)  # the hash table was rebuilt
+            index = self.num_tags
+            self.tag_bytes[start: start + len(key_bytes)] = bytearray(key_bytes)
+            self.tag_offsets[index + 1] = start + len(key_bytes)
+            self.tag_hashes[index] = key_hash
+            self.tag_table[slot] = index
+            self.num_tags += 1
+            self.count = max(self.count, self.num_tags)
+        self.word_counts[index] += document_length
+        self.doc_counts[index] += 1
+
+    def _int_index(self, index, missing=None):
+        """Return int index for either string or int index"""
+        if isinstance(index, integer_types + (np_integer,)):
+            return index
+        index = self.lookup(index)
+        return missing if index < 0 else index
+
+    def __contains__(self, index):
+        if isinstance(index, integer_types + (np_integer,)):
+            return index < self.count
+        return self.lookup(index) >= 0
+
+    def borrow_from(self, other_docvecs):
+        for attr in ['count', 'num_tags', 'tag_hashes', 'tag_offsets', 'tag_bytes', 'word_counts', 'doc_counts', 'tag_table']:
+            setattr(self, attr, getattr(other_docvecs, attr))
+
+    def estimated_lookup_memory(self):
+        """Estimated memory for tag lookup; 0 if using pure int tags."""
+        return sum(arr.nbytes for arr in [self.tag_hashes, self.tag_offsets, self.tag_bytes,
+                                          self.word_counts, self.doc_counts, self.tag_table])
+
+    def reset_weights(self, model, chunksize=8192):
+        length = self.count
+        if self.mapfile_path:
+            self.doctag_syn0 = np_memmap(self.mapfile_path+'.doctag_syn0', dtype=REAL,
+                                         mode='w+', shape=(length, model.vector_size))
+            self.doctag_syn0_lockf = np_memmap(self.mapfile_path+'.doctag_syn0_lockf', dtype=REAL,
+                                               mode='w+', shape=(length,))
+            self.doctag_syn0_lockf.fill(1.0)
+        else:
+            self.doctag_syn0 = empty((length, model.vector_size), dtype=REAL)
+            self.doctag_syn0_lockf = ones((length,), dtype=REAL)  # zeros suppress learning
+
+        # the seed of each vector is the hash of its tag (its index, for plain int tags) AND the model seed
+        columns = arange(model.vector_size, dtype=uint64) + uint64(1)
+        for start in xrange(0, length, chunksize):
+            end = min(start + chunksize, length)
+            keys = arange(start, end, dtype=int64)
+            tagged = min(end, self.num_tags)
+            if start < tagged:
+                keys[:tagged - start] = self.tag_hashes[start: tagged]
+            self.doctag_syn0[start: end] = (self.uniform(keys.view(uint64), columns, model.seed) - 0.5) / model.vector_size
+
+    @staticmethod
+    def uniform(keys, columns, seed):
+        """
+        Return a `len(keys) x len(columns)` array of pseudo-random floats in [0, 1), each
+        a deterministic function of its key, column and `seed` (the SplitMix64 mixer).
+
+        """
+        x = keys[:, newaxis] * uint64(0x9e3779b97f4a7c15) + columns * uint64(0xd6e8feb86659fd93)
+        x += uint64(seed & 0xffffffffffffffff)
+        x ^= x >> uint64(30)
+        x *= uint64(0xbf58476d1ce4e5b9)
+        x ^= x >> uint64(27)
+        x *= uint64(0x94d049bb133111eb)
+        x ^= x >> uint64(31)
+        return (x >> uint64(11)) * (1.0 / (1 << 53))
+
+    def save(self, *args, **kwargs):
+        # don't store the unused, preallocated parts of the arrays
+        self.tag_hashes = self.tag_hashes[:self.num_tags].copy()
+        self.tag_offsets = self.tag_offsets[:self.num_tags + 1].copy()
+        self.tag_bytes = self.tag_bytes[:self.tag_offsets[-1]].copy()
+        self.word_counts = self.word_counts[:self.num_tags].copy()
+        self.doc_counts = self.doc_counts[:self.num_tags].copy()
+        super(CompactDocvecsArray, self).save(*args, **kwargs)
+
+
+class _DoctagsView(object):
+    """Read-only mapping of string tag -> Doctag over the arrays of a `CompactDocvecsArray`."""
+    def __init__(self, docvecs):
+        self.docvecs = docvecs
+
+    def __len__(self):
+        return self.docvecs.num_tags
+
+    def __contains__(self, key):
+        return isinstance(key, string_types) and self.docvecs.lookup(key) >= 0
+
+    def __getitem__(self, key):
+        index = self.docvecs.lookup(key) if isinstance(key, string_types) else -1
+        if index < 0:
+            raise KeyError(key)
+        return Doctag(int(index), int(self.docvecs.word_counts[index]), int(self.docvecs.doc_counts[index]))
+
+    def __iter__(self):
+        return (self.docvecs.tag(index) for index in xrange(len(self)))
+
+    def keys(self):
+        return list(self)
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+
+class _Index2DoctagView(object):
+    """Read-only sequence of string tags, by index, over the arrays of a `CompactDocvecsArray`."""
+    def __init__(self, docvecs):
+        self.docvecs = docvecs
+
+    def __len__(self):
+        return self.docvecs.num_tags
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("tag index %s out of range" % index)
+        return self.docvecs.tag(index)
+
+    def __iter__(self):
+        return (self.docvecs.tag(index) for index in xrange(len(self)))
+
+
 class Doctag(namedtuple('Doctag', 'index, word_count, doc_count')):
     """A string document tag discovered during the initial vocabulary
     scan. (The document-vector equivalent of a Vocab object.)
@@ -494,6 +760,26 @@ class Doctag(namedtuple('Doctag', 'index, word_count, doc_count')):
         return self._replace(word_count=self.word_count + word_count, doc_count=self.doc_count + 1)
 
 
+class _SeededModel(object):
+    """
+    View of a model with its own random generator, so that the training routines, which draw
+    from `model.random`, can run in several threads at once with reproducible results.
+
+    All other attributes are those of the underlying model.
+
+    """
+    def __init__(self, model):
+        self.model = model
+        self.random = random.RandomState(model.seed)
+
+    def __getattr__(self, name):
+        return getattr(self.model, name)
+
+    def reseed(self, seed_string):
+        """Reset the random generator, deterministically by `seed_string`."""
+        self.random.seed(self.model.hashfxn(seed_string) & 0xffffffff)
+
+
 class Doc2Vec(Word2Vec):
     """Class for training, using and evaluating neural networks described in http://arxiv.org/pdf/1405.4053v2.pdf"""
     def __init__(self, documents=None, size=300, alpha=0.025, window=8, min_count=5,
@@ -566,7 +852,7 @@ class Doc2Vec(Word2Vec):
             self.layer1_size = (self.dm_tag_count + (2 * self.window)) * self.vector_size
         else:
             self.layer1_size = size
-        self.docvecs = docvecs or DocvecsArray(docvecs_mapfile)
+        self.docvecs = docvecs if docvecs is not None else DocvecsArray(docvecs_mapfile)
         self.comment = comment
         if documents is not None:
             self.build_vocab(documents)
@@ -597,6 +883,21 @@ class Doc2Vec(Word2Vec):
         self.docvecs.borrow_from(other_model.docvecs)
         super(Doc2Vec, self).reset_from(other_model)
 
+    def build_vocab(self, documents, keep_raw_vocab=False, workers=1):
+        """
+        Build vocabulary from a sequence of documents (can be a once-only generator stream).
+
+        Unlike `Word2Vec.build_vocab`, documents can't be counted in parallel shards,
+        because plain int tags and tag offsets depend on the order of the documents.
+
+        """
+        if workers > 1:
+            raise ValueError("Doc2Vec can't count documents in parallel (tag offsets depend on document "
+                             "order); pass a single iterable of documents, without workers")
+        self.scan_vocab(documents)  # initial survey
+        self.scale_vocab(keep_raw_vocab)  # trim by min_count & precalculate downsampling
+        self.finalize_vocab()  # build tables & arrays
+
     def scan_vocab(self, documents, progress_per=10000):
         logger.info("collecting all words and their counts")
         document_no = -1
@@ -630,6 +931,9 @@ class Doc2Vec(Word2Vec):
         self.corpus_count = document_no + 1
         self.raw_vocab = vocab
 
+    def _prepare_job(self, items):
+        return items  # documents are trained on as they are (tags are looked up in `_do_train_job()`)
+
     def _do_train_job(self, job, alpha, inits):
         work, neu1 = inits
         tally = 0
@@ -662,29 +966,112 @@ class Doc2Vec(Word2Vec):
         """
         doctag_vectors = empty((1, self.vector_size), dtype=REAL)
         doctag_vectors[0] = self.seeded_vector(' '.join(doc_words))
+        work = zeros(self.layer1_size, dtype=REAL)
+        neu1 = None if self.sg else matutils.zeros_aligned(self.layer1_size, dtype=REAL)
+        self._infer_document(self, doc_words, doctag_vectors, work, neu1, alpha, min_alpha, steps)
+        return doctag_vectors[0]
+
+    def _infer_document(self, model, doc_words, doctag_vectors, work, neu1, alpha, min_alpha, steps):
+        """
+        Train the (initialized) vector `doctag_vectors[0]` of `doc_words`, with the training
+        kernels called on `model` (`self`, or a `_SeededModel` view of it) and buffers `work`, `neu1`.
+
+        """
         doctag_locks = ones(1, dtype=REAL)
         doctag_indexes = [0]
 
-        work = zeros(self.layer1_size, dtype=REAL)
-        if not self.sg:
-            neu1 = matutils.zeros_aligned(self.layer1_size, dtype=REAL)
-
         for i in range(steps):
             if self.sg:
-                train_document_dbow(self, doc_words, doctag_indexes, alpha, work,
+                train_document_dbow(model, doc_words, doctag_indexes, alpha, work,
                                     learn_words=False, learn_hidden=False,
                                     doctag_vectors=doctag_vectors, doctag_locks=doctag_locks)
             elif self.dm_concat:
-                train_document_dm_concat(self, doc_words, doctag_indexes, alpha, work, neu1,
+                train_document_dm_concat(model, doc_words, doctag_indexes, alpha, work, neu1,
                                          learn_words=False, learn_hidden=False,
                                          doctag_vectors=doctag_vectors, doctag_locks=doctag_locks)
             else:
-                train_document_dm(self, doc_words, doctag_indexes, alpha, work, neu1,
+                train_document_dm(model, doc_words, doctag_indexes, alpha, work, neu1,
                                   learn_words=False, learn_hidden=False,
                                   doctag_vectors=doctag_vectors, doctag_locks=doctag_locks)
             alpha = ((alpha - min_alpha) / (steps - i)) + min_alpha
 
-        return doctag_vectors[0]
+    def infer_vectors(self, documents, alpha=0.1, min_alpha=0.0001, steps=5, out=None, workers=None, chunksize=100):
+        """
+        Infer vectors for many post-bulk training documents at once, the bulk equivalent
+        of calling `infer_vector` on each of them.
+
+        `documents` is an iterable of documents, each a list of (word) tokens. Store the
+        vector of the i-th document into the i-th row of `out` (a 2d array with `vector_size`
+        columns and at least as many rows as there are documents, for example a `numpy.memmap`),
+        and return `out`. If `out` isn't given, return a new array, with one row per document.
+
+        Documents are processed in jobs of `chunksize` documents, by `workers` threads (default:
+        the `workers` of the model), which reuse their work buffers. The optimized training
+        routines release the GIL, so the threads run in parallel.
+
+        Unlike `infer_vector`, which draws from the shared random generator of the model,
+        each document is inferred with its own random generator, seeded from the document
+        words (which also give the initial vector, as in `infer_vector`). So the result for
+        a given document doesn't depend on the number of threads, nor on the other documents.
+
+        """
+        if out is None:
+            if not hasattr(documents, '__len__'):
+                documents = list(documents)
+            out = empty((len(documents), self.vector_size), dtype=REAL)
+        if workers is None:
+            workers = self.workers
+        workers = max(1, workers)
+
+        def worker_loop():
+            """Infer vectors of the documents of each job, until the end-of-jobs marker."""
+            model = _SeededModel(self)
+            doctag_vectors = empty((1, self.vector_size), dtype=REAL)
+            work = zeros(self.layer1_size, dtype=REAL)
+            neu1 = None if self.sg else matutils.zeros_aligned(self.layer1_size, dtype=REAL)
+            while True:
+                job = job_queue.get()
+                if job is None:
+                    break
+                if errors:
+                    continue  # a worker failed; keep draining, so the producer never blocks
+                start, job_documents = job
+                try:
+                    for docno, doc_words in enumerate(job_documents, start=start):
+                        # same initial vector as `seeded_vector`, without creating a new generator
+                        model.reseed(' '.join(doc_words))
+                        doctag_vectors[0] = (model.random.rand(self.vector_size) - 0.5) / self.vector_size
+                        self._infer_document(model, doc_words, doctag_vectors, work, neu1, alpha, min_alpha, steps)
+                        out[docno] = doctag_vectors[0]
+                except Exception:
+                    errors.append(sys.exc_info())
+
+        errors = []  # exc_info of failed jobs, re-raised in the calling thread
+        job_queue = Queue(maxsize=2 * workers)
+        threads = [threading.Thread(target=worker_loop) for _ in xrange(workers)]
+        for thread in threads:
+            thread.daemon = True  # make interrupting the process with ctrl+c easier
+            thread.start()
+
+        num_docs = 0
+        try:
+            for job_documents in utils.grouper(documents, chunksize):
+                if errors:
+                    break  # no point in queueing more work
+                job_documents = [list(doc_words) for doc_words in job_documents]
+                if num_docs + len(job_documents) > len(out):
+                    raise ValueError("more documents than rows in out (%i)" % len(out))
+                job_queue.put((num_docs, job_documents))
+                num_docs += len(job_documents)
+        finally:
+            for _ in threads:
+                job_queue.put(None)  # give the workers heads up that they can finish -- no more work!
+            for thread in threads:
+                thread.join()
+        if errors:
+            reraise(*errors[0])
+        logger.info("inferred vectors of %i documents with %i workers", num_docs, workers)
+        return out
 
     def estimate_memory(self, vocab_size=None, report=None):
         """Estimate required memory for a model using current settings."""
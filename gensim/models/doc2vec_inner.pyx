@@ -255,6 +255,13 @@ def train_document_dbow(model, doc_words, doctag_indexes, alpha, work=None,
     cdef unsigned long long r
     cdef long result = 0
 
+    # vocabulary arrays (see CompactVocab)
+    cdef np.int64_t *sample_ints
+    cdef np.int64_t *code_offsets
+    cdef np.uint8_t *vocab_codes
+    cdef np.uint32_t *vocab_points
+    cdef long long word_index
+
     # For hierarchical softmax
     cdef REAL_t *syn1
     cdef np.uint32_t *points[MAX_DOCUMENT_LEN]
@@ -295,19 +302,24 @@ def train_document_dbow(model, doc_words, doctag_indexes, alpha, work=None,
        work = zeros(model.layer1_size, dtype=REAL)
     _work = <REAL_t *>np.PyArray_DATA(work)
 
-    vlookup = model.vocab
+    vlookup = model.vocab.word2index
+    sample_ints = <np.int64_t *>(np.PyArray_DATA(model.vocab.sample_ints))
+    code_offsets = <np.int64_t *>(np.PyArray_DATA(model.vocab.code_offsets))
+    vocab_codes = <np.uint8_t *>(np.PyArray_DATA(model.vocab.codes))
+    vocab_points = <np.uint32_t *>(np.PyArray_DATA(model.vocab.points))
     i = 0
     for token in doc_words:
-        predict_word = vlookup[token] if token in vlookup else None
+        predict_word = vlookup.get(token)
         if predict_word is None:  # shrink document to leave out word
             continue  # leaving i unchanged
-        if sample and predict_word.sample_int < random_int32(&next_random):
+        word_index = predict_word
+        if sample and sample_ints[word_index] < random_int32(&next_random):
             continue
-        indexes[i] = predict_word.index
+        indexes[i] = word_index
         if hs:
-            codelens[i] = <int>len(predict_word.code)
-            codes[i] = <np.uint8_t *>np.PyArray_DATA(predict_word.code)
-            points[i] = <np.uint32_t *>np.PyArray_DATA(predict_word.point)
+            codelens[i] = <int>(code_offsets[word_index + 1] - code_offsets[word_index])
+            codes[i] = vocab_codes + code_offsets[word_index]
+            points[i] = vocab_points + code_offsets[word_index]
         result += 1
         i += 1
         if i == MAX_DOCUMENT_LEN:
@@ -392,6 +404,13 @@ def train_document_dm(model, doc_words, doctag_indexes, alpha, work=None, neu1=N
     cdef int i, j, k, m
     cdef long result = 0
 
+    # vocabulary arrays (see CompactVocab)
+    cdef np.int64_t *sample_ints
+    cdef np.int64_t *code_offsets
+    cdef np.uint8_t *vocab_codes
+    cdef np.uint32_t *vocab_points
+    cdef long long word_index
+
     # For hierarchical softmax
     cdef REAL_t *syn1
     cdef np.uint32_t *points[MAX_DOCUMENT_LEN]
@@ -435,19 +454,24 @@ def train_document_dm(model, doc_words, doctag_indexes, alpha, work=None, neu1=N
        neu1 = zeros(model.layer1_size, dtype=REAL)
     _neu1 = <REAL_t *>np.PyArray_DATA(neu1)
 
-    vlookup = model.vocab
+    vlookup = model.vocab.word2index
+    sample_ints = <np.int64_t *>(np.PyArray_DATA(model.vocab.sample_ints))
+    code_offsets = <np.int64_t *>(np.PyArray_DATA(model.vocab.code_offsets))
+    vocab_codes = <np.uint8_t *>(np.PyArray_DATA(model.vocab.codes))
+    vocab_points = <np.uint32_t *>(np.PyArray_DATA(model.vocab.points))
     i = 0
     for token in doc_words:
-        predict_word = vlookup[token] if token in vlookup else None
+        predict_word = vlookup.get(token)
         if predict_word is None:  # shrink document to leave out word
             continue  # leaving i unchanged
-        if sample and predict_word.sample_int < random_int32(&next_random):
+        word_index = predict_word
+        if sample and sample_ints[word_index] < random_int32(&next_random):
             continue
-        indexes[i] = predict_word.index
+        indexes[i] = word_index
         if hs:
-            codelens[i] = <int>len(predict_word.code)
-            codes[i] = <np.uint8_t *>np.PyArray_DATA(predict_word.code)
-            points[i] = <np.uint32_t *>np.PyArray_DATA(predict_word.point)
+            codelens[i] = <int>(code_offsets[word_index + 1] - code_offsets[word_index])
+            codes[i] = vocab_codes + code_offsets[word_index]
+            points[i] = vocab_points + code_offsets[word_index]
         result += 1
         i += 1
         if i == MAX_DOCUMENT_LEN:
@@ -548,7 +572,14 @@ def train_document_dm_concat(model, doc_words, doctag_indexes, alpha, work=None,
 
     cdef int i, j, k, m, n
     cdef long result = 0
-    cdef int null_word_index = model.vocab['\0'].index
+
+    # vocabulary arrays (see CompactVocab)
+    cdef np.int64_t *sample_ints
+    cdef np.int64_t *code_offsets
+    cdef np.uint8_t *vocab_codes
+    cdef np.uint32_t *vocab_points
+    cdef long long word_index
+    cdef int null_word_index = model.vocab.word2index['\0']
 
     # For hierarchical softmax
     cdef REAL_t *syn1
@@ -597,19 +628,24 @@ def train_document_dm_concat(model, doc_words, doctag_indexes, alpha, work=None,
        neu1 = zeros(model.layer1_size, dtype=REAL)
     _neu1 = <REAL_t *>np.PyArray_DATA(neu1)
 
-    vlookup = model.vocab
+    vlookup = model.vocab.word2index
+    sample_ints = <np.int64_t *>(np.PyArray_DATA(model.vocab.sample_ints))
+    code_offsets = <np.int64_t *>(np.PyArray_DATA(model.vocab.code_offsets))
+    vocab_codes = <np.uint8_t *>(np.PyArray_DATA(model.vocab.codes))
+    vocab_points = <np.uint32_t *>(np.PyArray_DATA(model.vocab.points))
     i = 0
     for token in doc_words:
-        predict_word = vlookup[token] if token in vlookup else None
+        predict_word = vlookup.get(token)
         if predict_word is None:  # shrink document to leave out word
             continue  # leaving i unchanged
-        if sample and predict_word.sample_int < random_int32(&next_random):
+        word_index = predict_word
+        if sample and sample_ints[word_index] < random_int32(&next_random):
             continue
-        indexes[i] = predict_word.index
+        indexes[i] = word_index
         if hs:
-            codelens[i] = <int>len(predict_word.code)
-            codes[i] = <np.uint8_t *>np.PyArray_DATA(predict_word.code)
-            points[i] = <np.uint32_t *>np.PyArray_DATA(predict_word.point)
+            codelens[i] = <int>(code_offsets[word_index + 1] - code_offsets[word_index])
+            codes[i] = vocab_codes + code_offsets[word_index]
+            points[i] = vocab_points + code_offsets[word_index]
         result += 1
         i += 1
         if i == MAX_DOCUMENT_LEN:
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+This module contains a read-only store of trained word vectors, for serving
+similarity queries.
+
+Loading a full `Word2Vec` model unpickles its vocabulary (a Python object per
+word) before the first query can be answered, and every process that loads the
+model keeps its own copy of those objects. `KeyedVectors` keeps everything in
+flat numpy arrays instead, each stored in its own `.npy` file:
+
+* the utf8-encoded words, concatenated into a single byte array, plus the offset
+  of each word in it;
+* the sorted 64-bit hashes of the words, plus the index of the word of each hash,
+  for looking up words by binary search;
+* the L2-normalized word vectors (`syn0norm`), and the word counts.
+
+`load()` memory-maps all of these, so startup takes milliseconds regardless of
+the vocabulary size, and the pages are shared by all processes that load the
+same files (e.g. forked server workers):
+
+>>> KeyedVectors(model).save('/tmp/vectors')  # once, from a trained model
+>>> vectors = KeyedVectors.load('/tmp/vectors')  # in each server process
+>>> vectors.most_similar(positive=['woman', 'king'], negative=['man'])
+>>> vectors['king']  # the normalized vector of 'king'
+
+The query methods (`most_similar`, `most_similar_cosmul`, `similarity`,
+`n_similarity`, `doesnt_match`, `accuracy`, `[]`...) are those of `Word2Vec`.
+Note that all vectors are normalized, so `vectors['king']` returns the same as
+`model.syn0norm[model.vocab['king'].index]`, like a model loaded by
+`Word2Vec.load_word2vec_format(norm_only=True)`.
+
+"""
+
+
+import hashlib
+import logging
+import struct
+
+from numpy import array, concatenate, cumsum, zeros, frombuffer, fromiter, int64, uint8
+
+from gensim import utils
+from gensim.models.word2vec import Word2Vec, Vocab
+from six import get_unbound_function, string_types
+from six.moves import xrange
+
+
+logger = logging.getLogger('gensim.models.keyedvectors')
+
+
+def word_hash(word_bytes):
+    """Return the (stable) 64-bit hash of a utf8-encoded word, as a signed int."""
+    return struct.unpack('<q', hashlib.md5(word_bytes).digest()[:8])[0]
+
+
+class KeyedVectors(utils.SaveLoad):
+    """
+    Read-only, memory-mappable mapping of word -> normalized vector (see the module docstring).
+
+    Words are numbered by their index in the original model, so the most frequent
+    words come first.
+
+    """
+    ARRAYS = ['word_bytes', 'word_offsets', 'hashes', 'hash_indexes', 'counts', 'syn0norm']
+
+    def __init__(self, model=None):
+        """
+        If given, copy the words and normalized vectors of `model` (a trained `Word2Vec`
+        or `Doc2Vec` model). Use `load()` to open stored vectors instead.
+
+        """
+        self.vector_size = 0
+        self.word_bytes = zeros(0, dtype=uint8)
+        self.word_offsets = zeros(1, dtype=int64)
+        self.hashes = zeros(0, dtype=int64)
+        self.hash_indexes = zeros(0, dtype=int64)
+        self.counts = zeros(0, dtype=int64)
+        self.syn0norm = zeros((0, 0))
+        if model is not None:
+            self.add_model(model)
+
+    def add_model(self, model):
+        """Replace the contents of this object by the words and normalized vectors of `model`."""
+        model.init_sims()
+        encoded = [utils.to_utf8(word) for word in model.index2word]
+        num_words = len(encoded)
+        logger.info("hashing %i words", num_words)
+        self.vector_size = model.syn0norm.shape[1]
+        self.word_bytes = frombuffer(b''.join(encoded), dtype=uint8).copy()
+        self.word_offsets = concatenate([zeros(1, dtype=int64), cumsum([len(word) for word in encoded], dtype=int64)])
+        hashes = fromiter((word_hash(word) for word in encoded), dtype=int64, count=num_words)
+        self.hash_indexes = hashes.argsort(kind='mergesort').astype(int64)
+        self.hashes = hashes[self.hash_indexes]
+        self.counts = array([model.vocab[word].count for word in model.index2word], dtype=int64)
+        self.syn0norm = model.syn0norm
+
+    def __str__(self):
+        return "%s<%i words, %i dimensions>" % (self.__class__.__name__, len(self), self.vector_size)
+
+    def __len__(self):
+        return len(self.word_offsets) - 1
+
+    def word(self, index):
+        """Return the word with index `index`."""
+        return utils.to_unicode(self.word_bytes[self.word_offsets[index]: self.word_offsets[index + 1]].tobytes())
+
+    def lookup(self, word):
+        """Return the index of `word`, or -1 if it's not in the vocabulary."""
+        word_bytes = utils.to_utf8(word)
+        key = word_hash(word_bytes)
+        pos = int(self.hashes.searchsorted(key))
+        while pos < len(self.hashes) and self.hashes[pos] == key:  # distinct words may (rarely) share a hash
+            index = int(self.hash_indexes[pos])
+            if self.word_bytes[self.word_offsets[index]: self.word_offsets[index + 1]].tobytes() == word_bytes:
+                return index
+            pos += 1
+        return -1
+
+    @property
+    def vocab(self):
+        """Mapping of word -> Vocab object with its `index` and `count`, created on access."""
+        return _KeyedVocabView(self)
+
+    @property
+    def index2word(self):
+        """Sequence of all words, by index."""
+        return _Index2WordView(self)
+
+    @property
+    def syn0(self):
+        return self.syn0norm  # only the normalized vectors are stored
+
+    def init_sims(self, replace=False):
+        pass  # the stored vectors are already normalized
+
+    # query methods of Word2Vec: they only use `vocab`, `index2word`, `syn0(norm)` and `init_sims()`
+    most_similar = get_unbound_function(Word2Vec.most_similar)
+    _query_vector = get_unbound_function(Word2Vec._query_vector)
+    _most_similar_rows = staticmethod(Word2Vec._most_similar_rows)
+    most_similar_batch = get_unbound_function(Word2Vec.most_similar_batch)
+    most_similar_cosmul = get_unbound_function(Word2Vec.most_similar_cosmul)
+    doesnt_match = get_unbound_function(Word2Vec.doesnt_match)
+    __getitem__ = get_unbound_function(Word2Vec.__getitem__)
+    __contains__ = get_unbound_function(Word2Vec.__contains__)
+    similarity = get_unbound_function(Word2Vec.similarity)
+    n_similarity = get_unbound_function(Word2Vec.n_similarity)
+    log_accuracy = staticmethod(Word2Vec.log_accuracy)
+    accuracy = get_unbound_function(Word2Vec.accuracy)
+
+    def save(self, fname_or_handle, **kwargs):
+        """
+        Save the vectors under `fname_or_handle`; all arrays are always stored in
+        separate `.npy` files next to it, so that `load()` can memory-map them.
+
+        """
+        kwargs['separately'] = list(self.ARRAYS)
+        super(KeyedVectors, self).save(fname_or_handle, **kwargs)
+
+    @classmethod
+    def load(cls, fname, mmap='r'):
+        """
+        Load stored vectors; by default, all arrays are memory-mapped read-only.
+        Use `mmap=None` to read them into RAM instead.
+
+        """
+        return super(KeyedVectors, cls).load(fname, mmap=mmap)
+#endclass KeyedVectors
+
+
+class _KeyedVocabView(object):
+    """Read-only mapping of word -> Vocab(index, count) over the arrays of a `KeyedVectors`."""
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def __contains__(self, word):
+        return isinstance(word, string_types + (bytes,)) and self.vectors.lookup(word) >= 0
+
+    def __getitem__(self, word):
+        index = self.vectors.lookup(word)
+        if index < 0:
+            raise KeyError(word)
+        return Vocab(index=index, count=int(self.vectors.counts[index]))
+
+    def __iter__(self):
+        return (self.vectors.word(index) for index in xrange(len(self.vectors)))
+
+    def get(self, word, default=None):
+        return self[word] if word in self else default
+
+    def iteritems(self):
+        for index, count in enumerate(self.vectors.counts.tolist()):
+            yield self.vectors.word(index), Vocab(index=index, count=count)
+
+    def itervalues(self):
+        for index, count in enumerate(self.vectors.counts.tolist()):
+            yield Vocab(index=index, count=count)
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return list(self.iteritems())
+
+    def values(self):
+        return list(self.itervalues())
+
+
+class _Index2WordView(object):
+    """Read-only sequence of the words of a `KeyedVectors`."""
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.vectors.word(i) for i in xrange(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index %i out of range" % index)
+        return self.vectors.word(index)
+
+    def __iter__(self):
+        return (self.vectors.word(index) for index in xrange(len(self.vectors)))
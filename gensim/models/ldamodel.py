@@ -34,7 +34,10 @@ The algorithm:
 
 
 import logging
+import sys
+import threading
 import numpy  # for arrays, array broadcasting etc.
+import scipy.sparse
 
 from gensim import interfaces, utils, matutils
 from itertools import chain
@@ -67,6 +70,60 @@ def dirichlet_expectation(alpha):
     return result.astype(alpha.dtype)  # keep the same precision as input
 
 
+try:
+    from gensim.models.ldamodel_inner import inference_docs, FAST_VERSION
+except ImportError:
+    # failed... fall back to plain numpy (the E-step holds the GIL, so threads don't help)
+    FAST_VERSION = -1
+
+    def inference_docs(model, indptr, indices, data, gamma, expElogtheta, ratio, start, end):
+        """
+        Run the gamma/phi fixed-point iterations for documents `start` .. `end - 1`
+        of a chunk, given as the `indptr`, `indices` and `data` arrays of a csc matrix.
+
+        `gamma` holds the initial gamma on input and is updated in place. On output,
+        `expElogtheta` holds exp(E[log theta]) of each document and `ratio` holds
+        the word counts divided by the normalizer of phi, for the sufficient statistics.
+
+        Return the number of documents whose gamma converged.
+
+        This is the non-optimized, Python version. If you have cython installed, gensim
+        will use the optimized version from ldamodel_inner instead.
+
+        """
+        converged = 0
+        for d in xrange(start, end):
+            ids, cts = indices[indptr[d]:indptr[d + 1]], data[indptr[d]:indptr[d + 1]]
+            gammad = gamma[d, :]
+            expElogthetad = numpy.exp(dirichlet_expectation(gammad))
+            expElogbetad = model.expElogbeta[:, ids]
+
+            # The optimal phi_{dwk} is proportional to expElogthetad_k * expElogbetad_w.
+            # phinorm is the normalizer.
+            # TODO treat zeros explicitly, instead of adding 1e-100?
+            phinorm = numpy.dot(expElogthetad, expElogbetad) + 1e-100
+
+            # Iterate between gamma and phi until convergence
+            for _ in xrange(model.iterations):
+                lastgamma = gammad
+                # We represent phi implicitly to save memory and time.
+                # Substituting the value of the optimal phi back into
+                # the update for gamma gives this update. Cf. Lee&Seung 2001.
+                gammad = model.alpha + expElogthetad * numpy.dot(cts / phinorm, expElogbetad.T)
+                Elogthetad = dirichlet_expectation(gammad)
+                expElogthetad = numpy.exp(Elogthetad)
+                phinorm = numpy.dot(expElogthetad, expElogbetad) + 1e-100
+                # If gamma hasn't changed much, we're done.
+                meanchange = numpy.mean(abs(gammad - lastgamma))
+                if (meanchange < model.gamma_threshold):
+                    converged += 1
+                    break
+            gamma[d, :] = gammad
+            expElogtheta[d, :] = expElogthetad
+            ratio[indptr[d]:indptr[d + 1]] = cts / phinorm
+        return converged
+
+
 class LdaState(utils.SaveLoad):
     """
     Encapsulate information for distributed computation of LdaModel objects.
@@ -178,7 +235,7 @@ class LdaModel(interfaces.TransformationABC):
                  distributed=False, chunksize=2000, passes=1, update_every=1,
                  alpha='symmetric', eta=None, decay=0.5, offset=1.0,
                  eval_every=10, iterations=50, gamma_threshold=0.001,
-                 minimum_probability=0.01):
+                 minimum_probability=0.01, vectorized=False, threads=1):
         """
         If given, start training from the iterable `corpus` straight away. If not given,
         the model is left untrained (presumably because you want to call `update()` manually).
@@ -218,6 +275,18 @@ class LdaModel(interfaces.TransformationABC):
 
         `minimum_probability` controls filtering the topics returned for a document (bow).
 
+        Set `vectorized` to True to run the E-step over a whole chunk at once, using
+        sparse matrix operations, instead of looping over its documents one by one
+        (see `inference_chunk()`). This is much faster for collections of many short
+        documents (tweets, queries, titles), where the per-document Python overhead
+        dominates. Both engines produce the same results, up to floating point
+        differences.
+
+        `threads` is the number of threads to split each chunk's E-step across, inside
+        this process, all sharing the same topic-word matrix. This only helps if the
+        optimized C extension `ldamodel_inner` is installed (it releases the GIL); see
+        `FAST_VERSION`.
+
         Example:
 
         >>> lda = LdaModel(corpus, num_topics=100)  # train model
@@ -282,6 +351,11 @@ class LdaModel(interfaces.TransformationABC):
         # VB constants
         self.iterations = iterations
         self.gamma_threshold = gamma_threshold
+        self.vectorized = vectorized
+        self.threads = int(threads)
+        if self.threads > 1 and FAST_VERSION < 0:
+            logger.warning("C extension not loaded for LDA, the E-step will not run in parallel threads; "
+                           "install a C compiler and reinstall gensim for fast inference.")
 
         # set up distributed environment if necessary
         if not distributed:
@@ -297,7 +371,8 @@ class LdaModel(interfaces.TransformationABC):
                 dispatcher = Pyro4.Proxy('PYRONAME:gensim.lda_dispatcher')
                 logger.debug("looking for dispatcher at %s" % str(dispatcher._pyroUri))
                 dispatcher.initialize(id2word=self.id2word, num_topics=num_topics,
-                                      chunksize=chunksize, alpha=alpha, eta=eta, distributed=False)
+                                      chunksize=chunksize, alpha=alpha, eta=eta, distributed=False,
+                                      vectorized=vectorized, threads=threads)
                 self.dispatcher = dispatcher
                 self.numworkers = len(dispatcher.getworkers())
                 logger.info("using distributed version with %i workers" % self.numworkers)
@@ -343,73 +418,181 @@ class LdaModel(interfaces.TransformationABC):
         Avoids computing the `phi` variational parameter directly using the
         optimization presented in **Lee, Seung: Algorithms for non-negative matrix factorization, NIPS 2001**.
 
+        The chunk can also be a scipy.sparse matrix with documents as columns
+        (such as a block from `corpus.iter_chunks()`).
+
+        If the model was created with `vectorized=True`, the work is delegated
+        to `inference_chunk()`. Otherwise, the documents are processed by
+        `inference_docs()`, in `self.threads` parallel threads.
+
         """
-        try:
-            _ = len(chunk)
-        except:
-            # convert iterators/generators to plain list, so we have len() etc.
-            chunk = list(chunk)
-        if len(chunk) > 1:
-            logger.debug("performing inference on a chunk of %i documents", len(chunk))
+        if getattr(self, 'vectorized', False):
+            return self.inference_chunk(chunk, collect_sstats=collect_sstats)
 
-        # Initialize the variational distribution q(theta|gamma) for the chunk
-        gamma = numpy.random.gamma(100., 1. / 100., (len(chunk), self.num_topics))
-        Elogtheta = dirichlet_expectation(gamma)
-        expElogtheta = numpy.exp(Elogtheta)
-        if collect_sstats:
-            sstats = numpy.zeros_like(self.expElogbeta)
+        if scipy.sparse.issparse(chunk):
+            # take word ids and counts straight from the sparse matrix arrays
+            chunk = chunk.tocsc()
         else:
-            sstats = None
-        converged = 0
+            try:
+                _ = len(chunk)
+            except:
+                # convert iterators/generators to plain list, so we have len() etc.
+                chunk = list(chunk)
+            chunk = matutils.corpus2csc(chunk, num_terms=self.num_terms)
+        num_docs = chunk.shape[1]
+        if num_docs > 1:
+            logger.debug("performing inference on a chunk of %i documents", num_docs)
+        indptr = numpy.asarray(chunk.indptr, dtype=numpy.intp)
+        indices = numpy.asarray(chunk.indices, dtype=numpy.intp)
+        data = numpy.asarray(chunk.data, dtype=numpy.float64)
+        if len(indices) and indices.max() >= self.num_terms:
+            raise IndexError("word id %i out of range for a model of %i terms" % (indices.max(), self.num_terms))
+
+        # Initialize the variational distribution q(theta|gamma) for the chunk
+        gamma = numpy.random.gamma(100., 1. / 100., (num_docs, self.num_topics))
+        expElogtheta = numpy.empty_like(gamma)
+        ratio = numpy.empty_like(data)
 
         # Now, for each document d update that document's gamma and phi
         # Inference code copied from Hoffman's `onlineldavb.py` (esp. the
         # Lee&Seung trick which speeds things up by an order of magnitude, compared
         # to Blei's original LDA-C code, cool!).
-        for d, doc in enumerate(chunk):
-            ids = [id for id, _ in doc]
-            cts = numpy.array([cnt for _, cnt in doc])
-            gammad = gamma[d, :]
-            Elogthetad = Elogtheta[d, :]
-            expElogthetad = expElogtheta[d, :]
-            expElogbetad = self.expElogbeta[:, ids]
+        threads = max(1, min(getattr(self, 'threads', 1), num_docs))
+        if threads == 1:
+            converged = inference_docs(self, indptr, indices, data, gamma, expElogtheta, ratio, 0, num_docs)
+        else:
+            # split the chunk into ranges of roughly the same number of non-zeros, one per thread
+            bounds = numpy.searchsorted(indptr, numpy.linspace(0, indptr[-1], threads + 1))
+            bounds[0], bounds[-1] = 0, num_docs
+            results = [0] * threads
+            errors = []  # exc_info of failed threads, re-raised below
+
+            def worker(threadno):
+                try:
+                    results[threadno] = inference_docs(
+                        self, indptr, indices, data, gamma, expElogtheta, ratio,
+                        bounds[threadno], bounds[threadno + 1])
+                except Exception:
+                    errors.append(sys.exc_info())
+
+            workers = [threading.Thread(target=worker, args=(threadno,)) for threadno in xrange(threads)]
+            for thread in workers:
+                thread.daemon = True
+                thread.start()
+            for thread in workers:
+                thread.join()
+            if errors:
+                six.reraise(*errors[0])
+            converged = sum(results)
+
+        if num_docs > 1:
+            logger.debug("%i/%i documents converged within %i iterations",
+                         converged, num_docs, self.iterations)
 
-            # The optimal phi_{dwk} is proportional to expElogthetad_k * expElogbetad_w.
-            # phinorm is the normalizer.
-            # TODO treat zeros explicitly, instead of adding 1e-100?
-            phinorm = numpy.dot(expElogthetad, expElogbetad) + 1e-100
+        if collect_sstats:
+            # Contribution of all documents to the expected sufficient statistics
+            # for the M step, so that
+            # sstats[k, w] = \sum_d n_{dw} * phi_{dwk}
+            # = \sum_d n_{dw} * exp{Elogtheta_{dk} + Elogbeta_{kw}} / phinorm_{dw}.
+            ratio = scipy.sparse.csc_matrix((ratio, indices, indptr), shape=(self.num_terms, num_docs))
+            sstats = ratio.dot(expElogtheta).T * self.expElogbeta
+        else:
+            sstats = None
+        return gamma, sstats
 
-            # Iterate between gamma and phi until convergence
-            for _ in xrange(self.iterations):
-                lastgamma = gammad
-                # We represent phi implicitly to save memory and time.
-                # Substituting the value of the optimal phi back into
-                # the update for gamma gives this update. Cf. Lee&Seung 2001.
-                gammad = self.alpha + expElogthetad * numpy.dot(cts / phinorm, expElogbetad.T)
-                Elogthetad = dirichlet_expectation(gammad)
-                expElogthetad = numpy.exp(Elogthetad)
-                phinorm = numpy.dot(expElogthetad, expElogbetad) + 1e-100
-                # If gamma hasn't changed much, we're done.
-                meanchange = numpy.mean(abs(gammad - lastgamma))
-                if (meanchange < self.gamma_threshold):
-                    converged += 1
-                    break
-            gamma[d, :] = gammad
-            if collect_sstats:
-                # Contribution of document d to the expected sufficient
-                # statistics for the M step.
-                sstats[:, ids] += numpy.outer(expElogthetad.T, cts / phinorm)
+    def inference_chunk(self, chunk, collect_sstats=False):
+        """
+        Same as `inference()`, but process all documents of the chunk at once,
+        as matrix operations, instead of one document at a time.
+
+        The word counts of the chunk are held in a sparse `documents x words`
+        matrix, restricted to the words that actually appear in the chunk. Each
+        fixed-point iteration then updates gamma for all documents with a single
+        sparse-dense matrix product. Documents whose gamma has converged are
+        dropped from the matrices, so that the remaining iterations only touch
+        documents that still need work.
+
+        The result is the same as that of `inference()`, up to floating point
+        differences; the random initialization of gamma consumes the numpy
+        random state in the same way, too.
+
+        """
+        if scipy.sparse.issparse(chunk):
+            docs = chunk.T.tocsr()
+        else:
+            docs = matutils.corpus2csc(chunk, num_terms=self.num_terms).T.tocsr()
+        num_docs = docs.shape[0]
+        if num_docs > 1:
+            logger.debug("performing vectorized inference on a chunk of %i documents", num_docs)
+
+        # only work with the words that appear in this chunk
+        wordids = numpy.unique(docs.indices)
+        docs = scipy.sparse.csr_matrix(
+            (docs.data, numpy.searchsorted(wordids, docs.indices), docs.indptr),
+            shape=(num_docs, len(wordids)))
+        expElogbetaT = numpy.ascontiguousarray(self.expElogbeta[:, wordids].T)
+        if collect_sstats:
+            sstatsT = numpy.zeros_like(expElogbetaT)
+
+        def select_rows(matrix, selected):
+            # rows of the csr `matrix` where the boolean `selected` is set; unlike `matrix[rows]`,
+            # this keeps the order of the non-zeros within each row, which `betarows` relies on
+            lengths = numpy.diff(matrix.indptr)
+            nonzeros = numpy.repeat(selected, lengths)
+            indptr = numpy.concatenate([[0], numpy.cumsum(lengths[selected])])
+            return scipy.sparse.csr_matrix(
+                (matrix.data[nonzeros], matrix.indices[nonzeros], indptr), shape=(len(indptr) - 1, matrix.shape[1]))
+
+        def cts_phinorm(docs, rows, betarows, expElogtheta):
+            # sparse documents x words matrix of n_{dw} / phinorm_{dw}, where
+            # phinorm_{dw} = \sum_k expElogtheta_{dk} * expElogbeta_{kw}
+            phinorm = numpy.einsum('ij,ij->i', expElogtheta[rows], betarows) + 1e-100
+            return scipy.sparse.csr_matrix((docs.data / phinorm, docs.indices, docs.indptr), shape=docs.shape)
+
+        # Initialize the variational distribution q(theta|gamma) for the chunk
+        gamma = numpy.random.gamma(100., 1. / 100., (num_docs, self.num_topics))
+        expElogtheta = numpy.exp(dirichlet_expectation(gamma))
+        active = numpy.arange(num_docs)  # which documents are still being iterated
+        rows = numpy.repeat(active, numpy.diff(docs.indptr))  # document of each non-zero count
+        betarows = expElogbetaT[docs.indices]  # expElogbeta of each non-zero count
+        ratio = cts_phinorm(docs, rows, betarows, expElogtheta)
+        converged = 0
 
-        if len(chunk) > 1:
+        for _ in xrange(self.iterations):
+            if not len(active):
+                break
+            lastgamma = gamma[active]
+            gammad = self.alpha + expElogtheta * ratio.dot(expElogbetaT)
+            expElogtheta = numpy.exp(dirichlet_expectation(gammad))
+            ratio = cts_phinorm(docs, rows, betarows, expElogtheta)
+            gamma[active] = gammad
+            done = numpy.mean(abs(gammad - lastgamma), axis=1) < self.gamma_threshold
+            if done.any():
+                converged += done.sum()
+                if collect_sstats:
+                    # contribution of the converged documents to the sufficient statistics
+                    finished = numpy.flatnonzero(done)
+                    sstatsT += ratio[finished].T.dot(expElogtheta[finished])
+                # drop converged documents from further iterations
+                keep = numpy.flatnonzero(~done)
+                betarows = betarows[~done[rows]]
+                docs, ratio = select_rows(docs, ~done), select_rows(ratio, ~done)
+                expElogtheta, active = expElogtheta[keep], active[keep]
+                rows = numpy.repeat(numpy.arange(len(active)), numpy.diff(docs.indptr))
+
+        if collect_sstats and len(active):
+            sstatsT += ratio.T.dot(expElogtheta)
+
+        if num_docs > 1:
             logger.debug("%i/%i documents converged within %i iterations",
-                         converged, len(chunk), self.iterations)
+                         converged, num_docs, self.iterations)
 
         if collect_sstats:
-            # This step finishes computing the sufficient statistics for the
-            # M step, so that
-            # sstats[k, w] = \sum_d n_{dw} * phi_{dwk}
-            # = \sum_d n_{dw} * exp{Elogtheta_{dk} + Elogbeta_{kw}} / phinorm_{dw}.
+            sstats = numpy.zeros_like(self.expElogbeta)
+            sstats[:, wordids] = sstatsT.T
             sstats *= self.expElogbeta
+        else:
+            sstats = None
         return gamma, sstats
 
     def do_estep(self, chunk, state=None):
@@ -461,6 +644,8 @@ class LdaModel(interfaces.TransformationABC):
         perplexity=2^(-bound), to log at INFO level.
 
         """
+        if scipy.sparse.issparse(chunk):
+            chunk = list(matutils.Sparse2Corpus(chunk))
         if total_docs is None:
             total_docs = len(chunk)
         corpus_words = sum(cnt for document in chunk for _, cnt in document)
@@ -558,8 +743,14 @@ class LdaModel(interfaces.TransformationABC):
             dirty = False
 
             reallen = 0
-            for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize, as_numpy=True)):
-                reallen += len(chunk)  # keep track of how many documents we've processed so far
+            if hasattr(corpus, 'iter_chunks'):
+                # the corpus hands out ready-made sparse blocks; no need to go through 2-tuples
+                chunk_stream = corpus.iter_chunks(chunksize)
+            else:
+                chunk_stream = utils.grouper(corpus, chunksize, as_numpy=True)
+            for chunk_no, chunk in enumerate(chunk_stream):
+                chunklen = matutils.chunk_len(chunk)
+                reallen += chunklen  # keep track of how many documents we've processed so far
 
                 if eval_every and ((reallen == lencorpus) or ((chunk_no + 1) % (eval_every * self.numworkers) == 0)):
                     self.log_perplexity(chunk, total_docs=lencorpus)
@@ -567,12 +758,12 @@ class LdaModel(interfaces.TransformationABC):
                 if self.dispatcher:
                     # add the chunk to dispatcher's job queue, so workers can munch on it
                     logger.info('PROGRESS: pass %i, dispatching documents up to #%i/%i',
-                                pass_, chunk_no * chunksize + len(chunk), lencorpus)
+                                pass_, chunk_no * chunksize + chunklen, lencorpus)
                     # this will eventually block until some jobs finish, because the queue has a small finite length
                     self.dispatcher.putjob(chunk)
                 else:
                     logger.info('PROGRESS: pass %i, at document #%i/%i',
-                                pass_, chunk_no * chunksize + len(chunk), lencorpus)
+                                pass_, chunk_no * chunksize + chunklen, lencorpus)
                     gammat = self.do_estep(chunk, other)
 
                     if self.optimize_alpha:
@@ -657,7 +848,7 @@ class LdaModel(interfaces.TransformationABC):
             Elogthetad = dirichlet_expectation(gammad)
 
             # E[log p(doc | theta, beta)]
-            score += numpy.sum(cnt * logsumexp(Elogthetad + Elogbeta[:, id]) for id, cnt in doc)
+            score += numpy.sum(cnt * logsumexp(Elogthetad + Elogbeta[:, int(id)]) for id, cnt in doc)
 
             # E[log p(theta | alpha) - log q(theta | gamma)]; assumes alpha is a vector
             score += numpy.sum((self.alpha - gammad) * Elogthetad)
@@ -0,0 +1,159 @@
+#!/usr/bin/env cython
+# cython: boundscheck=False
+# cython: wraparound=False
+# cython: cdivision=True
+# coding: utf-8
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Optimized LDA E-step: the per-document gamma/phi fixed-point iterations of
+`gensim.models.ldamodel.LdaModel.inference()`, in C and without the GIL, so that
+several threads can work on one chunk while sharing a single `expElogbeta` matrix.
+
+"""
+
+import cython
+import numpy as np
+cimport numpy as np
+
+from libc.math cimport exp, log, fabs
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
+
+ctypedef np.float64_t DOUBLE_t
+ctypedef np.intp_t INDEX_t
+
+
+cdef inline DOUBLE_t digamma(DOUBLE_t x) nogil:
+    # psi(x): shift x up using psi(x) = psi(x + 1) - 1/x, then use the asymptotic series
+    cdef DOUBLE_t result = 0.0, f
+    while x < 6.0:
+        result -= 1.0 / x
+        x += 1.0
+    f = 1.0 / (x * x)
+    return result + log(x) - 0.5 / x - f * (1.0 / 12 - f * (1.0 / 120 - f * (1.0 / 252 - f * (1.0 / 240 - f / 132))))
+
+
+cdef void exp_dirichlet_expectation(const DOUBLE_t *gammad, DOUBLE_t *expElogthetad, const int num_topics) nogil:
+    # expElogthetad = exp(psi(gammad) - psi(sum(gammad)))
+    cdef int k
+    cdef DOUBLE_t total = 0.0
+    for k in range(num_topics):
+        total += gammad[k]
+    total = digamma(total)
+    for k in range(num_topics):
+        expElogthetad[k] = exp(digamma(gammad[k]) - total)
+
+
+cdef void update_ratio(const DOUBLE_t *expElogthetad, const DOUBLE_t *expElogbetad, const DOUBLE_t *cts,
+                       DOUBLE_t *ratio, const int num_topics, const int doclen) nogil:
+    # ratio = cts / phinorm, with phinorm = dot(expElogthetad, expElogbetad) + 1e-100
+    cdef int j, k
+    for j in range(doclen):
+        ratio[j] = 1e-100
+    for k in range(num_topics):
+        for j in range(doclen):
+            ratio[j] += expElogthetad[k] * expElogbetad[k * doclen + j]
+    for j in range(doclen):
+        ratio[j] = cts[j] / ratio[j]
+
+
+cdef int infer_doc(const DOUBLE_t *expElogbeta, const DOUBLE_t *alpha, const INDEX_t *ids, const DOUBLE_t *cts,
+                   DOUBLE_t *gammad, DOUBLE_t *expElogthetad, DOUBLE_t *ratio,
+                   DOUBLE_t *expElogbetad, DOUBLE_t *lastgamma,
+                   const int num_topics, const long long num_terms, const int doclen,
+                   const int iterations, const DOUBLE_t gamma_threshold) nogil:
+    cdef int i, j, k
+    cdef DOUBLE_t total, meanchange
+
+    # expElogbetad = expElogbeta[:, ids], laid out as a contiguous num_topics x doclen block
+    for k in range(num_topics):
+        for j in range(doclen):
+            expElogbetad[k * doclen + j] = expElogbeta[k * num_terms + ids[j]]
+
+    exp_dirichlet_expectation(gammad, expElogthetad, num_topics)
+    update_ratio(expElogthetad, expElogbetad, cts, ratio, num_topics, doclen)
+
+    for i in range(iterations):
+        memcpy(lastgamma, gammad, num_topics * cython.sizeof(DOUBLE_t))
+        for k in range(num_topics):
+            total = 0.0
+            for j in range(doclen):
+                total += ratio[j] * expElogbetad[k * doclen + j]
+            gammad[k] = alpha[k] + expElogthetad[k] * total
+        exp_dirichlet_expectation(gammad, expElogthetad, num_topics)
+        update_ratio(expElogthetad, expElogbetad, cts, ratio, num_topics, doclen)
+        meanchange = 0.0
+        for k in range(num_topics):
+            meanchange += fabs(gammad[k] - lastgamma[k])
+        if meanchange / num_topics < gamma_threshold:
+            return 1
+    return 0
+
+
+def inference_docs(model, indptr, indices, data, gamma, expElogtheta, ratio, start, end):
+    """
+    Run the gamma/phi fixed-point iterations for documents `start` .. `end - 1`
+    of a chunk, given as the `indptr`, `indices` and `data` arrays of a csc matrix
+    (`intp`, `intp` and `float64`, respectively).
+
+    `gamma` (documents x topics) holds the initial gamma on input and is updated
+    in place. On output, `expElogtheta` (documents x topics) holds exp(E[log theta])
+    of each document and `ratio` (one entry per non-zero of `data`) holds the
+    word counts divided by the normalizer of phi, both of which are needed for the
+    sufficient statistics.
+
+    The GIL is released for the whole computation. Ranges of different documents
+    can be processed in parallel, from different threads.
+
+    Return the number of documents whose gamma converged.
+
+    """
+    cdef int num_topics = model.num_topics
+    cdef long long num_terms = model.num_terms
+    cdef int iterations = model.iterations
+    cdef DOUBLE_t gamma_threshold = model.gamma_threshold
+    cdef int _start = start, _end = end
+
+    expElogbeta_ = np.ascontiguousarray(model.expElogbeta, dtype=np.float64)
+    alpha_ = np.ascontiguousarray(model.alpha, dtype=np.float64)
+    cdef DOUBLE_t *_expElogbeta = <DOUBLE_t *>(np.PyArray_DATA(expElogbeta_))
+    cdef DOUBLE_t *_alpha = <DOUBLE_t *>(np.PyArray_DATA(alpha_))
+    cdef INDEX_t *_indptr = <INDEX_t *>(np.PyArray_DATA(indptr))
+    cdef INDEX_t *_indices = <INDEX_t *>(np.PyArray_DATA(indices))
+    cdef DOUBLE_t *_data = <DOUBLE_t *>(np.PyArray_DATA(data))
+    cdef DOUBLE_t *_gamma = <DOUBLE_t *>(np.PyArray_DATA(gamma))
+    cdef DOUBLE_t *_expElogtheta = <DOUBLE_t *>(np.PyArray_DATA(expElogtheta))
+    cdef DOUBLE_t *_ratio = <DOUBLE_t *>(np.PyArray_DATA(ratio))
+
+    cdef int d, doclen, maxlen = 1, converged = 0
+    cdef DOUBLE_t *expElogbetad
+    cdef DOUBLE_t *lastgamma
+
+    for d in range(_start, _end):
+        maxlen = max(maxlen, <int>(_indptr[d + 1] - _indptr[d]))
+
+    # work buffers, reused across all documents of this range
+    expElogbetad = <DOUBLE_t *>malloc(<size_t>num_topics * maxlen * cython.sizeof(DOUBLE_t))
+    lastgamma = <DOUBLE_t *>malloc(num_topics * cython.sizeof(DOUBLE_t))
+    if expElogbetad == NULL or lastgamma == NULL:
+        free(expElogbetad)
+        free(lastgamma)
+        raise MemoryError("cannot allocate work buffers for %i topics x %i words" % (num_topics, maxlen))
+
+    with nogil:
+        for d in range(_start, _end):
+            doclen = <int>(_indptr[d + 1] - _indptr[d])
+            converged += infer_doc(
+                _expElogbeta, _alpha, _indices + _indptr[d], _data + _indptr[d],
+                _gamma + <long long>d * num_topics, _expElogtheta + <long long>d * num_topics, _ratio + _indptr[d],
+                expElogbetad, lastgamma,
+                num_topics, num_terms, doclen, iterations, gamma_threshold)
+        free(expElogbetad)
+        free(lastgamma)
+
+    return converged
+
+
+FAST_VERSION = 0  # the compiled version is available
@@ -47,12 +47,20 @@ The core estimation code is based on the `onlineldavb.py` script by M. Hoffman [
 .. [1] http://www.cs.princeton.edu/~mdhoffma
 """
 
+import copy
 import logging
+import os
+import shutil
+import tempfile
 
-from gensim import utils
+import numpy
+
+from gensim import utils, matutils
 from gensim.models.ldamodel import LdaModel, LdaState
 from six.moves import queue, xrange
-from multiprocessing import Pool, Queue, cpu_count
+import threading
+from multiprocessing import Pool, Queue, Lock, cpu_count
+from multiprocessing.sharedctypes import RawArray
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +86,7 @@ class LdaMulticore(LdaModel):
     def __init__(self, corpus=None, num_topics=100, id2word=None, workers=None,
                  chunksize=2000, passes=1, batch=False, alpha='symmetric',
                  eta=None, decay=0.5, offset=1.0, eval_every=10, iterations=50,
-                 gamma_threshold=0.001):
+                 gamma_threshold=0.001, vectorized=False):
         """
         If given, start training from the iterable `corpus` straight away. If not given,
         the model is left untrained (presumably because you want to call `update()` manually).
@@ -123,6 +131,9 @@ class LdaMulticore(LdaModel):
         `decay` and `offset` parameters are the same as Kappa and Tau_0 in
         Hoffman et al, respectively.
 
+        Set `vectorized` to True to run each worker's E-step over its whole chunk
+        at once, as sparse matrix operations (see `LdaModel.inference_chunk()`).
+
         Example:
 
         >>> lda = LdaMulticore(corpus, id2word=id2word, num_topics=100)  # train model
@@ -138,7 +149,7 @@ class LdaMulticore(LdaModel):
         super(LdaMulticore, self).__init__(corpus=corpus, num_topics=num_topics,
             id2word=id2word, chunksize=chunksize, passes=passes, alpha=alpha, eta=eta,
             decay=decay, offset=offset, eval_every=eval_every, iterations=iterations,
-            gamma_threshold=gamma_threshold)
+            gamma_threshold=gamma_threshold, vectorized=vectorized)
 
 
     def update(self, corpus):
@@ -198,77 +209,193 @@ class LdaMulticore(LdaModel):
         def rho():
             return pow(self.offset + pass_ + (self.num_updates / self.chunksize), -self.decay)
 
-        logger.info("training LDA model using %i processes", self.workers)
-        pool = Pool(self.workers, worker_e_step, (job_queue, result_queue,))
-        for pass_ in xrange(self.passes):
-            queue_size, reallen = [0], 0
-            other = LdaState(self.eta, self.state.sstats.shape)
-
-            def process_result_queue(force=False):
-                """
-                Clear the result queue, merging all intermediate results, and update the
-                LDA model if necessary.
-
-                """
-                merged_new = False
-                while not result_queue.empty():
-                    other.merge(result_queue.get())
-                    queue_size[0] -= 1
-                    merged_new = True
-                if (force and merged_new and queue_size[0] == 0) or (not self.batch and (other.numdocs >= updateafter)):
-                    self.do_mstep(rho(), other, pass_ > 0)
-                    other.reset()
-                    if self.eval_every is not None and ((force and queue_size[0] == 0) or (self.eval_every != 0 and (self.num_updates / updateafter) % self.eval_every == 0)):
-                        self.log_perplexity(chunk, total_docs=lencorpus)
-
-            chunk_stream = utils.grouper(corpus, self.chunksize, as_numpy=True)
-            for chunk_no, chunk in enumerate(chunk_stream):
-                reallen += len(chunk)  # keep track of how many documents we've processed so far
-
-                # put the chunk into the workers' input job queue
-                chunk_put = False
-                while not chunk_put:
-                    try:
-                        job_queue.put((chunk_no, chunk, self), block=False, timeout=0.1)
-                        chunk_put = True
-                        queue_size[0] += 1
-                        logger.info('PROGRESS: pass %i, dispatched chunk #%i = '
-                            'documents up to #%i/%i, outstanding queue size %i',
-                            pass_, chunk_no, chunk_no * self.chunksize + len(chunk), lencorpus, queue_size[0])
-                    except queue.Full:
-                        # in case the input job queue is full, keep clearing the
-                        # result queue, to make sure we don't deadlock
-                        process_result_queue()
-
-                process_result_queue()
-            #endfor single corpus pass
-
-            # wait for all outstanding jobs to finish
-            while queue_size[0] > 0:
-                process_result_queue(force=True)
-
-            if reallen != lencorpus:
-                raise RuntimeError("input corpus size changed during training (don't use generators as input)")
-        #endfor entire update
-
-        pool.terminate()
-
-
-def worker_e_step(input_queue, result_queue):
+        # the workers receive a copy of the model (without its state) only once, here.
+        # after each M-step, the new `expElogbeta` is saved to a file which the workers
+        # mmap, so jobs only carry the chunk and the name of that file
+        tmpdir = tempfile.mkdtemp(prefix='gensim_ldamulticore_')
+        pool = None
+        try:
+            model_version, jobs_per_fname = [0], {}
+
+            def publish_model():
+                """Save the current `expElogbeta` for the workers; remove files no longer in use."""
+                model_version[0] += 1
+                fname = os.path.join(tmpdir, 'expElogbeta.%i.npy' % model_version[0])
+                numpy.save(fname, self.expElogbeta)
+                for old_fname, numjobs in list(jobs_per_fname.items()):
+                    if numjobs == 0:
+                        try:
+                            os.remove(old_fname)
+                        except OSError:
+                            pass  # still mmap'd on a platform that doesn't allow that; removed at the end
+                        del jobs_per_fname[old_fname]
+                jobs_per_fname[fname] = 0
+                return fname
+
+            worker_lda = copy.copy(self)
+            worker_lda.state, worker_lda.expElogbeta, worker_lda.id2word = None, None, None
+            model_fname = [publish_model()]
+
+            # each worker accumulates the sufficient statistics of its chunks into its own
+            # shared-memory buffer (plus a document counter), guarded by its own lock, so
+            # that results never travel through the result queue
+            sstats_fnames = [os.path.join(tmpdir, 'sstats.%i' % workerno) for workerno in xrange(self.workers)]
+            sstats_buffers = [numpy.memmap(fname, dtype=numpy.float64, mode='w+', shape=self.state.sstats.shape)
+                              for fname in sstats_fnames]
+            numdocs = RawArray('l', self.workers)
+            locks = [Lock() for _ in xrange(self.workers)]
+            slot_queue = Queue()
+            for workerno in xrange(self.workers):
+                slot_queue.put(workerno)
+
+            def reduce_sstats(state):
+                """Move the contents of all workers' buffers into `state`."""
+                for lock in locks:
+                    lock.acquire()
+                try:
+                    reduce_buffers(sstats_buffers, state.sstats)
+                    state.numdocs += sum(numdocs)
+                    numdocs[:] = [0] * self.workers
+                finally:
+                    for lock in locks:
+                        lock.release()
+
+            logger.info("training LDA model using %i processes", self.workers)
+            pool = Pool(self.workers, worker_e_step,
+                        (job_queue, result_queue, worker_lda, slot_queue, sstats_fnames, numdocs, locks))
+            del worker_lda
+            for pass_ in xrange(self.passes):
+                queue_size, reallen = [0], 0
+                # documents of acknowledged jobs vs. documents moved from the buffers into
+                # `other`; a buffer may already hold the sstats of a job whose result message
+                # hasn't arrived yet, so only acknowledged documents trigger an update
+                acked, merged = [0], [0]
+                other = LdaState(self.eta, self.state.sstats.shape)
+                for buf in sstats_buffers:  # no jobs are in flight between passes
+                    buf[:] = 0.0
+                numdocs[:] = [0] * self.workers
+
+                def process_result_queue(force=False):
+                    """
+                    Clear the result queue, and update the LDA model from the intermediate
+                    results accumulated by the workers, if necessary.
+
+                    """
+                    while not result_queue.empty():
+                        fname, job_numdocs = result_queue.get()
+                        jobs_per_fname[fname] -= 1
+                        queue_size[0] -= 1
+                        acked[0] += job_numdocs
+                    if (force and queue_size[0] == 0 and acked[0] > merged[0]) or \
+                            (not self.batch and acked[0] - merged[0] >= updateafter):
+                        reduce_sstats(other)
+                        merged[0] += other.numdocs
+                        if other.numdocs == 0:
+                            return  # everything acknowledged was merged by an earlier update already
+                        self.do_mstep(rho(), other, pass_ > 0)
+                        other.reset()
+                        model_fname[0] = publish_model()
+                        if self.eval_every is not None and ((force and queue_size[0] == 0) or (self.eval_every != 0 and (self.num_updates / updateafter) % self.eval_every == 0)):
+                            self.log_perplexity(chunk, total_docs=lencorpus)
+
+                if hasattr(corpus, 'iter_chunks'):
+                    # the corpus hands out ready-made sparse blocks; no need to go through 2-tuples
+                    chunk_stream = corpus.iter_chunks(self.chunksize)
+                else:
+                    chunk_stream = utils.grouper(corpus, self.chunksize, as_numpy=True)
+                for chunk_no, chunk in enumerate(chunk_stream):
+                    chunklen = matutils.chunk_len(chunk)
+                    reallen += chunklen  # keep track of how many documents we've processed so far
+
+                    # put the chunk into the workers' input job queue
+                    chunk_put = False
+                    while not chunk_put:
+                        try:
+                            job_queue.put((chunk_no, chunk, model_fname[0]), block=False, timeout=0.1)
+                            chunk_put = True
+                            jobs_per_fname[model_fname[0]] += 1
+                            queue_size[0] += 1
+                            logger.info('PROGRESS: pass %i, dispatched chunk #%i = '
+                                'documents up to #%i/%i, outstanding queue size %i',
+                                pass_, chunk_no, chunk_no * self.chunksize + chunklen, lencorpus, queue_size[0])
+                        except queue.Full:
+                            # in case the input job queue is full, keep clearing the
+                            # result queue, to make sure we don't deadlock
+                            process_result_queue()
+
+                    process_result_queue()
+                #endfor single corpus pass
+
+                # wait for all outstanding jobs to finish
+                while queue_size[0] > 0:
+                    process_result_queue(force=True)
+
+                if reallen != lencorpus:
+                    raise RuntimeError("input corpus size changed during training (don't use generators as input)")
+            #endfor entire update
+        finally:
+            # also on errors (or ctrl+c): stop the workers, remove their buffers and model files
+            if pool is not None:
+                pool.terminate()
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def reduce_buffers(buffers, out):
+    """
+    Add up all arrays from `buffers` into `out` and zero the buffers, in parallel
+    threads, each of which handles a block of rows of all the arrays.
+
+    """
+    bounds = numpy.linspace(0, out.shape[0], min(len(buffers), out.shape[0]) + 1).astype(int)
+
+    def reduce_block(start, end):
+        for buf in buffers:
+            out[start:end] += buf[start:end]
+            buf[start:end] = 0.0
+
+    threads = [threading.Thread(target=reduce_block, args=(start, end)) for start, end in zip(bounds, bounds[1:])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def worker_e_step(input_queue, result_queue, worker_lda, slot_queue, sstats_fnames, numdocs, locks):
     """
-    Perform E-step for each (chunk_no, chunk, model) 3-tuple from the
-    input queue, placing the resulting state into the result queue.
+    Perform E-step for each (chunk_no, chunk, fname) 3-tuple from the
+    input queue, accumulating the sufficient statistics into this worker's
+    shared buffer, and placing `(fname, number of documents in the chunk)`
+    into the result queue once done.
+
+    `worker_lda` is the model without its state; `fname` is the file holding
+    the model's `expElogbeta` to use for the chunk. The file is mmap'd, and only
+    re-opened when a job refers to a new one (after an M-step in the master).
+
+    Each worker takes its own slot from `slot_queue`: the slot selects the mmap'd
+    sstats buffer (from `sstats_fnames`), the document counter in `numdocs` and the
+    lock in `locks` that this worker uses.
 
     """
     logger.debug("worker process entering E-step loop")
+    fname = None
+    slot = slot_queue.get()
+    sstats_buffer = numpy.memmap(sstats_fnames[slot], dtype=numpy.float64, mode='r+',
+                                 shape=(worker_lda.num_topics, worker_lda.num_terms))
     while True:
         logger.debug("getting a new job")
-        chunk_no, chunk, worker_lda = input_queue.get()
-        logger.debug("processing chunk #%i of %i documents", chunk_no, len(chunk))
-        worker_lda.state.reset()
-        worker_lda.do_estep(chunk)  # TODO: auto-tune alpha?
+        chunk_no, chunk, job_fname = input_queue.get()
+        if job_fname != fname:
+            logger.debug("loading model update from %s", job_fname)
+            fname = job_fname
+            worker_lda.expElogbeta = numpy.load(fname, mmap_mode='r')
+        logger.debug("processing chunk #%i of %i documents", chunk_no, matutils.chunk_len(chunk))
+        gamma, sstats = worker_lda.inference(chunk, collect_sstats=True)  # TODO: auto-tune alpha?
         del chunk
-        logger.debug("processed chunk, queuing the result")
-        result_queue.put(worker_lda.state)
-        del worker_lda  # free up some memory
+        logger.debug("processed chunk, accumulating the result")
+        chunk_numdocs = gamma.shape[0]
+        with locks[slot]:
+            sstats_buffer += sstats
+            numdocs[slot] += chunk_numdocs
+        del gamma, sstats
+        result_queue.put((fname, chunk_numdocs))
         logger.debug("result put")
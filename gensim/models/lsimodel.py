@@ -367,14 +367,10 @@ class LsiModel(interfaces.TransformationABC):
                 if self.dispatcher:
                     logger.info('initializing %s workers', self.numworkers)
                     self.dispatcher.reset()
-                for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
+                # construct each job as a sparse matrix, to minimize memory overhead
+                # definitely avoid materializing it as a dense matrix!
+                for chunk_no, job in enumerate(matutils.corpus2csc_chunks(corpus, chunksize, num_terms=self.num_terms)):
                     logger.info("preparing a new chunk of documents")
-                    nnz = sum(len(doc) for doc in chunk)
-                    # construct the job as a sparse matrix, to minimize memory overhead
-                    # definitely avoid materializing it as a dense matrix!
-                    logger.debug("converting corpus to csc format")
-                    job = matutils.corpus2csc(chunk, num_docs=len(chunk), num_terms=self.num_terms, num_nnz=nnz)
-                    del chunk
                     doc_no += job.shape[1]
                     if self.dispatcher:
                         # distributed version: add this job to the job queue, so workers can work on it
@@ -419,20 +415,26 @@ class LsiModel(interfaces.TransformationABC):
         """
         assert self.projection.u is not None, "decomposition not initialized yet"
 
-        # if the input vector is in fact a corpus, return a transformed corpus as a result
-        is_corpus, bow = utils.is_corpus(bow)
-        if is_corpus and chunksize:
-            # by default, transform `chunksize` documents at once, when called as `lsi[corpus]`.
-            # this chunking is completely transparent to the user, but it speeds
-            # up internal computations (one mat * mat multiplication, instead of
-            # `chunksize` smaller mat * vec multiplications).
-            return self._apply(bow, chunksize=chunksize)
-
-        if not is_corpus:
-            bow = [bow]
-
-        # convert input to scipy.sparse CSC, then do "sparse * dense = dense" multiplication
-        vec = matutils.corpus2csc(bow, num_terms=self.num_terms, dtype=self.projection.u.dtype)
+        if scipy.sparse.issparse(bow):
+            # a chunk of documents that already comes as a sparse matrix (documents = columns),
+            # such as from `corpus.iter_chunks()` => no need to convert anything
+            is_corpus = True
+            vec = matutils.chunks2csc([bow], num_terms=self.num_terms, dtype=self.projection.u.dtype)
+        else:
+            # if the input vector is in fact a corpus, return a transformed corpus as a result
+            is_corpus, bow = utils.is_corpus(bow)
+            if is_corpus and chunksize:
+                # by default, transform `chunksize` documents at once, when called as `lsi[corpus]`.
+                # this chunking is completely transparent to the user, but it speeds
+                # up internal computations (one mat * mat multiplication, instead of
+                # `chunksize` smaller mat * vec multiplications).
+                return self._apply(bow, chunksize=chunksize)
+
+            if not is_corpus:
+                bow = [bow]
+
+            # convert input to scipy.sparse CSC, then do "sparse * dense = dense" multiplication
+            vec = matutils.corpus2csc(bow, num_terms=self.num_terms, dtype=self.projection.u.dtype)
         topic_dist = (vec.T * self.projection.u[:, :self.num_topics]).T  # (x^T * u).T = u^-1 * x
 
         # # convert input to dense, then do dense * dense multiplication
@@ -676,12 +678,10 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
             q, _ = matutils.qr_destroy(q)  # orthonormalize the range after each power iteration step
     else:
         num_docs = 0
-        for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
+        # construct the chunks as sparse matrices, to minimize memory overhead
+        # definitely avoid materializing them as dense (num_terms x chunksize) matrices!
+        for chunk_no, chunk in enumerate(matutils.corpus2csc_chunks(corpus, chunksize, num_terms=num_terms, dtype=dtype)):
             logger.info('PROGRESS: at document #%i', (chunk_no * chunksize))
-            # construct the chunk as a sparse matrix, to minimize memory overhead
-            # definitely avoid materializing it as a dense (num_terms x chunksize) matrix!
-            s = sum(len(doc) for doc in chunk)
-            chunk = matutils.corpus2csc(chunk, num_terms=num_terms, dtype=dtype)  # documents = columns of sparse CSC
             m, n = chunk.shape
             assert m == num_terms
             assert n <= chunksize  # the very last chunk of A is allowed to be smaller in size
@@ -698,9 +698,8 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
             logger.info("running power iteration #%i", power_iter + 1)
             yold = q.copy()
             q[:] = 0.0
-            for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
+            for chunk_no, chunk in enumerate(matutils.corpus2csc_chunks(corpus, chunksize, num_terms=num_terms, dtype=dtype)):
                 logger.info('PROGRESS: at document #%i/%i', chunk_no * chunksize, num_docs)
-                chunk = matutils.corpus2csc(chunk, num_terms=num_terms, dtype=dtype)  # documents = columns of sparse CSC
                 tmp = chunk.T * yold
                 tmp = chunk * tmp
                 del chunk
@@ -723,9 +722,8 @@ def stochastic_svd(corpus, rank, num_terms, chunksize=20000, extra_dims=None,
         # input corpus A, to avoid using O(number of documents) memory
         x = numpy.zeros(shape=(qt.shape[0], qt.shape[0]), dtype=numpy.float64)
         logger.info("2nd phase: constructing %s covariance matrix", str(x.shape))
-        for chunk_no, chunk in enumerate(utils.grouper(corpus, chunksize)):
+        for chunk_no, chunk in enumerate(matutils.corpus2csc_chunks(corpus, chunksize, num_terms=num_terms, dtype=qt.dtype)):
             logger.info('PROGRESS: at document #%i/%i', chunk_no * chunksize, num_docs)
-            chunk = matutils.corpus2csc(chunk, num_terms=num_terms, dtype=qt.dtype)
             b = qt * chunk  # dense * sparse matrix multiply
             del chunk
             x += numpy.dot(b, b.T)  # TODO should call the BLAS routine SYRK, but there is no SYRK wrapper in scipy :(
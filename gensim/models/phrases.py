@@ -58,6 +58,7 @@ two tokens (e.g. `new_york_times`):
 """
 
 import logging
+import multiprocessing
 from collections import defaultdict
 
 from six import iteritems, string_types
@@ -67,6 +68,11 @@ from gensim import utils, interfaces
 logger = logging.getLogger(__name__)
 
 
+def _learn_shard(args):
+    # `Phrases.learn_vocab` in a worker process, with all arguments in one tuple (for `Pool.imap`)
+    return Phrases.learn_vocab(*args)
+
+
 class Phrases(interfaces.TransformationABC):
     """
     Detect phrases, based on collected collocation counts. Adjacent words that appear
@@ -77,7 +83,7 @@ class Phrases(interfaces.TransformationABC):
 
     """
     def __init__(self, sentences=None, min_count=5, threshold=10.0,
-            max_vocab_size=40000000, delimiter=b'_'):
+            max_vocab_size=40000000, delimiter=b'_', workers=1):
         """
         Initialize the model from an iterable of `sentences`. Each sentence must be
         a list of words (unicode strings) that will be used for training.
@@ -104,6 +110,9 @@ class Phrases(interfaces.TransformationABC):
         `delimiter` is the glue character used to join collocation tokens, and
         should be a byte string (e.g. b'_').
 
+        `workers` > 1 counts `sentences` in parallel processes; `sentences` must then be
+        a list of shards (see `learn_vocab`).
+
         """
         if min_count <= 0:
             raise ValueError("min_count should be at least 1")
@@ -119,7 +128,7 @@ class Phrases(interfaces.TransformationABC):
         self.delimiter = delimiter
 
         if sentences is not None:
-            self.add_vocab(sentences)
+            self.add_vocab(sentences, workers=workers)
 
 
     def __str__(self):
@@ -130,8 +139,29 @@ class Phrases(interfaces.TransformationABC):
 
 
     @staticmethod
-    def learn_vocab(sentences, max_vocab_size, delimiter=b'_'):
-        """Collect unigram/bigram counts from the `sentences` iterable."""
+    def learn_vocab(sentences, max_vocab_size, delimiter=b'_', workers=1):
+        """
+        Collect unigram/bigram counts from the `sentences` iterable.
+
+        With `workers` > 1, `sentences` must be a list of shards: sentence iterables that
+        together make up the corpus, such as `LineSentence(fname).shards(workers)`. They're
+        counted by `workers` processes (so they must be picklable), and the counts merged by
+        `utils.merge_vocabs`. Unless pruning happens, the result is identical to a serial pass
+        over all shards, one after another. Bigrams that span two shards are not counted, so
+        shards should end at sentence boundaries.
+
+        """
+        if workers > 1:
+            pool = multiprocessing.Pool(min(workers, len(sentences)))
+            try:
+                results = pool.imap(_learn_shard, [(shard, max_vocab_size, delimiter) for shard in sentences])
+                vocab, min_reduce, _ = utils.merge_vocabs(
+                    ((shard_vocab, shard_min_reduce) for shard_min_reduce, shard_vocab in results), max_vocab_size)
+            finally:
+                pool.terminate()
+            logger.info("collected %i word types from %i shards" % (len(vocab), len(sentences)))
+            return min_reduce, vocab
+
         sentence_no = -1
         total_words = 0
         logger.info("collecting all words and their counts")
@@ -160,17 +190,19 @@ class Phrases(interfaces.TransformationABC):
         return min_reduce, vocab
 
 
-    def add_vocab(self, sentences):
+    def add_vocab(self, sentences, workers=1):
         """
         Merge the collected counts `vocab` into this phrase detector.
 
+        `workers` > 1 counts `sentences` in parallel processes (see `learn_vocab`).
+
         """
         # uses a separate vocab to collect the token counts from `sentences`.
         # this consumes more RAM than merging new sentences into `self.vocab`
         # directly, but gives the new sentences a fighting chance to collect
         # sufficient counts, before being pruned out by the (large) accummulated
         # counts collected in previous learn_vocab runs.
-        min_reduce, vocab = self.learn_vocab(sentences, self.max_vocab_size, self.delimiter)
+        min_reduce, vocab = self.learn_vocab(sentences, self.max_vocab_size, self.delimiter, workers=workers)
 
         logger.info("merging %i counts into %s" % (len(vocab), self))
         self.min_reduce = max(self.min_reduce, min_reduce)
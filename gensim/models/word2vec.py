@@ -72,9 +72,11 @@ import logging
 import sys
 import os
 import heapq
+import itertools
 from timeit import default_timer
 from copy import deepcopy
 from collections import defaultdict
+import multiprocessing
 import threading
 import time
 try:
@@ -84,10 +86,11 @@ except ImportError:
 
 from numpy import exp, log, dot, zeros, outer, random, dtype, float32 as REAL,\
     uint32, seterr, array, uint8, vstack, fromstring, sqrt, newaxis,\
-    ndarray, empty, sum as np_sum, prod, ones
+    ndarray, empty, sum as np_sum, prod, ones, memmap as np_memmap, int64, concatenate, arange,\
+    frombuffer, cumsum
 
-from gensim import utils, matutils  # utility fnc for pickling, common scipy operations etc
-from six import iteritems, itervalues, string_types
+from gensim import utils, matutils, topk  # utility fnc for pickling, common scipy operations etc
+from six import iteritems, itervalues, string_types, reraise
 from six.moves import xrange
 from types import GeneratorType
 
@@ -95,6 +98,7 @@ logger = logging.getLogger("gensim.models.word2vec")
 
 try:
     from gensim.models.word2vec_inner import train_sentence_sg, train_sentence_cbow, FAST_VERSION
+    from gensim.models.word2vec_inner import train_batch_sg, train_batch_cbow, sentence_indexes
 except ImportError:
     # failed... fall back to plain numpy (20-80x slower training than the above)
     FAST_VERSION = -1
@@ -149,6 +153,47 @@ except ImportError:
 
         return len(word_vocabs)
 
+    def sentence_indexes(model, sentences):
+        """
+        Convert `sentences` (a list of lists of words) to a 2-tuple of arrays `(indexes, offsets)`:
+        the vocabulary indexes of all in-vocabulary words, concatenated, and the offset of each
+        sentence in `indexes` (plus the total length at the end).
+
+        """
+        vocab = model.vocab
+        sentences = [[vocab[w].index for w in sentence if w in vocab] for sentence in sentences]
+        indexes = array([index for sentence in sentences for index in sentence], dtype=uint32)
+        offsets = concatenate([zeros(1, dtype=int64), cumsum([len(sentence) for sentence in sentences], dtype=int64)])
+        return indexes, offsets
+
+    def train_batch_sg(model, indexes, offsets, alpha, work=None):
+        """
+        Update skip-gram model by training on a batch of sentences, given as the arrays
+        of `sentence_indexes()`. Called internally from `Word2Vec.train()`.
+
+        This is the non-optimized, Python version. If you have cython installed, gensim
+        will use the optimized version from word2vec_inner instead.
+
+        """
+        result = 0
+        for start, end in zip(offsets, offsets[1:]):
+            result += train_sentence_sg(model, [model.index2word[index] for index in indexes[start:end]], alpha, work)
+        return result
+
+    def train_batch_cbow(model, indexes, offsets, alpha, work=None, neu1=None):
+        """
+        Update CBOW model by training on a batch of sentences, given as the arrays
+        of `sentence_indexes()`. Called internally from `Word2Vec.train()`.
+
+        This is the non-optimized, Python version. If you have cython installed, gensim
+        will use the optimized version from word2vec_inner instead.
+
+        """
+        result = 0
+        for start, end in zip(offsets, offsets[1:]):
+            result += train_sentence_cbow(model, [model.index2word[index] for index in indexes[start:end]], alpha, work, neu1)
+        return result
+
 
 def train_sg_pair(model, word, context_index, alpha, learn_vectors=True, learn_hidden=True,
                   context_vectors=None, context_locks=None):
@@ -232,13 +277,14 @@ def train_cbow_pair(model, word, input_word_indices, l1, alpha, learn_vectors=Tr
 # but for now just do it separately incase there are unforseen bugs in score_
 try:
     from gensim.models.word2vec_inner import score_sentence_sg, score_sentence_cbow
+    from gensim.models.word2vec_inner import score_sentences_sg, score_sentences_cbow
 except ImportError:
     def score_sentence_sg(model, sentence, work=None):
         """
         Obtain likelihood score for a single sentence in a fitted skip-gram representaion.
 
-        The sentence is a list of Vocab objects (or None, when the corresponding
-        word is not in the vocabulary). Called internally from `Word2Vec.score()`.
+        The sentence is a list of words (unicode strings); words not in the vocabulary
+        are ignored. Called internally from `Word2Vec.score()`.
 
         This is the non-optimized, Python version. If you have cython installed, gensim
         will use the optimized version from word2vec_inner instead.
@@ -246,67 +292,85 @@ except ImportError:
         """
 
         log_prob_sentence = 0.0
-        if model.negative:
-            raise RuntimeError("scoring is only available for HS=True")
+        rng = random.RandomState(model.seed) if model.negative else None
 
         word_vocabs = [model.vocab[w] for w in sentence if w in model.vocab]
         for pos, word in enumerate(word_vocabs):
-            if word is None:
-                continue  # OOV word in the input sentence => skip
-
             # now go over all words from the window, predicting each one in turn
             start = max(0, pos - model.window)
-            for pos2, word2 in enumerate(sentence[start:(pos + model.window + 1)], start):
-                # don't train on OOV words and on the `word` itself
-                if word2 and not (pos2 == pos):
-                    log_prob_sentence += score_sg_pair(model, word, word2)
+            for pos2, word2 in enumerate(word_vocabs[start:(pos + model.window + 1)], start):
+                # don't score the `word` itself
+                if pos2 != pos:
+                    log_prob_sentence += score_sg_pair(model, word, word2, rng)
 
         return log_prob_sentence
 
-    def score_sentence_cbow(model, sentence, alpha, work=None, neu1=None):
+    def score_sentence_cbow(model, sentence, work=None, neu1=None):
         """
         Obtain likelihood score for a single sentence in a fitted CBOW representaion.
 
-        The sentence is a list of Vocab objects (or None, where the corresponding
-        word is not in the vocabulary. Called internally from `Word2Vec.score()`.
+        The sentence is a list of words (unicode strings); words not in the vocabulary
+        are ignored. Called internally from `Word2Vec.score()`.
 
         This is the non-optimized, Python version. If you have cython installed, gensim
         will use the optimized version from word2vec_inner instead.
 
         """
         log_prob_sentence = 0.0
-        if model.negative:
-            raise RuntimeError("scoring is only available for HS=True")
+        rng = random.RandomState(model.seed) if model.negative else None
 
         word_vocabs = [model.vocab[w] for w in sentence if w in model.vocab]
         for pos, word in enumerate(word_vocabs):
-            if word is None:
-                continue  # OOV word in the input sentence => skip
-
             start = max(0, pos - model.window)
-            window_pos = enumerate(sentence[start:(pos + model.window + 1)], start)
-            word2_indices = [word2.index for pos2, word2 in window_pos if (word2 is not None and pos2 != pos)]
+            window_pos = enumerate(word_vocabs[start:(pos + model.window + 1)], start)
+            word2_indices = [word2.index for pos2, word2 in window_pos if pos2 != pos]
             l1 = np_sum(model.syn0[word2_indices], axis=0)  # 1 x layer1_size
             if word2_indices and model.cbow_mean:
                 l1 /= len(word2_indices)
-            log_prob_sentence += score_cbow_pair(model, word, word2_indices, l1)
+            log_prob_sentence += score_cbow_pair(model, word, word2_indices, l1, rng)
 
         return log_prob_sentence
 
+    def score_sentences_sg(model, sentences, work, scores):
+        """Store the skip-gram log probability of each of `sentences` into the array `scores`."""
+        for sentence_no, sentence in enumerate(sentences):
+            scores[sentence_no] = score_sentence_sg(model, sentence, work)
+
+    def score_sentences_cbow(model, sentences, work, neu1, scores):
+        """Store the CBOW log probability of each of `sentences` into the array `scores`."""
+        for sentence_no, sentence in enumerate(sentences):
+            scores[sentence_no] = score_sentence_cbow(model, sentence, work, neu1)
+
+
+def score_sg_pair(model, word, word2, rng=None):
+    return score_word(model, word, model.syn0[word2.index], rng)
+
+
+def score_cbow_pair(model, word, word2_indices, l1, rng=None):
+    return score_word(model, word, l1, rng)
 
-def score_sg_pair(model, word, word2):
-    l1 = model.syn0[word2.index]
-    l2a = deepcopy(model.syn1[word.point])  # 2d matrix, codelen x layer1_size
-    sgn = -1.0**word.code  # ch function, 0-> 1, 1 -> -1
-    lprob = -log(1.0 + exp(-sgn*dot(l1, l2a.T)))
-    return sum(lprob)
 
+def score_word(model, word, l1, rng=None):
+    """
+    Return the log probability of `word` given the hidden layer `l1`, under hierarchical
+    softmax and/or negative sampling (with negative samples drawn using `rng`).
 
-def score_cbow_pair(model, word, word2_indices, l1):
-    l2a = model.syn1[word.point]  # 2d matrix, codelen x layer1_size
-    sgn = -1.0**word.code  # ch function, 0-> 1, 1 -> -1
-    lprob = -log(1.0 + exp(-sgn*dot(l1, l2a.T)))
-    return sum(lprob)
+    """
+    lprob = 0.0
+    if model.hs:
+        l2a = model.syn1[word.point]  # 2d matrix, codelen x layer1_size
+        sgn = (-1.0) ** word.code  # ch function, 0-> 1, 1 -> -1
+        lprob += np_sum(-log(1.0 + exp(-sgn * dot(l2a, l1))))
+    if model.negative:
+        word_indices = [word.index]
+        while len(word_indices) < model.negative + 1:
+            w = model.cum_table.searchsorted(rng.randint(model.cum_table[-1]))
+            if w != word.index:
+                word_indices.append(w)
+        sgn = -ones(len(word_indices), dtype=REAL)
+        sgn[0] = 1.0  # the predicted word is a positive example, the noise words negative ones
+        lprob += np_sum(-log(1.0 + exp(-sgn * dot(model.syn1neg[word_indices], l1))))
+    return lprob
 
 
 class Vocab(object):
@@ -327,6 +391,248 @@ class Vocab(object):
         return "%s(%s)" % (self.__class__.__name__, ', '.join(vals))
 
 
+class CompactVocab(utils.SaveLoad):
+    """
+    Vocabulary of a trained model: a mapping of word -> Vocab-like item, stored as
+    a struct of arrays indexed by the word index, instead of one Vocab object
+    (with its own `__dict__` and two small code/point arrays) per word.
+
+    * `word2index` maps each word (string) to its index;
+    * `counts` and `sample_ints` hold the frequency and downsampling threshold of each word;
+    * the Huffman `codes` and `points` of all words are concatenated into two flat arrays;
+      those of word `i` are `codes[code_offsets[i]:code_offsets[i + 1]]`.
+
+    Looking up a word returns a light view over these arrays, with the same `count`,
+    `index`, `sample_int`, `code` and `point` attributes as a Vocab object, so
+    `model.vocab[word].count` keeps working. The arrays are stored with `numpy.save`
+    (and can be memory-mapped) when the model is saved.
+
+    """
+    def __init__(self):
+        self.word2index = {}
+        self.counts = empty(0, dtype=int64)
+        self.sample_ints = empty(0, dtype=int64)  # up to 2**32, for words never downsampled
+        self.code_offsets = zeros(1, dtype=int64)
+        self.codes = empty(0, dtype=uint8)
+        self.points = empty(0, dtype=uint32)
+
+    @classmethod
+    def from_dict(cls, vocab):
+        """Convert a dict of word -> Vocab object (the layout of older models) into a CompactVocab."""
+        result = cls()
+        items = sorted(iteritems(vocab), key=lambda item: item[1].index)
+        if [v.index for _, v in items] != list(xrange(len(items))):
+            raise ValueError("vocabulary indexes must be 0..%i" % (len(items) - 1))
+        result.add_words([word for word, _ in items], [v.count or 0 for _, v in items],
+                         [getattr(v, 'sample_int', 0) for _, v in items])
+        if items and hasattr(items[0][1], 'code'):
+            result.set_codes([v.code for _, v in items], [v.point for _, v in items])
+        return result
+
+    def add_words(self, words, counts, sample_ints=None):
+        """
+        Append `words` (a list of new words) with their `counts` (and optionally `sample_ints`)
+        at the end of the vocabulary. New words have empty Huffman codes.
+
+        """
+        start = len(self.word2index)
+        for index, word in enumerate(words, start=start):
+            if word in self.word2index:
+                raise ValueError("word %r already in vocabulary" % word)
+            self.word2index[word] = index
+        added = len(self.word2index) - start
+        self.counts = concatenate([self.counts, array(counts, dtype=int64).reshape(added)])
+        if sample_ints is None:
+            sample_ints = zeros(added, dtype=int64)
+        self.sample_ints = concatenate([self.sample_ints, array(sample_ints, dtype=int64).reshape(added)])
+        self.code_offsets = concatenate([self.code_offsets, self.code_offsets[-1:].repeat(added)])
+
+    def set_codes(self, codes, points):
+        """Set the Huffman codes and points of all words, from two lists of arrays indexed by word index."""
+        lengths = array([len(code) for code in codes], dtype=int64)
+        self.code_offsets = concatenate([zeros(1, dtype=int64), lengths.cumsum()])
+        self.codes = concatenate([zeros(0, dtype=uint8)] + list(codes)).astype(uint8)
+        self.points = concatenate([zeros(0, dtype=uint32)] + list(points)).astype(uint32)
+
+    def __len__(self):
+        return len(self.word2index)
+
+    def __contains__(self, word):
+        return word in self.word2index
+
+    def __iter__(self):
+        return iter(self.word2index)
+
+    def __getitem__(self, word):
+        return _VocabView(self, self.word2index[word])
+
+    def __setitem__(self, word, vocab):
+        """Update the count and sample_int of an existing word, or append a new word, from a Vocab object."""
+        if word not in self.word2index:
+            if vocab.index != len(self):
+                raise ValueError("new words must be appended at index %i, got %i" % (len(self), vocab.index))
+            self.add_words([word], [vocab.count or 0])
+        view = self[word]
+        view.count = vocab.count or 0
+        if hasattr(vocab, 'sample_int'):
+            view.sample_int = vocab.sample_int
+
+    def get(self, word, default=None):
+        return self[word] if word in self.word2index else default
+
+    def keys(self):
+        return list(self.word2index)
+
+    def values(self):
+        return [self[word] for word in self.word2index]
+
+    def items(self):
+        return [(word, self[word]) for word in self.word2index]
+
+    def iterkeys(self):
+        return iter(self.word2index)
+
+    def itervalues(self):
+        return (self[word] for word in self.word2index)
+
+    def iteritems(self):
+        return ((word, self[word]) for word in self.word2index)
+
+    def __str__(self):
+        return "%s<%i words>" % (self.__class__.__name__, len(self))
+#endclass CompactVocab
+
+
+class _VocabView(object):
+    """A single item of a `CompactVocab`, with the attributes of a Vocab object."""
+    __slots__ = ('_vocab', 'index')
+
+    def __init__(self, vocab, index):
+        self._vocab = vocab
+        self.index = index
+
+    def _get_count(self):
+        return int(self._vocab.counts[self.index])
+
+    def _set_count(self, count):
+        self._vocab.counts[self.index] = count
+
+    count = property(_get_count, _set_count)
+
+    def _get_sample_int(self):
+        return int(self._vocab.sample_ints[self.index])
+
+    def _set_sample_int(self, sample_int):
+        self._vocab.sample_ints[self.index] = sample_int
+
+    sample_int = property(_get_sample_int, _set_sample_int)
+
+    @property
+    def code(self):
+        offsets = self._vocab.code_offsets
+        return self._vocab.codes[offsets[self.index]: offsets[self.index + 1]]
+
+    @property
+    def point(self):
+        offsets = self._vocab.code_offsets
+        return self._vocab.points[offsets[self.index]: offsets[self.index + 1]]
+
+    def __lt__(self, other):
+        return self.count < other.count
+
+    def __str__(self):
+        return "Vocab(count:%r, index:%r, sample_int:%r)" % (self.count, self.index, self.sample_int)
+
+
+def scan_sentences(sentences, max_vocab_size=None, progress_per=10000):
+    """
+    Count all words appearing in `sentences`, pruning the counts whenever there are more
+    than `max_vocab_size` distinct words (see `utils.prune_vocab`).
+
+    Return a 4-tuple `(vocab, min_reduce, pruned, sentence_count)`: the counts (a defaultdict
+    of word => count), the next pruning threshold, the sum of all pruned counts, and the
+    number of sentences.
+
+    """
+    sentence_no = -1
+    pruned = 0
+    min_reduce = 1
+    vocab = defaultdict(int)
+    for sentence_no, sentence in enumerate(sentences):
+        if sentence_no % progress_per == 0:
+            logger.info("PROGRESS: at sentence #%i, processed %i words, keeping %i word types",
+                        sentence_no, sum(itervalues(vocab)) + pruned, len(vocab))
+        for word in sentence:
+            vocab[word] += 1
+
+        if max_vocab_size and len(vocab) > max_vocab_size:
+            pruned += utils.prune_vocab(vocab, min_reduce)
+            min_reduce += 1
+    return vocab, min_reduce, pruned, sentence_no + 1
+
+
+def _scan_shard(args):
+    # `scan_sentences` in a worker process, with all arguments in one tuple (for `Pool.imap`)
+    return scan_sentences(*args)
+
+
+def read_word2vec_chunks(fin, vocab_size, vector_size, binary=False, encoding='utf8', chunksize=10000):
+    """
+    Read `vocab_size` words and their vectors from `fin`, a file in the format of the
+    original C word2vec-tool, positioned right after the header line.
+
+    Yield `(words, vectors)` 2-tuples with up to `chunksize` entries each: a list of
+    unicode words and a 2d float32 array with one vector per row.
+
+    Binary files are read in large buffers and split into records by searching for
+    the space after each word, instead of reading one byte at a time. Text files are
+    read `chunksize` lines at a time, and all numbers in a chunk are parsed by a
+    single `numpy.fromstring` call.
+
+    """
+    binary_len = dtype(REAL).itemsize * vector_size
+    buf, pos = b'', 0
+    remaining = vocab_size
+    while remaining > 0:
+        count = min(chunksize, remaining)
+        if binary:
+            words, starts = [], []
+            chunk_start = pos
+            while len(words) < count:
+                end = buf.find(b' ', pos)
+                if end < 0 or end + 1 + binary_len > len(buf):
+                    # refill the buffer, keeping the records read so far in this chunk
+                    more = fin.read((binary_len + 64) * (count - len(words)))
+                    if not more:
+                        raise EOFError("unexpected end of input; is the vocabulary size %i correct?" % vocab_size)
+                    buf, shift = buf[chunk_start:] + more, chunk_start
+                    pos, chunk_start = pos - shift, 0
+                    starts = [start - shift for start in starts]
+                    continue
+                # ignore newlines in front of words (some binary files have them)
+                words.append(utils.to_unicode(buf[pos:end].lstrip(b'\n'), encoding=encoding))
+                starts.append(end + 1)
+                pos = end + 1 + binary_len
+            vectors = frombuffer(b''.join([buf[start: start + binary_len] for start in starts]), dtype=REAL)
+        else:
+            lines = [line.rstrip() for line in itertools.islice(fin, count)]
+            if len(lines) < count:
+                raise EOFError("unexpected end of input; is the vocabulary size %i correct?" % vocab_size)
+            words, values = [], []
+            for line in lines:
+                word, _, line_values = line.partition(b' ')
+                words.append(utils.to_unicode(word, encoding=encoding))
+                values.append(line_values)
+            vectors = fromstring(b' '.join(values), dtype=REAL, sep=' ')
+            if len(vectors) != count * vector_size:
+                for line_no, line_values in enumerate(values, start=vocab_size - remaining):
+                    if len(line_values.split()) != vector_size:
+                        break
+                raise ValueError("invalid vector on line %s (is this really the text format?)" % line_no)
+        remaining -= count
+        yield words, vectors.reshape(count, vector_size)
+
+
 class Word2Vec(utils.SaveLoad):
     """
     Class for training, using and evaluating neural networks described in https://code.google.com/p/word2vec/
@@ -388,7 +694,7 @@ class Word2Vec(utils.SaveLoad):
         `iter` = number of iterations (epochs) over the corpus.
 
         """
-        self.vocab = {}  # mapping from a word (string) to a Vocab object
+        self.vocab = CompactVocab()  # mapping from a word (string) to a Vocab-like item
         self.index2word = []  # map from a word's matrix index (int) to word (string)
         self.sg = int(sg)
         self.cum_table = None  # for negative sampling
@@ -434,13 +740,12 @@ class Word2Vec(utils.SaveLoad):
         vocab_size = len(self.index2word)
         self.cum_table = zeros(vocab_size, dtype=uint32)
         # compute sum of all power (Z in paper)
-        train_words_pow = float(sum([self.vocab[word].count**power for word in self.vocab]))
-        cumulative = 0.0
-        for word_index in range(vocab_size):
-            cumulative += self.vocab[self.index2word[word_index]].count**power / train_words_pow
-            self.cum_table[word_index] = round(cumulative * domain)
-        if len(self.cum_table) > 0:
-            assert self.cum_table[-1] == domain
+        word_pows = self.vocab.counts[:vocab_size].astype(float)**power
+        train_words_pow = float(word_pows.sum())
+        cumulative = word_pows.cumsum() / train_words_pow
+        self.cum_table[:] = (cumulative * domain).round()
+        if vocab_size:
+            self.cum_table[-1] = domain  # guard against round-off in the cumulative sum
 
     def create_binary_tree(self):
         """
@@ -450,62 +755,91 @@ class Word2Vec(utils.SaveLoad):
         """
         logger.info("constructing a huffman tree from %i words", len(self.vocab))
 
-        # build the huffman tree
-        heap = list(itervalues(self.vocab))
+        # build the huffman tree; inner node `i` gets index `i + len(self.vocab)`
+        vocab_size = len(self.vocab)
+        parents = empty(max(2 * vocab_size - 1, 0), dtype=int64)
+        branches = zeros(max(2 * vocab_size - 1, 0), dtype=uint8)
+        heap = [Vocab(count=count, index=index) for index, count in enumerate(self.vocab.counts.tolist())]
         heapq.heapify(heap)
-        for i in xrange(len(self.vocab) - 1):
+        for i in xrange(vocab_size - 1):
             min1, min2 = heapq.heappop(heap), heapq.heappop(heap)
-            heapq.heappush(heap, Vocab(count=min1.count + min2.count, index=i + len(self.vocab), left=min1, right=min2))
+            parents[min1.index] = parents[min2.index] = i + vocab_size
+            branches[min2.index] = 1
+            heapq.heappush(heap, Vocab(count=min1.count + min2.count, index=i + vocab_size))
 
-        # recurse over the tree, assigning a binary code to each vocabulary word
+        # walk up from all leaves at once, one tree level per step, collecting each word's
+        # path from the root (points = inner node indexes, codes = left/right branches)
         if heap:
-            max_depth, stack = 0, [(heap[0], [], [])]
-            while stack:
-                node, codes, points = stack.pop()
-                if node.index < len(self.vocab):
-                    # leaf node => store its path from the root
-                    node.code, node.point = codes, points
-                    max_depth = max(len(codes), max_depth)
-                else:
-                    # inner node => continue recursion
-                    points = array(list(points) + [node.index - len(self.vocab)], dtype=uint32)
-                    stack.append((node.left, array(list(codes) + [0], dtype=uint8), points))
-                    stack.append((node.right, array(list(codes) + [1], dtype=uint8), points))
+            parents[heap[0].index] = -1
+            words, nodes = arange(vocab_size), arange(vocab_size)
+            lengths, levels = zeros(vocab_size, dtype=int64), []
+            while len(words):
+                up = parents[nodes]
+                keep = up >= 0
+                words, nodes, up = words[keep], nodes[keep], up[keep]
+                levels.append((words, branches[nodes], up - vocab_size))
+                lengths[words] += 1
+                nodes = up
+            offsets = concatenate([zeros(1, dtype=int64), lengths.cumsum()])
+            codes, points = empty(offsets[-1], dtype=uint8), empty(offsets[-1], dtype=uint32)
+            for depth, (words, word_branches, word_points) in enumerate(levels):
+                positions = offsets[words] + lengths[words] - 1 - depth
+                codes[positions] = word_branches
+                points[positions] = word_points
+            self.vocab.code_offsets, self.vocab.codes, self.vocab.points = offsets, codes, points
+            max_depth = int(lengths.max())
 
             logger.info("built huffman tree with maximum node depth %i", max_depth)
 
-    def build_vocab(self, sentences, keep_raw_vocab=False):
+    def build_vocab(self, sentences, keep_raw_vocab=False, workers=1):
         """
         Build vocabulary from a sequence of sentences (can be a once-only generator stream).
         Each sentence must be a list of unicode strings.
 
+        With `workers` > 1, `sentences` must be a list of shards instead, counted in parallel;
+        see `scan_vocab`.
+
         """
-        self.scan_vocab(sentences)  # initial survey
+        self.scan_vocab(sentences, workers=workers)  # initial survey
         self.scale_vocab(keep_raw_vocab)  # trim by min_count & precalculate downsampling
         self.finalize_vocab()  # build tables & arrays
 
-    def scan_vocab(self, sentences, progress_per=10000):
-        """Do an initial scan of all words appearing in sentences."""
+    def scan_vocab(self, sentences, progress_per=10000, workers=1):
+        """
+        Do an initial scan of all words appearing in sentences.
+
+        With `workers` > 1, `sentences` must be a list of shards: sentence iterables that
+        together make up the corpus, such as `LineSentence(fname).shards(workers)` or one
+        `LineSentence` per input file. The shards are counted by `workers` processes
+        (so they must be picklable), each pruning its own counts to `max_vocab_size`,
+        and the counts are merged by `utils.merge_vocabs`. Unless pruning happens, the
+        counts are identical to those of a serial scan over all shards, one after another.
+
+        """
         logger.info("collecting all words and their counts")
-        sentence_no = -1
-        total_words = 0
-        min_reduce = 1
-        vocab = defaultdict(int)
-        for sentence_no, sentence in enumerate(sentences):
-            if sentence_no % progress_per == 0:
-                logger.info("PROGRESS: at sentence #%i, processed %i words, keeping %i word types",
-                            sentence_no, sum(itervalues(vocab)) + total_words, len(vocab))
-            for word in sentence:
-                vocab[word] += 1
+        if workers > 1:
+            totals = [0, 0]  # raw words, sentences
 
-            if self.max_vocab_size and len(vocab) > self.max_vocab_size:
-                total_words += utils.prune_vocab(vocab, min_reduce)
-                min_reduce += 1
+            def shard_counts(results):
+                # merge the shard counts as they arrive (in order), rather than all at once at the end
+                for shard_vocab, min_reduce, pruned, shard_count in results:
+                    totals[0] += sum(itervalues(shard_vocab)) + pruned
+                    totals[1] += shard_count
+                    yield shard_vocab, min_reduce
 
-        total_words += sum(itervalues(vocab))
+            pool = multiprocessing.Pool(min(workers, len(sentences)))
+            try:
+                results = pool.imap(_scan_shard, [(shard, self.max_vocab_size, progress_per) for shard in sentences])
+                vocab, _, _ = utils.merge_vocabs(shard_counts(results), self.max_vocab_size)
+            finally:
+                pool.terminate()
+            total_words, sentence_count = totals
+        else:
+            vocab, _, total_words, sentence_count = scan_sentences(sentences, self.max_vocab_size, progress_per)
+            total_words += sum(itervalues(vocab))
         logger.info("collected %i word types from a corpus of %i raw words and %i sentences",
-                    len(vocab), total_words, sentence_no + 1)
-        self.corpus_count = sentence_no + 1
+                    len(vocab), total_words, sentence_count)
+        self.corpus_count = sentence_count
         self.raw_vocab = vocab
 
     def scale_vocab(self, min_count=None, sample=None, dry_run=False, keep_raw_vocab=False):
@@ -531,7 +865,7 @@ class Word2Vec(utils.SaveLoad):
             # make stored settings match these applied settings
             self.min_count = min_count
             self.sample = sample
-            self.vocab = {}
+            self.vocab = CompactVocab()
         drop_unique, drop_total, retain_total, original_total = 0, 0, 0, 0
         retain_words = []
         for word, v in iteritems(self.raw_vocab):
@@ -540,7 +874,6 @@ class Word2Vec(utils.SaveLoad):
                 retain_total += v
                 original_total += v
                 if not dry_run:
-                    self.vocab[word] = Vocab(count=v, index=len(self.index2word))
                     self.index2word.append(word)
             else:
                 drop_unique += 1
@@ -563,6 +896,7 @@ class Word2Vec(utils.SaveLoad):
             threshold_count = int(sample * (3 + sqrt(5)) / 2)
 
         downsample_total, downsample_unique = 0, 0
+        sample_ints = []
         for w in retain_words:
             v = self.raw_vocab[w]
             word_probability = (sqrt(v / threshold_count) + 1) * (threshold_count / v)
@@ -572,8 +906,9 @@ class Word2Vec(utils.SaveLoad):
             else:
                 word_probability = 1.0
                 downsample_total += v
-            if not dry_run:
-                self.vocab[w].sample_int = int(round(word_probability * 2**32))
+            sample_ints.append(int(round(word_probability * 2**32)))
+        if not dry_run:
+            self.vocab.add_words(retain_words, [self.raw_vocab[w] for w in retain_words], sample_ints)
 
         if not dry_run and not keep_raw_vocab:
             logger.info("deleting the raw counts dictionary of %i items", len(self.raw_vocab))
@@ -605,10 +940,9 @@ class Word2Vec(utils.SaveLoad):
         if self.null_word:
             # create null pseudo-word for padding when using concatenative L1 (run-of-words)
             # this word is only ever input – never predicted – so count, huffman-point, etc doesn't matter
-            word, v = '\0', Vocab(count=1, sample_int=0)
-            v.index = len(self.vocab)
+            word = '\0'
             self.index2word.append(word)
-            self.vocab[word] = v
+            self.vocab.add_words([word], [1], [0])
         # set initial input/projection and hidden weights
         self.reset_weights()
 
@@ -623,16 +957,23 @@ class Word2Vec(utils.SaveLoad):
         self.corpus_count = other_model.corpus_count
         self.reset_weights()
 
+    def _prepare_job(self, items):
+        """
+        Convert a job (a list of sentences) to the form `_do_train_job()` expects: the arrays
+        of word indexes of `sentence_indexes()`, plus the raw word count. Called from the
+        worker threads, before the job's learning rate is computed.
+
+        """
+        indexes, offsets = sentence_indexes(self, items)
+        return indexes, offsets, self._raw_word_count(items)
+
     def _do_train_job(self, job, alpha, inits):
         work, neu1 = inits
-        tally = 0
-        raw_tally = 0
-        for sentence in job:
-            if self.sg:
-                tally += train_sentence_sg(self, sentence, alpha, work)
-            else:
-                tally += train_sentence_cbow(self, sentence, alpha, work, neu1)
-            raw_tally += len(sentence)
+        indexes, offsets, raw_tally = job
+        if self.sg:
+            tally = train_batch_sg(self, indexes, offsets, alpha, work)
+        else:
+            tally = train_batch_cbow(self, indexes, offsets, alpha, work, neu1)
         return (tally, raw_tally)
 
     def _raw_word_count(self, items):
@@ -647,6 +988,14 @@ class Word2Vec(utils.SaveLoad):
         (count of sentences) or total_words (count of raw words in sentences) should be provided, unless the
         sentences are the same as those that were used to initially build the vocabulary.
 
+        The worker threads pull jobs of `chunksize` sentences from the input themselves; there is
+        no producer thread and no job queue. If `sentences` is a list (or tuple), each worker trains
+        on its own share of the jobs (every `workers`-th job), without any synchronization. Any other
+        iterable is shared, and the workers take turns reading the next job from it. Each worker
+        converts its jobs to arrays of word indexes and trains on them without holding the GIL. The
+        learning rate of each job is computed from a progress counter shared by all workers.
+        `queue_factor` is ignored (kept for backward compatibility).
+
         """
         if FAST_VERSION < 0:
             import warnings
@@ -676,107 +1025,104 @@ class Word2Vec(utils.SaveLoad):
             else:
                 raise ValueError("you must provide either total_words or total_examples, to enable alpha and progress calculations")
 
+        sharded = isinstance(sentences, (list, tuple))
         if self.iter > 1:
-            sentences = utils.RepeatCorpusNTimes(sentences, self.iter)
+            if not sharded:
+                sentences = utils.RepeatCorpusNTimes(sentences, self.iter)
             total_words = total_words and total_words * self.iter
             total_examples = total_examples and total_examples * self.iter
+        num_workers = max(1, self.workers)  # with workers=0, train in the calling thread
+        shared_jobs = None if sharded else utils.grouper(sentences, chunksize)
+        source_lock = threading.Lock()  # serializes reading from `shared_jobs`
+        progress_lock = threading.Lock()  # guards `progress`
+        progress = {
+            'pushed_examples': 0, 'pushed_words': 0,  # jobs started
+            'examples': 0, 'trained_words': 0, 'raw_words': word_count,  # jobs finished
+        }
+        errors = []
+
+        def job_source(worker_no):
+            """Yield the jobs (lists of sentences) of worker `worker_no`."""
+            if sharded:
+                for _ in xrange(self.iter):
+                    for start in xrange(worker_no * chunksize, len(sentences), num_workers * chunksize):
+                        yield sentences[start: start + chunksize]
+            else:
+                while not errors:
+                    with source_lock:
+                        items = next(shared_jobs, None)
+                    if items is None:
+                        break
+                    yield items
+
+        def job_alpha(items):
+            """Return the learning rate for the job `items`, and count the job as started."""
+            with progress_lock:
+                if total_examples:
+                    # examples-based decay
+                    done = progress['pushed_examples'] / total_examples
+                    progress['pushed_examples'] += len(items)
+                else:
+                    # words-based decay
+                    done = progress['pushed_words'] / total_words
+                    progress['pushed_words'] += self._raw_word_count(items)
+            return max(self.min_alpha, self.alpha - (self.alpha - self.min_alpha) * done)
 
         def worker_init():
             work = matutils.zeros_aligned(self.layer1_size, dtype=REAL)  # per-thread private work memory
             neu1 = matutils.zeros_aligned(self.layer1_size, dtype=REAL)
             return (work, neu1)
 
-        def worker_one_job(job, inits):
-            items, alpha = job
-            if items is None:  # signal to finish
-                return False
-            # train & return tally
-            tally, raw_tally = self._do_train_job(items, alpha, inits)
-            progress_queue.put((len(items), tally, raw_tally))  # report progress
-            return True
-
-        def worker_loop():
-            """Train the model, lifting lists of sentences from the jobs queue."""
-            init = worker_init()
-            while True:
-                job = job_queue.get()
-                if not worker_one_job(job, init):
-                    break
+        def worker_loop(worker_no):
+            """Train the model on the jobs of worker `worker_no`."""
+            try:
+                inits = worker_init()
+                for items in job_source(worker_no):
+                    if errors:
+                        break  # another worker failed
+                    job = self._prepare_job(items)
+                    alpha = job_alpha(items)
+                    tally, raw_tally = self._do_train_job(job, alpha, inits)
+                    with progress_lock:
+                        progress['examples'] += len(items)
+                        progress['trained_words'] += tally  # only words in vocab & sampled
+                        progress['raw_words'] += raw_tally
+            except Exception:
+                errors.append(sys.exc_info())
+
+        def log_progress(elapsed):
+            if total_examples:
+                # examples-based progress %
+                logger.info(
+                    "PROGRESS: at %.2f%% examples, %.0f words/s",
+                    100.0 * progress['examples'] / total_examples, progress['trained_words'] / elapsed)
+            else:
+                # words-based progress %
+                logger.info(
+                    "PROGRESS: at %.2f%% words, %.0f words/s",
+                    100.0 * progress['raw_words'] / total_words, progress['trained_words'] / elapsed)
 
         start, next_report = default_timer(), 1.0
-
-        # buffer ahead only a limited number of jobs.. this is the reason we can't simply use ThreadPool :(
         if self.workers > 0:
-            job_queue = Queue(maxsize=queue_factor * self.workers)
-        else:
-            job_queue = FakeJobQueue(worker_init, worker_one_job)
-        progress_queue = Queue(maxsize=(queue_factor + 1) * self.workers)
-
-        workers = [threading.Thread(target=worker_loop) for _ in xrange(self.workers)]
-        for thread in workers:
-            thread.daemon = True  # make interrupting the process with ctrl+c easier
-            thread.start()
-
-        pushed_words = 0
-        pushed_examples = 0
-        example_count = 0
-        trained_word_count = 0
-        raw_word_count = word_count
-        push_done = False
-        done_jobs = 0
-        next_alpha = self.alpha
-        jobs_source = enumerate(utils.grouper(sentences, chunksize))
-        # fill jobs queue with (sentence, alpha) job tuples
-        while True:
-            try:
-                job_no, items = next(jobs_source)
-                logger.debug("putting job #%i in the queue at alpha %.05f", job_no, next_alpha)
-                job_queue.put((items, next_alpha))
-                # update the learning rate before every next job
-                if self.min_alpha < next_alpha:
-                    if total_examples:
-                        # examples-based decay
-                        pushed_examples += len(items)
-                        next_alpha = self.alpha - (self.alpha - self.min_alpha) * (pushed_examples / total_examples)
-                    else:
-                        # words-based decay
-                        pushed_words += self._raw_word_count(items)
-                        next_alpha = self.alpha - (self.alpha - self.min_alpha) * (pushed_words / total_words)
-                    next_alpha = max(next_alpha, self.min_alpha)
-            except StopIteration:
-                logger.info(
-                    "reached end of input; waiting to finish %i outstanding jobs",
-                    job_no - done_jobs + 1)
-                for _ in xrange(self.workers):
-                    job_queue.put((None, 0))  # give the workers heads up that they can finish -- no more work!
-                push_done = True
-            try:
-                while done_jobs < (job_no+1) or not push_done:
-                    examples, trained_words, raw_words = progress_queue.get(push_done)  # only block after all jobs pushed
-                    example_count += examples
-                    trained_word_count += trained_words  # only words in vocab & sampled
-                    raw_word_count += raw_words
-                    done_jobs += 1
+            workers = [threading.Thread(target=worker_loop, args=(worker_no,)) for worker_no in xrange(self.workers)]
+            for thread in workers:
+                thread.daemon = True  # make interrupting the process with ctrl+c easier
+                thread.start()
+            for thread in workers:
+                while thread.is_alive():
+                    thread.join(report_delay)
                     elapsed = default_timer() - start
                     if elapsed >= next_report:
-                        if total_examples:
-                            # examples-based progress %
-                            logger.info(
-                                "PROGRESS: at %.2f%% examples, %.0f words/s",
-                                100.0 * example_count / total_examples, trained_word_count / elapsed)
-                        else:
-                            # words-based progress %
-                            logger.info(
-                                "PROGRESS: at %.2f%% words, %.0f words/s",
-                                100.0 * raw_word_count / total_words, trained_word_count / elapsed)
+                        log_progress(elapsed)
                         next_report = elapsed + report_delay  # don't flood log, wait report_delay seconds
-                else:
-                    # loop ended by job count; really done
-                    break
-            except Empty:
-                pass  # already out of loop; continue to next push
+        else:
+            worker_loop(0)
+        if errors:
+            reraise(*errors[0])
 
         elapsed = default_timer() - start
+        example_count, trained_word_count, raw_word_count = \
+            progress['examples'], progress['trained_words'], progress['raw_words']
         logger.info(
             "training on %i raw words took %.1fs, %.0f trained words/s",
             raw_word_count, elapsed, trained_word_count / elapsed if elapsed else 0.0)
@@ -791,15 +1137,23 @@ class Word2Vec(utils.SaveLoad):
         self.clear_sims()
         return trained_word_count
 
-    def _score_job_words(self, sentence, inits):
+    def _score_job(self, sentences, scores, inits):
         work, neu1 = inits
         if self.sg:
-            return score_sentence_sg(self, sentence, work)
+            score_sentences_sg(self, sentences, work, scores)
         else:
-            return score_sentence_cbow(self, sentence, work, neu1)
+            score_sentences_cbow(self, sentences, work, neu1, scores)
+
+    def _score_output(self, out, num_sentences):
+        """Return `out` checked to be usable as the scores array, or a new array of `num_sentences`."""
+        if out is None:
+            return matutils.zeros_aligned(num_sentences, dtype=REAL)
+        if out.dtype != REAL or out.ndim != 1 or not out.flags.c_contiguous or not out.flags.writeable:
+            raise ValueError("out must be a writeable, contiguous 1d array of %s" % dtype(REAL))
+        return out
 
     # basics copied from the train() function
-    def score(self, sentences, total_sentences=int(1e9), chunksize=100, queue_factor=2, report_delay=1):
+    def score(self, sentences, total_sentences=int(1e9), chunksize=100, queue_factor=2, report_delay=1, out=None):
         """
         Score the log probability for a sequence of sentences (can be a once-only generator stream).
         Each sentence must be a list of unicode strings.
@@ -807,6 +1161,13 @@ class Word2Vec(utils.SaveLoad):
 
         Note that you should specify total_sentences; we'll run into problems if you ask to score more than the default
 
+        If `out` is given (a contiguous 1d array of REAL), the scores are written into it directly,
+        and `total_sentences` defaults to its length.
+
+        Scores are available for both hierarchical softmax and negative sampling models (for which
+        the negative samples are drawn from the same random seed for every sentence, so that
+        scoring is deterministic). For an in-memory list of sentences, `score_batch()` is faster.
+
         See the article by Taddy [taddy]_ for examples of how to use such scores in document classification.
 
         .. [taddy] Taddy, Matt.  Document Classification by Inversion of Distributed Language Representations, in Proceedings of the 2015 Conference of the Association of Computational Linguistics.
@@ -825,26 +1186,26 @@ class Word2Vec(utils.SaveLoad):
         if not self.vocab:
             raise RuntimeError("you must first build vocabulary before scoring new data")
 
-        if not self.hs:
-            raise RuntimeError("we have only implemented score for hs")
+        if out is not None:
+            total_sentences = len(out)
+        sentence_scores = self._score_output(out, total_sentences)
 
         def worker_init():
-            work = zeros(1, dtype=REAL)  # for sg hs, we actually only need one memory loc (running sum)
+            work = zeros(1, dtype=REAL)  # for sg, we actually only need one memory loc (running sum)
             neu1 = matutils.zeros_aligned(self.layer1_size, dtype=REAL)
             return (work, neu1)
 
         def worker_one_job(job, inits):
-            if job is None:  # signal to finish
+            start_id, items = job
+            if items is None:  # signal to finish
                 return False
-            ns = 0
-            for (id, sentence) in job:
-                sentence_scores[id] = self._score_job_words(sentence, inits)
-                ns += 1
-            progress_queue.put(ns)  # report progress
+            # write the scores straight into the output array (slices of it are views)
+            self._score_job(items, sentence_scores[start_id: start_id + len(items)], inits)
+            progress_queue.put(len(items))  # report progress
             return True
 
         def worker_loop():
-            """Train the model, lifting lists of sentences from the jobs queue."""
+            """Score lists of sentences from the jobs queue."""
             init = worker_init()
             while True:
                 job = job_queue.get()
@@ -865,24 +1226,26 @@ class Word2Vec(utils.SaveLoad):
             thread.start()
 
         sentence_count = 0
-        sentence_scores = matutils.zeros_aligned(total_sentences, dtype=REAL)
-
+        pushed_sentences = 0
         push_done = False
         done_jobs = 0
-        jobs_source = enumerate(utils.grouper(enumerate(sentences), chunksize))
+        jobs_source = enumerate(utils.grouper(sentences, chunksize))
 
-        # fill jobs queue with (id, sentence) job items
+        # fill jobs queue with (first sentence id, sentences) jobs
         while True:
             try:
                 job_no, items = next(jobs_source)
+                if pushed_sentences + len(items) > total_sentences:
+                    raise ValueError("more than total_sentences=%i sentences to score" % total_sentences)
                 logger.debug("putting job #%i in the queue", job_no)
-                job_queue.put(items)
+                job_queue.put((pushed_sentences, items))
+                pushed_sentences += len(items)
             except StopIteration:
                 logger.info(
                     "reached end of input; waiting to finish %i outstanding jobs",
                     job_no - done_jobs + 1)
                 for _ in xrange(self.workers):
-                    job_queue.put(None)  # give the workers heads up that they can finish -- no more work!
+                    job_queue.put((0, None))  # give the workers heads up that they can finish -- no more work!
                 push_done = True
             try:
                 while done_jobs < (job_no+1) or not push_done:
@@ -893,7 +1256,7 @@ class Word2Vec(utils.SaveLoad):
                     if elapsed >= next_report:
                         logger.info(
                                 "PROGRESS: at %.2f%% sentences, %.0f sentences/s",
-                                100.0 * sentence_count, sentence_count / elapsed)
+                                100.0 * sentence_count / total_sentences, sentence_count / elapsed)
                         next_report = elapsed + report_delay  # don't flood log, wait report_delay seconds
                 else:
                     # loop ended by job count; really done
@@ -907,6 +1270,54 @@ class Word2Vec(utils.SaveLoad):
                     % (sentence_count, elapsed, sentence_count / elapsed if elapsed else 0.0))
         return sentence_scores[:sentence_count]
 
+    def score_batch(self, sentences, out=None):
+        """
+        Score the log probability of each sentence in `sentences`, an in-memory list of
+        sentences (lists of unicode strings), like `score()`.
+
+        The list is split into one contiguous slice per worker thread, and each worker scores
+        its whole slice in a single call, without holding the GIL; there is no job queue.
+        This is much faster than `score()` for many short sentences.
+
+        The scores are written into `out` if given (a contiguous 1d array of REAL, of
+        the same length as `sentences`), otherwise into a new array. Return the scores.
+
+        """
+        if not self.vocab:
+            raise RuntimeError("you must first build vocabulary before scoring new data")
+        scores = self._score_output(out, len(sentences))
+        if len(scores) != len(sentences):
+            raise ValueError("out has length %i, expected %i" % (len(scores), len(sentences)))
+
+        def worker_init():
+            work = zeros(1, dtype=REAL)
+            neu1 = matutils.zeros_aligned(self.layer1_size, dtype=REAL)
+            return (work, neu1)
+
+        num_workers = max(1, min(self.workers, len(sentences)))
+        bounds = [len(sentences) * worker_no // num_workers for worker_no in xrange(num_workers + 1)]
+        jobs = [(sentences[start: end], scores[start: end]) for start, end in zip(bounds, bounds[1:])]
+        errors = []  # exc_info of failed workers, re-raised in the calling thread
+
+        def worker_loop(job_sentences, job_scores):
+            try:
+                self._score_job(job_sentences, job_scores, worker_init())
+            except Exception:
+                errors.append(sys.exc_info())
+
+        if num_workers == 1:
+            self._score_job(jobs[0][0], jobs[0][1], worker_init())
+        else:
+            workers = [threading.Thread(target=worker_loop, args=job) for job in jobs]
+            for thread in workers:
+                thread.daemon = True  # make interrupting the process with ctrl+c easier
+                thread.start()
+            for thread in workers:
+                thread.join()
+        if errors:
+            reraise(*errors[0])
+        return scores
+
     def clear_sims(self):
         self.syn0norm = None
 
@@ -956,7 +1367,8 @@ class Word2Vec(utils.SaveLoad):
                     fout.write(utils.to_utf8("%s %s\n" % (word, ' '.join("%f" % val for val in row))))
 
     @classmethod
-    def load_word2vec_format(cls, fname, fvocab=None, binary=False, norm_only=True, encoding='utf8'):
+    def load_word2vec_format(cls, fname, fvocab=None, binary=False, norm_only=True, encoding='utf8',
+                             limit=None, datatype=REAL, mapfile_path=None):
         """
         Load the input-hidden weight matrix from the original C word2vec-tool format.
 
@@ -972,6 +1384,16 @@ class Word2Vec(utils.SaveLoad):
         If you trained the C model using non-utf8 encoding for words, specify that
         encoding in `encoding`.
 
+        `limit` sets a maximum number of word vectors to read from the file (the first,
+        most frequent words). The default, None, means read all.
+
+        `datatype` is the dtype of the stored vectors, e.g. `numpy.float16` to halve
+        the memory needed, at the cost of precision (and of slower similarity queries).
+
+        If `mapfile_path` is set, the vectors are loaded into a new memory-mapped file of
+        that name instead of RAM, so that vector sets larger than RAM can be loaded (and
+        normalized in place, with `norm_only`).
+
         """
         counts = None
         if fvocab is not None:
@@ -986,45 +1408,24 @@ class Word2Vec(utils.SaveLoad):
         with utils.smart_open(fname) as fin:
             header = utils.to_unicode(fin.readline(), encoding=encoding)
             vocab_size, vector_size = map(int, header.split())  # throws for invalid file format
+            if limit:
+                vocab_size = min(vocab_size, limit)
             result = Word2Vec(size=vector_size)
-            result.syn0 = zeros((vocab_size, vector_size), dtype=REAL)
-            if binary:
-                binary_len = dtype(REAL).itemsize * vector_size
-                for line_no in xrange(vocab_size):
-                    # mixed text and binary: read text first, then binary
-                    word = []
-                    while True:
-                        ch = fin.read(1)
-                        if ch == b' ':
-                            break
-                        if ch != b'\n':  # ignore newlines in front of words (some binary files have)
-
-                            word.append(ch)
-                    word = utils.to_unicode(b''.join(word), encoding=encoding)
-                    if counts is None:
-                        result.vocab[word] = Vocab(index=line_no, count=vocab_size - line_no)
-                    elif word in counts:
-                        result.vocab[word] = Vocab(index=line_no, count=counts[word])
-                    else:
-                        logger.warning("vocabulary file is incomplete")
-                        result.vocab[word] = Vocab(index=line_no, count=None)
-                    result.index2word.append(word)
-                    result.syn0[line_no] = fromstring(fin.read(binary_len), dtype=REAL)
+            if mapfile_path:
+                result.syn0 = np_memmap(mapfile_path, dtype=datatype, mode='w+', shape=(vocab_size, vector_size))
             else:
-                for line_no, line in enumerate(fin):
-                    parts = utils.to_unicode(line.rstrip(), encoding=encoding).split(" ")
-                    if len(parts) != vector_size + 1:
-                        raise ValueError("invalid vector on line %s (is this really the text format?)" % (line_no))
-                    word, weights = parts[0], list(map(REAL, parts[1:]))
-                    if counts is None:
-                        result.vocab[word] = Vocab(index=line_no, count=vocab_size - line_no)
-                    elif word in counts:
-                        result.vocab[word] = Vocab(index=line_no, count=counts[word])
-                    else:
-                        logger.warning("vocabulary file is incomplete")
-                        result.vocab[word] = Vocab(index=line_no, count=None)
-                    result.index2word.append(word)
-                    result.syn0[line_no] = weights
+                result.syn0 = zeros((vocab_size, vector_size), dtype=datatype)
+            for words, vectors in read_word2vec_chunks(fin, vocab_size, vector_size, binary, encoding):
+                result.syn0[len(result.index2word): len(result.index2word) + len(words)] = vectors
+                result.index2word.extend(words)
+        if counts is None:
+            word_counts = arange(vocab_size, 0, -1)
+        else:
+            word_counts = [counts.get(word, 0) for word in result.index2word]
+            missing = sum(1 for word in result.index2word if word not in counts)
+            if missing:
+                logger.warning("vocabulary file is incomplete: %i words have no count", missing)
+        result.vocab.add_words(result.index2word, word_counts)
         logger.info("loaded %s matrix from %s" % (result.syn0.shape, fname))
         result.init_sims(norm_only)
         return result
@@ -1046,35 +1447,16 @@ class Word2Vec(utils.SaveLoad):
             if not vector_size == self.vector_size:
                 raise ValueError("incompatible vector size %d in file %s" % (vector_size, fname))
                 # TOCONSIDER: maybe mismatched vectors still useful enough to merge (truncating/padding)?
-            if binary:
-                binary_len = dtype(REAL).itemsize * vector_size
-                for line_no in xrange(vocab_size):
-                    # mixed text and binary: read text first, then binary
-                    word = []
-                    while True:
-                        ch = fin.read(1)
-                        if ch == b' ':
-                            break
-                        if ch != b'\n':  # ignore newlines in front of words (some binary files have)
-                            word.append(ch)
-                    word = utils.to_unicode(b''.join(word), encoding=encoding)
-                    weights = fromstring(fin.read(binary_len), dtype=REAL)
-                    if word in self.vocab:
-                        overlap_count += 1
-                        self.syn0[self.vocab[word].index] = weights
-                        self.syn0_lockf[self.vocab[word].index] = 0.0  # lock it
-            else:
-                for line_no, line in enumerate(fin):
-                    parts = utils.to_unicode(line.rstrip(), encoding=encoding).split(" ")
-                    if len(parts) != vector_size + 1:
-                        raise ValueError("invalid vector on line %s (is this really the text format?)" % (line_no))
-                    word, weights = parts[0], list(map(REAL, parts[1:]))
-                    if word in self.vocab:
-                        overlap_count += 1
-                        self.syn0[self.vocab[word].index] = weights
+            for words, vectors in read_word2vec_chunks(fin, vocab_size, vector_size, binary, encoding):
+                found = [(pos, self.vocab.word2index[word]) for pos, word in enumerate(words) if word in self.vocab]
+                if found:
+                    positions, indexes = zip(*found)
+                    self.syn0[list(indexes)] = vectors[list(positions)]
+                    self.syn0_lockf[list(indexes)] = 0.0  # lock them
+                    overlap_count += len(found)
         logger.info("merged %d vectors into %s matrix from %s" % (overlap_count, self.syn0.shape, fname))
 
-    def most_similar(self, positive=[], negative=[], topn=10):
+    def most_similar(self, positive=[], negative=[], topn=10, indexer=None):
         """
         Find the top-N most similar words. Positive words contribute positively towards the
         similarity, negative words negatively.
@@ -1086,6 +1468,10 @@ class Word2Vec(utils.SaveLoad):
 
         If topn is False, most_similar returns the vector of similarity scores.
 
+        If `indexer` is given (e.g. a `gensim.similarities.index.RandomProjectionIndexer`
+        built over this model), the most similar words are looked up approximately
+        through the indexer, instead of comparing against every word in the vocabulary.
+
         Example::
 
           >>> trained_model.most_similar(positive=['woman', 'king'], negative=['man'])
@@ -1093,7 +1479,28 @@ class Word2Vec(utils.SaveLoad):
 
         """
         self.init_sims()
+        mean, all_words = self._query_vector(positive, negative)
+
+        if indexer is not None and topn:
+            best = indexer.most_similar(mean, topn + len(all_words))
+            # ignore (don't return) words from the input
+            result = [(self.index2word[sim], dist) for sim, dist in best if sim not in all_words]
+            return result[:topn]
 
+        dists = dot(self.syn0norm, mean)
+        if not topn:
+            return dists
+        # ignore (don't return) words from the input
+        best = topk.argtopk(dists, topn=topn, reverse=True, exclude=all_words)
+        return [(self.index2word[sim], float(dists[sim])) for sim in best]
+
+    def _query_vector(self, positive=[], negative=[]):
+        """
+        Return the unit-length weighted mean of the `positive` and `negative` words
+        or vectors (as accepted by `most_similar()`), plus the set of vocabulary
+        indexes of the input words.
+
+        """
         if isinstance(positive, string_types) and not negative:
             # allow calls like most_similar('dog'), as a shorthand for most_similar(['dog'])
             positive = [positive]
@@ -1120,15 +1527,61 @@ class Word2Vec(utils.SaveLoad):
                 raise KeyError("word '%s' not in vocabulary" % word)
         if not mean:
             raise ValueError("cannot compute similarity with no input")
-        mean = matutils.unitvec(array(mean).mean(axis=0)).astype(REAL)
+        return matutils.unitvec(array(mean).mean(axis=0)).astype(REAL), all_words
 
-        dists = dot(self.syn0norm, mean)
-        if not topn:
-            return dists
-        best = matutils.argsort(dists, topn=topn + len(all_words), reverse=True)
-        # ignore (don't return) words from the input
-        result = [(self.index2word[sim], float(dists[sim])) for sim in best if sim not in all_words]
-        return result[:topn]
+    @staticmethod
+    def _most_similar_rows(means, ignores, vectors, topn, blocksize=65536):
+        """
+        For each row of `means`, find the `topn` rows of `vectors` with the highest dot
+        product, skipping the rows listed in the matching set of `ignores`.
+
+        `vectors` is processed in blocks of `blocksize` rows, with one matrix product
+        (level 3 BLAS) per block; only the best `topn` candidates of each block are kept
+        (`topk.topk_rows`), and merged across blocks by `topk.merge_blocks`.
+
+        Return a 2-tuple of (positions, similarities), both `len(means) x topn` arrays
+        ordered most similar first. Ignored rows (if there were not enough others to fill
+        `topn`) come last, with similarity -inf.
+
+        """
+        def blocks():
+            for start in xrange(0, len(vectors), blocksize):
+                sims = dot(means, vectors[start: start + blocksize].T)
+                end = start + sims.shape[1]
+                exclude = [[pos - start for pos in ignore if start <= pos < end] for ignore in ignores]
+                yield start, topk.topk_rows(sims, topn, reverse=True, exclude=exclude)
+
+        return topk.merge_blocks(blocks(), topn, reverse=True)
+
+    def most_similar_batch(self, queries, topn=10, chunksize=256):
+        """
+        Find the top-N most similar words for many queries at once. `queries` is a sequence
+        of `(positive, negative)` 2-tuples, each with the same meaning as the `positive` and
+        `negative` arguments of `most_similar()`.
+
+        Return a list with one result per query, in the format of `most_similar()`.
+
+        The similarities of `chunksize` queries are computed together, by matrix-matrix
+        multiplication against the normalized vectors, which is much faster than calling
+        `most_similar()` for each query in turn.
+
+        Example::
+
+          >>> trained_model.most_similar_batch([(['woman', 'king'], ['man']), (['paris', 'germany'], ['france'])], topn=1)
+          [[('queen', 0.50882536)], [('berlin', 0.72001958)]]
+
+        """
+        self.init_sims()
+        result = []
+        for chunk in utils.grouper(queries, chunksize):
+            means, ignores = zip(*[self._query_vector(positive, negative) for positive, negative in chunk])
+            positions, sims = self._most_similar_rows(array(means), ignores, self.syn0norm, topn)
+            for row_positions, row_sims, ignore in zip(positions, sims, ignores):
+                # ignore (don't return) words from the input
+                result.append([
+                    (self.index2word[sim], float(dist))
+                    for sim, dist in zip(row_positions, row_sims) if sim not in ignore])
+        return result
 
     def most_similar_cosmul(self, positive=[], negative=[], topn=10):
         """
@@ -1182,10 +1635,9 @@ class Word2Vec(utils.SaveLoad):
 
         if not topn:
             return dists
-        best = matutils.argsort(dists, topn=topn + len(all_words), reverse=True)
         # ignore (don't return) words from the input
-        result = [(self.index2word[sim], float(dists[sim])) for sim in best if sim not in all_words]
-        return result[:topn]
+        best = topk.argtopk(dists, topn=topn, reverse=True, exclude=all_words)
+        return [(self.index2word[sim], float(dists[sim])) for sim in best]
 
     def doesnt_match(self, words):
         """
@@ -1275,7 +1727,7 @@ class Word2Vec(utils.SaveLoad):
         v2 = [self[word] for word in ws2]
         return dot(matutils.unitvec(array(v1).mean(axis=0)), matutils.unitvec(array(v2).mean(axis=0)))
 
-    def init_sims(self, replace=False):
+    def init_sims(self, replace=False, mapfile_path=None, blocksize=65536, workers=1):
         """
         Precompute L2-normalized vectors.
 
@@ -1285,23 +1737,32 @@ class Word2Vec(utils.SaveLoad):
         Note that you **cannot continue training** after doing a replace. The model becomes
         effectively read-only = you can call `most_similar`, `similarity` etc., but not `train`.
 
+        Otherwise, if `mapfile_path` is set, the normalized vectors are written into a new
+        memory-mapped file of that name, rather than into RAM. Together with a model loaded
+        with `mmap='r'`, this allows similarity queries over vector sets larger than RAM.
+
+        The vectors are normalized `blocksize` rows at a time, by `workers` threads
+        (see `matutils.unitvec_rows`).
+
         """
         if getattr(self, 'syn0norm', None) is None or replace:
             logger.info("precomputing L2-norms of word weight vectors")
             if replace:
-                for i in xrange(self.syn0.shape[0]):
-                    self.syn0[i, :] /= sqrt((self.syn0[i, :] ** 2).sum(-1))
-                self.syn0norm = self.syn0
+                self.syn0norm = matutils.unitvec_rows(self.syn0, out=self.syn0, blocksize=blocksize, workers=workers)
                 if hasattr(self, 'syn1'):
                     del self.syn1
             else:
-                self.syn0norm = (self.syn0 / sqrt((self.syn0 ** 2).sum(-1))[..., newaxis]).astype(REAL)
+                if mapfile_path:
+                    out = np_memmap(mapfile_path, dtype=self.syn0.dtype, mode='w+', shape=self.syn0.shape)
+                else:
+                    out = empty(self.syn0.shape, dtype=self.syn0.dtype)
+                self.syn0norm = matutils.unitvec_rows(self.syn0, out=out, blocksize=blocksize, workers=workers)
 
     def estimate_memory(self, vocab_size=None, report=None):
         """Estimate required memory for a model using current settings and provided vocabulary size."""
         vocab_size = vocab_size or len(self.vocab)
         report = report or {}
-        report['vocab'] = vocab_size * (700 if self.hs else 500)
+        report['vocab'] = vocab_size * (250 if self.hs else 150)
         report['syn0'] = vocab_size * self.vector_size * dtype(REAL).itemsize
         if self.hs:
             report['syn1'] = vocab_size * self.layer1_size * dtype(REAL).itemsize
@@ -1320,7 +1781,7 @@ class Word2Vec(utils.SaveLoad):
                         (section['section'], 100.0 * correct / (correct + incorrect),
                          correct, correct + incorrect))
 
-    def accuracy(self, questions, restrict_vocab=30000, most_similar=most_similar):
+    def accuracy(self, questions, restrict_vocab=30000, most_similar=None, chunksize=256):
         """
         Compute accuracy of the model. `questions` is a filename where lines are
         4-tuples of words, split into sections by ": SECTION NAME" lines.
@@ -1332,23 +1793,66 @@ class Word2Vec(utils.SaveLoad):
         Use `restrict_vocab` to ignore all questions containing a word whose frequency
         is not in the top-N most frequent words (default top 30,000).
 
+        By default, `chunksize` questions are evaluated at once, with matrix-matrix
+        multiplications (see `most_similar_batch()`). Pass a different `most_similar`
+        function (e.g. `Word2Vec.most_similar_cosmul`) to score the questions with it
+        instead, one question at a time.
+
         This method corresponds to the `compute-accuracy` script of the original C word2vec.
 
         """
+        self.init_sims()
         ok_vocab = dict(sorted(iteritems(self.vocab),
                                key=lambda item: -item[1].count)[:restrict_vocab])
         ok_index = set(v.index for v in itervalues(ok_vocab))
+        ok_indices = array(sorted(ok_index), dtype=int)
+        ok_vectors = self.syn0norm[ok_indices]
+        ok_position = dict((index, position) for position, index in enumerate(ok_indices))
+
+        def predict_batch(chunk):
+            # the most similar word among `ok_vocab` for each question, ignoring the input words
+            means, ignores = [], []
+            for a, b, c, expected in chunk:
+                mean, ignore = self._query_vector(positive=[b, c], negative=[a])
+                means.append(mean)
+                ignores.append([ok_position[index] for index in ignore])
+            positions, sims = self._most_similar_rows(array(means), ignores, ok_vectors, 1)
+            return [self.index2word[ok_indices[position]] for position in positions[:, 0]]
+
+        def predict_one(question):
+            a, b, c, expected = question
+            ignore = set(self.vocab[v].index for v in [a, b, c])  # indexes of words to ignore
+            # find the most likely prediction, ignoring OOV words and input words
+            sims = most_similar(self, positive=[b, c], negative=[a], topn=False)
+            for index in matutils.argsort(sims, reverse=True):
+                if index in ok_index and index not in ignore:
+                    return self.index2word[index]
+
+        def evaluate(section, section_questions):
+            if most_similar is None:
+                predictions = []
+                for chunk in utils.grouper(section_questions, chunksize):
+                    predictions.extend(predict_batch(chunk))
+            else:
+                predictions = [predict_one(question) for question in section_questions]
+            for question, predicted in zip(section_questions, predictions):
+                if predicted == question[3]:
+                    section['correct'].append(question)
+                else:
+                    logger.debug("%s: expected %s, predicted %s", ' '.join(question[:3]), question[3], predicted)
+                    section['incorrect'].append(question)
+            sections.append(section)
+            self.log_accuracy(section)
 
-        sections, section = [], None
+        sections, section, section_questions = [], None, []
         for line_no, line in enumerate(utils.smart_open(questions)):
-            # TODO: use level3 BLAS (=evaluate multiple questions at once), for speed
             line = utils.to_unicode(line)
             if line.startswith(': '):
-                # a new section starts => store the old section
+                # a new section starts => evaluate and store the old section
                 if section:
-                    sections.append(section)
-                    self.log_accuracy(section)
+                    evaluate(section, section_questions)
                 section = {'section': line.lstrip(': ').strip(), 'correct': [], 'incorrect': []}
+                section_questions = []
             else:
                 if not section:
                     raise ValueError("missing section header before line #%i in %s" % (line_no, questions))
@@ -1356,28 +1860,14 @@ class Word2Vec(utils.SaveLoad):
                     a, b, c, expected = [word.lower() for word in line.split()]  # TODO assumes vocabulary preprocessing uses lowercase, too...
                 except:
                     logger.info("skipping invalid line #%i in %s" % (line_no, questions))
+                    continue
                 if a not in ok_vocab or b not in ok_vocab or c not in ok_vocab or expected not in ok_vocab:
                     logger.debug("skipping line #%i with OOV words: %s" % (line_no, line.strip()))
                     continue
-
-                ignore = set(self.vocab[v].index for v in [a, b, c])  # indexes of words to ignore
-                predicted = None
-                # find the most likely prediction, ignoring OOV words and input words
-                sims = most_similar(self, positive=[b, c], negative=[a], topn=False)
-                for index in matutils.argsort(sims, reverse=True):
-                    if index in ok_index and index not in ignore:
-                        predicted = self.index2word[index]
-                        if predicted != expected:
-                            logger.debug("%s: expected %s, predicted %s", line.strip(), expected, predicted)
-                        break
-                if predicted == expected:
-                    section['correct'].append((a, b, c, expected))
-                else:
-                    section['incorrect'].append((a, b, c, expected))
+                section_questions.append((a, b, c, expected))
         if section:
-            # store the last section, too
-            sections.append(section)
-            self.log_accuracy(section)
+            # evaluate and store the last section, too
+            evaluate(section, section_questions)
 
         total = {
             'section': 'total',
@@ -1404,16 +1894,18 @@ class Word2Vec(utils.SaveLoad):
         # update older models
         if hasattr(model, 'table'):
             delattr(model, 'table')  # discard in favor of cum_table
+        if isinstance(model.vocab, dict):
+            for v in model.vocab.values():
+                if hasattr(v, 'sample_int'):
+                    break  # already 0.12.0+ style int probabilities
+                else:
+                    v.sample_int = int(round(v.sample_probability * 2**32))
+                    del v.sample_probability
+            model.vocab = CompactVocab.from_dict(model.vocab)  # pre-CompactVocab model
         if model.negative:
             model.make_cum_table()  # rebuild cum_table from vocabulary
         if not hasattr(model, 'corpus_count'):
             model.corpus_count = None
-        for v in model.vocab.values():
-            if hasattr(v, 'sample_int'):
-                break  # already 0.12.0+ style int probabilities
-            else:
-                v.sample_int = int(round(v.sample_probability * 2**32))
-                del v.sample_probability
         if not hasattr(model, 'syn0_lockf'):
             model.syn0_lockf = ones(len(model.syn0), dtype=REAL)
         if not hasattr(model, 'random'):
@@ -1485,7 +1977,7 @@ class Text8Corpus(object):
 
 class LineSentence(object):
     """Simple format: one sentence = one line; words already preprocessed and separated by whitespace."""
-    def __init__(self, source, max_sentence_length=10000):
+    def __init__(self, source, max_sentence_length=10000, start=0, end=None):
         """
         `source` can be either a string or a file object.
 
@@ -1498,12 +1990,54 @@ class LineSentence(object):
             sentences = LineSentence('compressed_text.txt.bz2')
             sentences = LineSentence('compressed_text.txt.gz')
 
+        If `start` or `end` is set, `source` must be the name of an uncompressed file, and
+        only the lines beginning within the byte range `[start, end)` are read. Consecutive
+        ranges read every line exactly once; see `shards`.
+
         """
         self.source = source
         self.max_sentence_length = max_sentence_length
+        self.start = start
+        self.end = end
+
+    def shards(self, num_shards):
+        """
+        Split the (uncompressed) file `source` into `num_shards` byte ranges of roughly equal
+        size, and return a list of `num_shards` `LineSentence` objects, one per range. Together,
+        they yield all the sentences of the file, e.g. for `Word2Vec.scan_vocab(..., workers=...)`.
+
+        """
+        if not isinstance(self.source, string_types) or self.source.endswith(('.bz2', '.gz')):
+            raise ValueError("only uncompressed files, given by their name, can be split into shards")
+        size = os.path.getsize(self.source)
+        bounds = [size * shard_no // num_shards for shard_no in xrange(num_shards + 1)]
+        return [LineSentence(self.source, self.max_sentence_length, start, end)
+                for start, end in zip(bounds, bounds[1:])]
+
+    def _range_lines(self):
+        # lines of the file that begin within [start, end)
+        with utils.smart_open(self.source) as fin:
+            if self.start > 0:
+                fin.seek(self.start - 1)
+                fin.readline()  # skip the rest of the line that began before `start`
+            position = fin.tell()
+            while self.end is None or position < self.end:
+                line = fin.readline()
+                if not line:
+                    break
+                position += len(line)
+                yield line
 
     def __iter__(self):
         """Iterate through the lines in the source."""
+        if self.start or self.end is not None:
+            for line in self._range_lines():
+                line = utils.to_unicode(line).split()
+                i = 0
+                while i < len(line):
+                    yield line[i:(i + self.max_sentence_length)]
+                    i += self.max_sentence_length
+            return
         try:
             # Assume it is a file-like object and try treating it as such
             # Things that don't have seek will trigger an exception
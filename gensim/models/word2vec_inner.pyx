@@ -255,7 +255,13 @@ cdef unsigned long long fast_sentence_cbow_neg(
 
 
 
-def train_sentence_sg(model, sentence, alpha, _work):
+def train_batch_sg(model, _indexes, _offsets, alpha, _work):
+    """
+    Update the skip-gram model by training on a batch of sentences, given as the
+    `(indexes, offsets)` arrays of `sentence_indexes()`. The whole batch is trained
+    without holding the GIL. Return the number of words trained on (after downsampling).
+
+    """
     cdef int hs = model.hs
     cdef int negative = model.negative
     cdef int sample = (model.sample != 0)
@@ -274,6 +280,16 @@ def train_sentence_sg(model, sentence, alpha, _work):
 
     cdef int i, j, k
     cdef long result = 0
+    cdef long long sentence_no, pos, num_sentences = len(_offsets) - 1
+    cdef np.uint32_t *batch_indexes = <np.uint32_t *>(np.PyArray_DATA(_indexes))
+    cdef np.int64_t *offsets = <np.int64_t *>(np.PyArray_DATA(_offsets))
+
+    # vocabulary arrays (see CompactVocab)
+    cdef np.int64_t *sample_ints = <np.int64_t *>(np.PyArray_DATA(model.vocab.sample_ints))
+    cdef np.int64_t *code_offsets = <np.int64_t *>(np.PyArray_DATA(model.vocab.code_offsets))
+    cdef np.uint8_t *vocab_codes = <np.uint8_t *>(np.PyArray_DATA(model.vocab.codes))
+    cdef np.uint32_t *vocab_points = <np.uint32_t *>(np.PyArray_DATA(model.vocab.points))
+    cdef np.uint32_t word_index
 
     # For hierarchical softmax
     cdef REAL_t *syn1
@@ -284,7 +300,7 @@ def train_sentence_sg(model, sentence, alpha, _work):
     cdef REAL_t *syn1neg
     cdef np.uint32_t *cum_table
     cdef unsigned long long cum_table_len
-    # for sampling (negative and frequent-word downsampling)
+    # for sampling (negative, frequent-word downsampling and reduced windows)
     cdef unsigned long long next_random
 
     if hs:
@@ -294,56 +310,59 @@ def train_sentence_sg(model, sentence, alpha, _work):
         syn1neg = <REAL_t *>(np.PyArray_DATA(model.syn1neg))
         cum_table = <np.uint32_t *>(np.PyArray_DATA(model.cum_table))
         cum_table_len = len(model.cum_table)
-    if negative or sample:
-        next_random = (2**24) * model.random.randint(0, 2**24) + model.random.randint(0, 2**24)
+    # single seed per batch avoids a big thread-sync slowdown
+    next_random = (2**24) * model.random.randint(0, 2**24) + model.random.randint(0, 2**24)
 
     # convert Python structures to primitive types, so we can release the GIL
     work = <REAL_t *>np.PyArray_DATA(_work)
 
-    vlookup = model.vocab
-    i = 0
-    for token in sentence:
-        word = vlookup[token] if token in vlookup else None
-        if word is None:
-            continue  # leaving i unchanged/shortening sentence
-        if sample and word.sample_int < random_int32(&next_random):
-            continue
-        indexes[i] = word.index
-        if hs:
-            codelens[i] = <int>len(word.code)
-            codes[i] = <np.uint8_t *>np.PyArray_DATA(word.code)
-            points[i] = <np.uint32_t *>np.PyArray_DATA(word.point)
-        result += 1
-        i += 1
-        if i == MAX_SENTENCE_LEN:
-            break  # TODO: log warning, tally overflow?
-    sentence_len = i
-
-    # single randint() call avoids a big thread-sync slowdown
-    for i, item in enumerate(model.random.randint(0, window, sentence_len)):
-        reduced_windows[i] = item
-
-    # release GIL & train on the sentence
+    # release GIL & train on the whole batch
     with nogil:
-        for i in range(sentence_len):
-            j = i - window + reduced_windows[i]
-            if j < 0:
-                j = 0
-            k = i + window + 1 - reduced_windows[i]
-            if k > sentence_len:
-                k = sentence_len
-            for j in range(j, k):
-                if j == i:
+        for sentence_no in range(num_sentences):
+            i = 0
+            for pos in range(offsets[sentence_no], offsets[sentence_no + 1]):
+                word_index = batch_indexes[pos]
+                if sample and sample_ints[word_index] < random_int32(&next_random):
                     continue
+                indexes[i] = word_index
                 if hs:
-                    fast_sentence_sg_hs(points[i], codes[i], codelens[i], syn0, syn1, size, indexes[j], _alpha, work, word_locks)
-                if negative:
-                    next_random = fast_sentence_sg_neg(negative, cum_table, cum_table_len, syn0, syn1neg, size, indexes[i], indexes[j], _alpha, work, next_random, word_locks)
+                    codelens[i] = <int>(code_offsets[word_index + 1] - code_offsets[word_index])
+                    codes[i] = vocab_codes + code_offsets[word_index]
+                    points[i] = vocab_points + code_offsets[word_index]
+                result += 1
+                i += 1
+                if i == MAX_SENTENCE_LEN:
+                    break  # TODO: log warning, tally overflow?
+            sentence_len = i
+
+            for i in range(sentence_len):
+                reduced_windows[i] = random_int32(&next_random) % window
+
+            for i in range(sentence_len):
+                j = i - window + reduced_windows[i]
+                if j < 0:
+                    j = 0
+                k = i + window + 1 - reduced_windows[i]
+                if k > sentence_len:
+                    k = sentence_len
+                for j in range(j, k):
+                    if j == i:
+                        continue
+                    if hs:
+                        fast_sentence_sg_hs(points[i], codes[i], codelens[i], syn0, syn1, size, indexes[j], _alpha, work, word_locks)
+                    if negative:
+                        next_random = fast_sentence_sg_neg(negative, cum_table, cum_table_len, syn0, syn1neg, size, indexes[i], indexes[j], _alpha, work, next_random, word_locks)
 
     return result
 
 
-def train_sentence_cbow(model, sentence, alpha, _work, _neu1):
+def train_batch_cbow(model, _indexes, _offsets, alpha, _work, _neu1):
+    """
+    Update the CBOW model by training on a batch of sentences, given as the
+    `(indexes, offsets)` arrays of `sentence_indexes()`. The whole batch is trained
+    without holding the GIL. Return the number of words trained on (after downsampling).
+
+    """
     cdef int hs = model.hs
     cdef int negative = model.negative
     cdef int sample = (model.sample != 0)
@@ -364,6 +383,16 @@ def train_sentence_cbow(model, sentence, alpha, _work, _neu1):
 
     cdef int i, j, k
     cdef long result = 0
+    cdef long long sentence_no, pos, num_sentences = len(_offsets) - 1
+    cdef np.uint32_t *batch_indexes = <np.uint32_t *>(np.PyArray_DATA(_indexes))
+    cdef np.int64_t *offsets = <np.int64_t *>(np.PyArray_DATA(_offsets))
+
+    # vocabulary arrays (see CompactVocab)
+    cdef np.int64_t *sample_ints = <np.int64_t *>(np.PyArray_DATA(model.vocab.sample_ints))
+    cdef np.int64_t *code_offsets = <np.int64_t *>(np.PyArray_DATA(model.vocab.code_offsets))
+    cdef np.uint8_t *vocab_codes = <np.uint8_t *>(np.PyArray_DATA(model.vocab.codes))
+    cdef np.uint32_t *vocab_points = <np.uint32_t *>(np.PyArray_DATA(model.vocab.points))
+    cdef np.uint32_t word_index
 
     # For hierarchical softmax
     cdef REAL_t *syn1
@@ -374,7 +403,7 @@ def train_sentence_cbow(model, sentence, alpha, _work, _neu1):
     cdef REAL_t *syn1neg
     cdef np.uint32_t *cum_table
     cdef unsigned long long cum_table_len
-    # for sampling (negative or frequent-word downsampling)
+    # for sampling (negative, frequent-word downsampling and reduced windows)
     cdef unsigned long long next_random
 
     if hs:
@@ -384,225 +413,320 @@ def train_sentence_cbow(model, sentence, alpha, _work, _neu1):
         syn1neg = <REAL_t *>(np.PyArray_DATA(model.syn1neg))
         cum_table = <np.uint32_t *>(np.PyArray_DATA(model.cum_table))
         cum_table_len = len(model.cum_table)
-    if negative or sample:
-        next_random = (2**24) * model.random.randint(0, 2**24) + model.random.randint(0, 2**24)
+    # single seed per batch avoids a big thread-sync slowdown
+    next_random = (2**24) * model.random.randint(0, 2**24) + model.random.randint(0, 2**24)
 
     # convert Python structures to primitive types, so we can release the GIL
     work = <REAL_t *>np.PyArray_DATA(_work)
     neu1 = <REAL_t *>np.PyArray_DATA(_neu1)
 
-    vlookup = model.vocab
-    i = 0
-    for token in sentence:
-        word = vlookup[token] if token in vlookup else None
-        if word is None:
-            continue  # leaving i unchanged/shortening sentence
-        if sample and word.sample_int < random_int32(&next_random):
-            continue
-        indexes[i] = word.index
-        if hs:
-            codelens[i] = <int>len(word.code)
-            codes[i] = <np.uint8_t *>np.PyArray_DATA(word.code)
-            points[i] = <np.uint32_t *>np.PyArray_DATA(word.point)
-        result += 1
-        i += 1
-        if i == MAX_SENTENCE_LEN:
-            break  # TODO: log warning, tally overflow?
-    sentence_len = i
-
-    # single randint() call avoids a big thread-sync slowdown
-    for i, item in enumerate(model.random.randint(0, window, sentence_len)):
-        reduced_windows[i] = item
-
-    # release GIL & train on the sentence
+    # release GIL & train on the whole batch
     with nogil:
-        for i in range(sentence_len):
-            j = i - window + reduced_windows[i]
-            if j < 0:
-                j = 0
-            k = i + window + 1 - reduced_windows[i]
-            if k > sentence_len:
-                k = sentence_len
-            if hs:
-                fast_sentence_cbow_hs(points[i], codes[i], codelens, neu1, syn0, syn1, size, indexes, _alpha, work, i, j, k, cbow_mean, word_locks)
-            if negative:
-                next_random = fast_sentence_cbow_neg(negative, cum_table, cum_table_len, codelens, neu1, syn0, syn1neg, size, indexes, _alpha, work, i, j, k, cbow_mean, next_random, word_locks)
+        for sentence_no in range(num_sentences):
+            i = 0
+            for pos in range(offsets[sentence_no], offsets[sentence_no + 1]):
+                word_index = batch_indexes[pos]
+                if sample and sample_ints[word_index] < random_int32(&next_random):
+                    continue
+                indexes[i] = word_index
+                if hs:
+                    codelens[i] = <int>(code_offsets[word_index + 1] - code_offsets[word_index])
+                    codes[i] = vocab_codes + code_offsets[word_index]
+                    points[i] = vocab_points + code_offsets[word_index]
+                result += 1
+                i += 1
+                if i == MAX_SENTENCE_LEN:
+                    break  # TODO: log warning, tally overflow?
+            sentence_len = i
+
+            for i in range(sentence_len):
+                reduced_windows[i] = random_int32(&next_random) % window
+
+            for i in range(sentence_len):
+                j = i - window + reduced_windows[i]
+                if j < 0:
+                    j = 0
+                k = i + window + 1 - reduced_windows[i]
+                if k > sentence_len:
+                    k = sentence_len
+                if hs:
+                    fast_sentence_cbow_hs(points[i], codes[i], codelens, neu1, syn0, syn1, size, indexes, _alpha, work, i, j, k, cbow_mean, word_locks)
+                if negative:
+                    next_random = fast_sentence_cbow_neg(negative, cum_table, cum_table_len, codelens, neu1, syn0, syn1neg, size, indexes, _alpha, work, i, j, k, cbow_mean, next_random, word_locks)
 
     return result
 
 
-# Score is only implemented for hierarchical softmax
-def score_sentence_sg(model, sentence, _work):
+def train_sentence_sg(model, sentence, alpha, _work):
+    """Update the skip-gram model by training on a single sentence (a list of words)."""
+    _indexes, _offsets = sentence_indexes(model, [sentence])
+    return train_batch_sg(model, _indexes, _offsets, alpha, _work)
 
-    cdef REAL_t *syn0 = <REAL_t *>(np.PyArray_DATA(model.syn0))
-    cdef REAL_t *work
-    cdef int size = model.layer1_size
 
-    cdef int codelens[MAX_SENTENCE_LEN]
-    cdef np.uint32_t indexes[MAX_SENTENCE_LEN]
-    cdef int sentence_len
-    cdef int window = model.window
+def train_sentence_cbow(model, sentence, alpha, _work, _neu1):
+    """Update the CBOW model by training on a single sentence (a list of words)."""
+    _indexes, _offsets = sentence_indexes(model, [sentence])
+    return train_batch_cbow(model, _indexes, _offsets, alpha, _work, _neu1)
 
-    cdef int i, j, k
-    cdef long result = 0
 
-    cdef REAL_t *syn1
-    cdef np.uint32_t *points[MAX_SENTENCE_LEN]
-    cdef np.uint8_t *codes[MAX_SENTENCE_LEN]
+# Scoring: the log probability of each word in a sentence, given its context (CBOW) or
+# given each word of its context (skip-gram), under hierarchical softmax and/or negative
+# sampling. Negative samples are drawn from a random generator that restarts at the same
+# seed for each sentence, so that scoring the same sentence always gives the same score.
 
-    syn1 = <REAL_t *>(np.PyArray_DATA(model.syn1))
+cdef REAL_t score_word_hs(
+    const np.uint32_t *word_point, const np.uint8_t *word_code, const long long codelen,
+    const REAL_t *l1, REAL_t *syn1, const int size) nogil:
 
-    # convert Python structures to primitive types, so we can release the GIL
-    work = <REAL_t *>np.PyArray_DATA(_work)
+    cdef long long b
+    cdef long long row2
+    cdef REAL_t f, result = <REAL_t>0.0
 
-    vlookup = model.vocab
-    i = 0
-    for token in sentence:
-        word = vlookup[token] if token in vlookup else None
-        if word is None:
-            continue  # should drop the 
-        indexes[i] = word.index
-        codelens[i] = <int>len(word.code)
-        codes[i] = <np.uint8_t *>np.PyArray_DATA(word.code)
-        points[i] = <np.uint32_t *>np.PyArray_DATA(word.point)
-        result += 1
-        i += 1
-        if i == MAX_SENTENCE_LEN:
-            break  # TODO: log warning, tally overflow?
-    sentence_len = i
-
-    # release GIL & train on the sentence
-    work[0] = 0.0
+    for b in range(codelen):
+        row2 = <long long>word_point[b] * size
+        f = our_dot(&size, l1, &ONE, &syn1[row2], &ONE)
+        if word_code[b]:
+            f = -f  # ch function: 0-> 1, 1 -> -1
+        if f <= -MAX_EXP or f >= MAX_EXP:
+            continue
+        result += LOG_TABLE[<int>((f + MAX_EXP) * (EXP_TABLE_SIZE / MAX_EXP / 2))]
+    return result
 
-    with nogil:
-        for i in range(sentence_len):
-            if codelens[i] == 0:
-                continue
-            j = i - window 
-            if j < 0:
-                j = 0
-            k = i + window + 1 
-            if k > sentence_len:
-                k = sentence_len
-            for j in range(j, k):
-                if j == i or codelens[j] == 0:
-                    continue
-                score_pair_sg_hs(points[i], codes[i], codelens[i], syn0, syn1, size, indexes[j], work)
 
-    return work[0]
+cdef REAL_t score_word_neg(
+    const int negative, np.uint32_t *cum_table, unsigned long long cum_table_len,
+    const REAL_t *l1, REAL_t *syn1neg, const int size, const np.uint32_t word_index,
+    unsigned long long *next_random) nogil:
 
-cdef void score_pair_sg_hs(
-    const np.uint32_t *word_point, const np.uint8_t *word_code, const int codelen,
-    REAL_t *syn0, REAL_t *syn1, const int size,
-    const np.uint32_t word2_index, REAL_t *work) nogil:
+    cdef long long row2
+    cdef unsigned long long modulo = 281474976710655ULL
+    cdef REAL_t f, result = <REAL_t>0.0
+    cdef np.uint32_t target_index
+    cdef int d
 
-    cdef long long b
-    cdef long long row1 = word2_index * size, row2, sgn
-    cdef REAL_t f
+    for d in range(negative+1):
+        if d == 0:
+            target_index = word_index
+        else:
+            target_index = bisect_left(cum_table, (next_random[0] >> 16) % cum_table[cum_table_len-1], 0, cum_table_len)
+            next_random[0] = (next_random[0] * <unsigned long long>25214903917ULL + 11) & modulo
+            if target_index == word_index:
+                continue
 
-    for b in range(codelen):
-        row2 = word_point[b] * size
-        f = our_dot(&size, &syn0[row1], &ONE, &syn1[row2], &ONE)
-        sgn = (-1)**word_code[b] # ch function: 0-> 1, 1 -> -1
-        f = sgn*f
+        row2 = <long long>target_index * size
+        f = our_dot(&size, l1, &ONE, &syn1neg[row2], &ONE)
+        if d:
+            f = -f  # log probability of *not* predicting the negative sample
         if f <= -MAX_EXP or f >= MAX_EXP:
             continue
-        f = LOG_TABLE[<int>((f + MAX_EXP) * (EXP_TABLE_SIZE / MAX_EXP / 2))]
-        work[0] += f
+        result += LOG_TABLE[<int>((f + MAX_EXP) * (EXP_TABLE_SIZE / MAX_EXP / 2))]
+    return result
 
-def score_sentence_cbow(model, sentence, _work, _neu1):
 
-    cdef int cbow_mean = model.cbow_mean
+cdef REAL_t score_indexes_sg(
+    const np.uint32_t *indexes, const long long sentence_len, const int window,
+    const int hs, const int negative, REAL_t *syn0, REAL_t *syn1, REAL_t *syn1neg, const int size,
+    const np.int64_t *code_offsets, const np.uint8_t *vocab_codes, const np.uint32_t *vocab_points,
+    np.uint32_t *cum_table, unsigned long long cum_table_len, unsigned long long next_random) nogil:
+
+    cdef long long i, j, k, m
+    cdef np.uint32_t word_index
+    cdef REAL_t result = <REAL_t>0.0
+
+    for i in range(sentence_len):
+        word_index = indexes[i]
+        j = i - window
+        if j < 0:
+            j = 0
+        k = i + window + 1
+        if k > sentence_len:
+            k = sentence_len
+        for m in range(j, k):
+            if m == i:
+                continue
+            if hs:
+                result += score_word_hs(
+                    &vocab_points[code_offsets[word_index]], &vocab_codes[code_offsets[word_index]],
+                    code_offsets[word_index + 1] - code_offsets[word_index],
+                    &syn0[<long long>indexes[m] * size], syn1, size)
+            if negative:
+                result += score_word_neg(
+                    negative, cum_table, cum_table_len, &syn0[<long long>indexes[m] * size],
+                    syn1neg, size, word_index, &next_random)
+    return result
+
+
+cdef REAL_t score_indexes_cbow(
+    const np.uint32_t *indexes, const long long sentence_len, const int window, const int cbow_mean,
+    const int hs, const int negative, REAL_t *syn0, REAL_t *syn1, REAL_t *syn1neg, const int size,
+    const np.int64_t *code_offsets, const np.uint8_t *vocab_codes, const np.uint32_t *vocab_points,
+    np.uint32_t *cum_table, unsigned long long cum_table_len, unsigned long long next_random,
+    REAL_t *neu1) nogil:
+
+    cdef long long i, j, k, m
+    cdef np.uint32_t word_index
+    cdef REAL_t count, inv_count, result = <REAL_t>0.0
+
+    for i in range(sentence_len):
+        word_index = indexes[i]
+        j = i - window
+        if j < 0:
+            j = 0
+        k = i + window + 1
+        if k > sentence_len:
+            k = sentence_len
+
+        memset(neu1, 0, size * cython.sizeof(REAL_t))
+        count = <REAL_t>0.0
+        for m in range(j, k):
+            if m == i:
+                continue
+            count += ONEF
+            our_saxpy(&size, &ONEF, &syn0[<long long>indexes[m] * size], &ONE, neu1, &ONE)
+        if cbow_mean and count > (<REAL_t>0.5):
+            inv_count = ONEF/count
+            sscal(&size, &inv_count, neu1, &ONE)
+
+        if hs:
+            result += score_word_hs(
+                &vocab_points[code_offsets[word_index]], &vocab_codes[code_offsets[word_index]],
+                code_offsets[word_index + 1] - code_offsets[word_index], neu1, syn1, size)
+        if negative:
+            result += score_word_neg(
+                negative, cum_table, cum_table_len, neu1, syn1neg, size, word_index, &next_random)
+    return result
 
+
+def sentence_indexes(model, sentences):
+    """
+    Convert `sentences` (a list of lists of words) to a 2-tuple of arrays `(indexes, offsets)`:
+    the vocabulary indexes of all in-vocabulary words, concatenated, and the offset of each
+    sentence in `indexes` (plus the total length at the end).
+
+    """
+    vlookup = model.vocab.word2index
+    indexes = []
+    offsets = np.empty(len(sentences) + 1, dtype=np.int64)
+    offsets[0] = 0
+    for sentence_no, sentence in enumerate(sentences):
+        for token in sentence:
+            word = vlookup.get(token)
+            if word is not None:
+                indexes.append(word)
+        offsets[sentence_no + 1] = len(indexes)
+    return np.array(indexes, dtype=np.uint32), offsets
+
+
+def score_sentences_sg(model, sentences, _work, _scores):
+    """
+    Store the log probability of each sentence from `sentences` (a list of lists of words)
+    under the skip-gram model into `_scores` (a contiguous REAL array of the same length),
+    releasing the GIL for the whole batch.
+
+    """
+    cdef int hs = model.hs
+    cdef int negative = model.negative
     cdef REAL_t *syn0 = <REAL_t *>(np.PyArray_DATA(model.syn0))
-    cdef REAL_t *work
-    cdef REAL_t *neu1
     cdef int size = model.layer1_size
-
-    cdef int codelens[MAX_SENTENCE_LEN]
-    cdef np.uint32_t indexes[MAX_SENTENCE_LEN]
-    cdef int sentence_len
     cdef int window = model.window
+    cdef REAL_t *scores = <REAL_t *>(np.PyArray_DATA(_scores))
+    cdef long long sentence_no, num_sentences = len(sentences)
 
-    cdef int i, j, k
-    cdef long result = 0
+    # vocabulary arrays (see CompactVocab)
+    cdef np.int64_t *code_offsets = <np.int64_t *>(np.PyArray_DATA(model.vocab.code_offsets))
+    cdef np.uint8_t *vocab_codes = <np.uint8_t *>(np.PyArray_DATA(model.vocab.codes))
+    cdef np.uint32_t *vocab_points = <np.uint32_t *>(np.PyArray_DATA(model.vocab.points))
 
-    # For hierarchical softmax
-    cdef REAL_t *syn1
-    cdef np.uint32_t *points[MAX_SENTENCE_LEN]
-    cdef np.uint8_t *codes[MAX_SENTENCE_LEN]
+    cdef REAL_t *syn1 = NULL
+    cdef REAL_t *syn1neg = NULL
+    cdef np.uint32_t *cum_table = NULL
+    cdef unsigned long long cum_table_len = 0
+    cdef unsigned long long score_random = ((2**24) * model.seed + 1) % 2**48
 
-    syn1 = <REAL_t *>(np.PyArray_DATA(model.syn1))
+    cdef np.uint32_t *indexes
+    cdef np.int64_t *offsets
 
-    # convert Python structures to primitive types, so we can release the GIL
-    work = <REAL_t *>np.PyArray_DATA(_work)
-    neu1 = <REAL_t *>np.PyArray_DATA(_neu1)
+    if hs:
+        syn1 = <REAL_t *>(np.PyArray_DATA(model.syn1))
+    if negative:
+        syn1neg = <REAL_t *>(np.PyArray_DATA(model.syn1neg))
+        cum_table = <np.uint32_t *>(np.PyArray_DATA(model.cum_table))
+        cum_table_len = len(model.cum_table)
+
+    _indexes, _offsets = sentence_indexes(model, sentences)
+    indexes = <np.uint32_t *>(np.PyArray_DATA(_indexes))
+    offsets = <np.int64_t *>(np.PyArray_DATA(_offsets))
 
-    vlookup = model.vocab
-    i = 0
-    for token in sentence:
-        word = vlookup[token] if token in vlookup else None
-        if word is None:
-            continue  # for score, should this be a default negative value?
-        indexes[i] = word.index
-        codelens[i] = <int>len(word.code)
-        codes[i] = <np.uint8_t *>np.PyArray_DATA(word.code)
-        points[i] = <np.uint32_t *>np.PyArray_DATA(word.point)
-        result += 1
-        i += 1
-        if i == MAX_SENTENCE_LEN:
-            break  # TODO: log warning, tally overflow?
-    sentence_len = i
-
-    # release GIL & train on the sentence
-    work[0] = 0.0
     with nogil:
-        for i in range(sentence_len):
-            if codelens[i] == 0:
-                continue
-            j = i - window 
-            if j < 0:
-                j = 0
-            k = i + window + 1
-            if k > sentence_len:
-                k = sentence_len
-            score_pair_cbow_hs(points[i], codes[i], codelens, neu1, syn0, syn1, size, indexes, work, i, j, k, cbow_mean)
+        for sentence_no in range(num_sentences):
+            scores[sentence_no] = score_indexes_sg(
+                &indexes[offsets[sentence_no]], offsets[sentence_no + 1] - offsets[sentence_no], window,
+                hs, negative, syn0, syn1, syn1neg, size, code_offsets, vocab_codes, vocab_points,
+                cum_table, cum_table_len, score_random)
 
-    return work[0]
 
-cdef void score_pair_cbow_hs(
-    const np.uint32_t *word_point, const np.uint8_t *word_code, int codelens[MAX_SENTENCE_LEN],
-    REAL_t *neu1, REAL_t *syn0, REAL_t *syn1, const int size,
-    const np.uint32_t indexes[MAX_SENTENCE_LEN], REAL_t *work,
-    int i, int j, int k, int cbow_mean) nogil:
+def score_sentences_cbow(model, sentences, _work, _neu1, _scores):
+    """
+    Store the log probability of each sentence from `sentences` (a list of lists of words)
+    under the CBOW model into `_scores` (a contiguous REAL array of the same length),
+    releasing the GIL for the whole batch.
 
-    cdef long long a, b
-    cdef long long row2
-    cdef REAL_t f, g, count, inv_count, sgn
-    cdef int m
+    """
+    cdef int hs = model.hs
+    cdef int negative = model.negative
+    cdef int cbow_mean = model.cbow_mean
+    cdef REAL_t *syn0 = <REAL_t *>(np.PyArray_DATA(model.syn0))
+    cdef REAL_t *neu1 = <REAL_t *>(np.PyArray_DATA(_neu1))
+    cdef int size = model.layer1_size
+    cdef int window = model.window
+    cdef REAL_t *scores = <REAL_t *>(np.PyArray_DATA(_scores))
+    cdef long long sentence_no, num_sentences = len(sentences)
 
-    memset(neu1, 0, size * cython.sizeof(REAL_t))
-    count = <REAL_t>0.0
-    for m in range(j, k):
-        if m == i or codelens[m] == 0:
-            continue
-        else:
-            count += ONEF
-            our_saxpy(&size, &ONEF, &syn0[indexes[m] * size], &ONE, neu1, &ONE)
-    if count > (<REAL_t>0.5):
-        inv_count = ONEF/count
-    if cbow_mean:
-        sscal(&size, &inv_count, neu1, &ONE)
+    # vocabulary arrays (see CompactVocab)
+    cdef np.int64_t *code_offsets = <np.int64_t *>(np.PyArray_DATA(model.vocab.code_offsets))
+    cdef np.uint8_t *vocab_codes = <np.uint8_t *>(np.PyArray_DATA(model.vocab.codes))
+    cdef np.uint32_t *vocab_points = <np.uint32_t *>(np.PyArray_DATA(model.vocab.points))
 
-    for b in range(codelens[i]):
-        row2 = word_point[b] * size
-        f = our_dot(&size, neu1, &ONE, &syn1[row2], &ONE)
-        sgn = (-1)**word_code[b] # ch function: 0-> 1, 1 -> -1
-        f = sgn*f
-        if f <= -MAX_EXP or f >= MAX_EXP:
-            continue
-        f = LOG_TABLE[<int>((f + MAX_EXP) * (EXP_TABLE_SIZE / MAX_EXP / 2))]
-        work[0] += f
+    cdef REAL_t *syn1 = NULL
+    cdef REAL_t *syn1neg = NULL
+    cdef np.uint32_t *cum_table = NULL
+    cdef unsigned long long cum_table_len = 0
+    cdef unsigned long long score_random = ((2**24) * model.seed + 1) % 2**48
+
+    cdef np.uint32_t *indexes
+    cdef np.int64_t *offsets
+
+    if hs:
+        syn1 = <REAL_t *>(np.PyArray_DATA(model.syn1))
+    if negative:
+        syn1neg = <REAL_t *>(np.PyArray_DATA(model.syn1neg))
+        cum_table = <np.uint32_t *>(np.PyArray_DATA(model.cum_table))
+        cum_table_len = len(model.cum_table)
+
+    _indexes, _offsets = sentence_indexes(model, sentences)
+    indexes = <np.uint32_t *>(np.PyArray_DATA(_indexes))
+    offsets = <np.int64_t *>(np.PyArray_DATA(_offsets))
+
+    with nogil:
+        for sentence_no in range(num_sentences):
+            scores[sentence_no] = score_indexes_cbow(
+                &indexes[offsets[sentence_no]], offsets[sentence_no + 1] - offsets[sentence_no], window,
+                cbow_mean, hs, negative, syn0, syn1, syn1neg, size, code_offsets, vocab_codes, vocab_points,
+                cum_table, cum_table_len, score_random, neu1)
+
+
+def score_sentence_sg(model, sentence, _work):
+    """Return the log probability of a single `sentence` under the skip-gram model."""
+    scores = np.zeros(1, dtype=REAL)
+    score_sentences_sg(model, [sentence], _work, scores)
+    return scores[0]
+
+
+def score_sentence_cbow(model, sentence, _work, _neu1):
+    """Return the log probability of a single `sentence` under the CBOW model."""
+    scores = np.zeros(1, dtype=REAL)
+    score_sentences_cbow(model, [sentence], _work, _neu1, scores)
+    return scores[0]
 
 
 def init():
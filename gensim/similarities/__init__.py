@@ -3,4 +3,7 @@ This package contains implementations of pairwise similarity queries.
 """
 
 # bring classes directly into package namespace, to save some typing
-from .docsim import Similarity, MatrixSimilarity, SparseMatrixSimilarity
+from .docsim import Similarity, MatrixSimilarity, QuantizedMatrixSimilarity, SparseMatrixSimilarity, InvertedIndexSimilarity
+from .index import RandomProjectionIndexer
+from .allpairs import all_pairs, save_all_pairs
+from .lsh import LshIndex
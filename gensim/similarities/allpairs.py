@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+This module contains functions for computing the all-pairs similarity join of an
+index: for each indexed document, the other documents that are most similar to it
+(`num_best`), or whose similarity is above a `threshold`. Near-duplicate detection
+is a typical application:
+
+>>> index = MatrixSimilarity(corpus, num_features=400)
+>>> for docno, sims in enumerate(all_pairs(index, threshold=0.95)):
+...     print(docno, sims)  # list of (other document number, similarity) 2-tuples
+
+or, for an index too large for its results to fit in RAM:
+
+>>> save_all_pairs('/tmp/duplicates.mm', index, threshold=0.95, workers=4)
+>>> duplicates = MmCorpus('/tmp/duplicates.mm')
+
+Iterating over the index (`for sims in index`) computes the similarity of every
+pair of documents twice, as both (i, j) and (j, i), and keeps a dense row of
+similarities per document. The join instead:
+
+* splits the documents into blocks of `blocksize` rows, and computes the similarity
+  matrix tile by tile, each tile being a `blocksize x blocksize` product that fits
+  into CPU caches;
+* computes only the tiles on and above the diagonal, and uses each tile `(I, J)`
+  for the rows of both block `I` and block `J` (transposed);
+* applies the threshold, or selects the `num_best` best documents, on each tile
+  right after it was computed, so only sparse results are ever kept;
+* optionally processes the blocks in several worker processes.
+
+"""
+
+
+import logging
+import multiprocessing
+
+import numpy
+import scipy.sparse
+
+from gensim import utils, topk
+from six.moves import xrange
+
+
+logger = logging.getLogger('gensim.similarities.allpairs')
+
+
+_join_args = None  # (matrix, blocksize, threshold, num_best, include_self), set in each worker process
+
+
+def _init_join(*args):
+    global _join_args
+    _join_args = args
+
+
+def _join_block(start, join_args=None):
+    """
+    Join the rows of the block starting at `start` to the rows of all following blocks,
+    using `join_args` (the global `_join_args` of the worker process by default).
+
+    Return a 3-tuple `(start, own, transposed)`. `own` is the result for the rows of the block;
+    `transposed` is a list of `(block start, result)` 2-tuples, with results for the rows of
+    the following blocks, from the transposed tiles.
+
+    In threshold mode (`num_best` is None), each result is a 3-tuple of arrays `(rows, columns,
+    similarities)` of the selected similarities. Otherwise, it's the `(columns, similarities)`
+    output of `topk.topk_rows` for the block rows, with similarities of -inf marking padding.
+
+    """
+    matrix, blocksize, threshold, num_best, include_self = join_args or _join_args
+    num_docs = matrix.shape[0]
+    end = min(start + blocksize, num_docs)
+    block = matrix[start: end]
+    own, transposed = [], []
+    for other_start in xrange(start, num_docs, blocksize):
+        other_end = min(other_start + blocksize, num_docs)
+        tile = block.dot(matrix[other_start: other_end].T)
+        tile = tile.toarray() if scipy.sparse.issparse(tile) else numpy.asarray(tile)
+        if threshold is None:
+            selected = numpy.abs(tile) > 1e-9
+        else:
+            selected = tile >= threshold
+        if other_start == start and not include_self:
+            # diagonal tile: it is symmetric, its rows are the complete result for this tile
+            numpy.fill_diagonal(selected, False)
+
+        if num_best is None:
+            # much faster than numpy.nonzero() on the 2d mask, for sparse masks
+            rows, cols = numpy.divmod(numpy.flatnonzero(selected), selected.shape[1])
+            sims = tile[rows, cols]
+            own.append((rows + start, cols + other_start, sims))
+            if other_start != start:
+                transposed.append((other_start, (cols + other_start, rows + start, sims)))
+        else:
+            tile = numpy.where(selected, tile, -numpy.inf)
+            own.append((other_start, topk.topk_rows(tile, num_best, reverse=True)))
+            if other_start != start:
+                indices, sims = topk.topk_rows(tile.T, num_best, reverse=True)
+                transposed.append((other_start, (indices + start, sims)))
+
+    if num_best is None:
+        own = tuple(numpy.concatenate(arrays) for arrays in zip(*own))
+    else:
+        own = topk.merge_blocks(own, num_best, reverse=True)
+    return start, own, transposed
+
+
+def _merge_best(first, second, num_best):
+    """Merge two `(columns, similarities)` top-N results for the same rows."""
+    indices = numpy.hstack([first[0], second[0]])
+    best, sims = topk.topk_rows(numpy.hstack([first[1], second[1]]), num_best, reverse=True)
+    return indices[numpy.arange(len(indices))[:, numpy.newaxis], best], sims
+
+
+def _index_matrix(index):
+    """Return the matrix of `index`, with one document per row."""
+    if hasattr(index, 'shards'):
+        raise TypeError("all_pairs needs an in-memory index or matrix, not a sharded %s; "
+                        "join the matrix of each shard instead" % index.__class__.__name__)
+    return getattr(index, 'index', index)
+
+
+def all_pairs(index, threshold=None, num_best=None, blocksize=512, workers=1, include_self=False):
+    """
+    Yield, for each document in `index`, the list of documents most similar to it, as
+    `(document number, similarity)` 2-tuples.
+
+    `index` is either a `MatrixSimilarity`-like index (its `index` matrix is used), or
+    directly a 2d numpy array or scipy.sparse matrix with one (normalized) document per row.
+    Documents are numbered by their row in that matrix. A sharded `Similarity` index is
+    not supported (it raises a TypeError): its documents are spread over shards of
+    different types, that are loaded on demand, and may contain deleted documents.
+
+    With `num_best`, each list holds the `num_best` most similar documents, most similar
+    first; otherwise all documents with similarity at least `threshold` (or all non-zero
+    similarities, if `threshold` isn't set either), ordered by document number. Both may
+    be combined. A document is never returned as similar to itself, unless `include_self`
+    is set.
+
+    Work is split into tiles of `blocksize x blocksize` documents. With `workers` > 1,
+    the tiles are computed by that many processes (which share `index` through fork(),
+    or through the operating system page cache if it was loaded with `mmap='r'`).
+
+    The results for each block of documents are yielded as soon as the block is complete.
+    In threshold mode, the results of pairs (i, j) whose document j lies in a later block
+    are buffered until that block is reached; with `num_best`, the buffer holds `num_best`
+    results for every document in the later blocks.
+
+    """
+    matrix = _index_matrix(index)
+    if scipy.sparse.issparse(matrix):
+        matrix = matrix.tocsr()
+    num_docs = matrix.shape[0]
+    if num_best is not None and num_best <= 0:
+        raise ValueError("num_best must be a positive integer, got %r" % num_best)
+    if blocksize <= 0:
+        raise ValueError("blocksize must be a positive integer, got %r" % blocksize)
+
+    join_args = (matrix, blocksize, threshold, num_best, include_self)
+    starts = xrange(0, num_docs, blocksize)
+    if workers is not None and workers > 1:
+        pool = multiprocessing.Pool(workers, _init_join, join_args)
+        # the first blocks are the most expensive (they are joined to all the following blocks)
+        results = pool.imap(_join_block, starts, chunksize=1)
+    else:
+        pool = None
+        results = (_join_block(start, join_args) for start in starts)
+
+    pending = {}  # block start => results of the tiles above the diagonal, for rows in that block
+    try:
+        for start, own, transposed in results:
+            end = min(start + blocksize, num_docs)
+            logger.debug("joined documents #%i-%i, %i blocks pending", start, end, len(pending))
+            for other_start, result in transposed:
+                if num_best is None:
+                    pending.setdefault(other_start, []).append(result)
+                elif other_start in pending:
+                    pending[other_start] = _merge_best(pending[other_start], result, num_best)
+                else:
+                    pending[other_start] = result
+
+            if num_best is None:
+                rows, cols, sims = (numpy.concatenate(arrays) for arrays in zip(own, *pending.pop(start, [])))
+                order = numpy.lexsort((cols, rows))
+                rows, cols, sims = rows[order], cols[order].tolist(), sims[order].tolist()
+                bounds = numpy.searchsorted(rows, numpy.arange(start, end + 1))
+                for row in xrange(end - start):
+                    yield list(zip(cols[bounds[row]: bounds[row + 1]], sims[bounds[row]: bounds[row + 1]]))
+            else:
+                if start in pending:
+                    own = _merge_best(own, pending.pop(start), num_best)
+                for indices, sims in zip(*own):
+                    valid = sims > -numpy.inf
+                    yield list(zip(indices[valid].tolist(), sims[valid].tolist()))
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+
+def save_all_pairs(fname, index, threshold=None, num_best=None, blocksize=512, workers=1, include_self=False):
+    """
+    Compute the all-pairs similarity join of `index` (see `all_pairs`) and stream the
+    results to disk under `fname`, as a `MmCorpus` with one "document" per indexed
+    document, whose features are the numbers of the similar documents.
+
+    The result is a sparse `num_docs x num_docs` matrix, readable with `MmCorpus(fname)`,
+    that never needs to fit in RAM.
+
+    """
+    from gensim.corpora import MmCorpus
+
+    num_docs = _index_matrix(index).shape[0]
+    results = all_pairs(index, threshold=threshold, num_best=num_best, blocksize=blocksize,
+                        workers=workers, include_self=include_self)
+    MmCorpus.serialize(fname, results, id2word=utils.FakeDict(num_docs))
@@ -51,16 +51,19 @@ already uses the faster, batch queries internally:
 """
 
 
-import logging
+import copy
 import itertools
+import logging
 import os
-import heapq
+import threading
+from collections import deque
+from timeit import default_timer
 
 import numpy
 import scipy.sparse
 
-from gensim import interfaces, utils, matutils
-from six.moves import map as imap, xrange, zip as izip
+from gensim import interfaces, utils, matutils, topk
+from six.moves import xrange, zip as izip
 
 
 logger = logging.getLogger('gensim.similarities.docsim')
@@ -82,10 +85,16 @@ class Shard(utils.SaveLoad):
     Basically just wraps (Sparse)MatrixSimilarity so that it mmaps from disk on
     request (query).
 
+    The shard also keeps the external document id of each of its documents (`ids`),
+    and the positions of its deleted documents (`deleted`, "tombstones"), which are
+    left out of all query results.
+
     """
-    def __init__(self, fname, index):
+    def __init__(self, fname, index, ids=None):
         self.dirname, self.fname = os.path.split(fname)
         self.length = len(index)
+        self.ids = ids
+        self.deleted = set()
         self.cls = index.__class__
         logger.info("saving index shard to %s" % self.fullname())
         index.save(self.fullname())
@@ -126,23 +135,124 @@ class Shard(utils.SaveLoad):
 
 
     def __getitem__(self, query):
-        index = self.get_index()
         try:
-            index.num_best = self.num_best
-            index.normalize = self.normalize
-        except:
+            num_best, normalize = self.num_best, self.normalize
+        except AttributeError:
             raise ValueError("num_best and normalize have to be set before querying a proxy Shard object")
-        return index[query]
+        return self.query(query, num_best, normalize)
+
+
+    def query(self, query, num_best=None, normalize=True):
+        """
+        Return `self[query]` for the given `num_best` and `normalize` settings, without
+        changing the shard or its (shared) index, so that queries with different settings
+        can run concurrently.
+
+        """
+        # a shallow copy of the index carries the settings of this query; its arrays are shared
+        index = copy.copy(self.get_index())
+        deleted = getattr(self, 'deleted', None)
+        # with deleted documents, get all similarities and clip them below, once the
+        # deleted documents are out (otherwise they could take up the top-N spots)
+        index.num_best = None if deleted else num_best
+        index.normalize = normalize
+        result = index[query]
+        if not deleted:
+            return result
+
+        # a similarity of 0 means "not similar at all", and is never in a top-N result
+        result[..., sorted(deleted)] = 0.0
+        if num_best is None:
+            return result
+        if result.ndim == 2:
+            return topk.clip_rows(result, num_best)
+        return matutils.full2sparse_clipped(result, num_best)
+
+
+# shard indexes already mmap'ed by this process, so that worker processes of a
+# `ShardQueryPool` don't reload their shards on every query:
+# shard filename => ((file size, modification time), loaded index)
+_loaded_shards = {}
+
+
+def load_shard_index(shard):
+    """
+    Return the index of `shard`, reusing an index this process already mmap'ed
+    from the same shard file, if the file hasn't changed since.
+
+    """
+    fname = shard.fullname()
+    stat = os.stat(fname)
+    stamp = (stat.st_size, stat.st_mtime)
+    if fname not in _loaded_shards or _loaded_shards[fname][0] != stamp:
+        _loaded_shards[fname] = (stamp, shard.get_index())
+    return _loaded_shards[fname][1]
 
 
 def query_shard(args):
-    query, shard = args # simulate starmap (not part of multiprocessing in older Pythons)
-    logger.debug("querying shard %s num_best=%s in process %s" % (shard, shard.num_best, os.getpid()))
-    result = shard[query]
+    """
+    Query a shard with `args`, a `(query, shard)` 2-tuple, or a `(query, shard, num_best,
+    normalize)` 4-tuple; without the settings, those of the shard (`shard.num_best` and
+    `shard.normalize`) are used.
+
+    """
+    query, shard = args[:2] # simulate starmap (not part of multiprocessing in older Pythons)
+    if len(args) > 2:
+        num_best, normalize = args[2:]
+    else:
+        num_best, normalize = shard.num_best, shard.normalize
+    logger.debug("querying shard %s num_best=%s in process %s" % (shard, num_best, os.getpid()))
+    if 'index' not in shard.__dict__:
+        # a shard unpickled in a worker process: use the cached index, if any
+        shard.index = load_shard_index(shard)
+    result = shard.query(query, num_best, normalize)
     logger.debug("finished querying shard %s in process %s" % (shard, os.getpid()))
     return result
 
 
+class ShardQueryPool(object):
+    """
+    A long-lived pool of workers that query the shards of a `Similarity` index in
+    parallel, kept alive across queries (see `Similarity.start_query_pool`).
+
+    With `mode='process'`, each worker process mmaps every shard once and keeps it
+    mapped for all subsequent queries. With `mode='thread'`, the shards are queried
+    by threads of the current process, which share the shards already loaded here;
+    this scales as long as the queries are dominated by numpy/scipy operations that
+    release the GIL (matrix products with BLAS), and has no process start-up or
+    pickling overhead at all.
+
+    """
+    def __init__(self, workers=None, mode='thread'):
+        if mode not in ('thread', 'process'):
+            raise ValueError("unknown query pool mode %r; expected 'thread' or 'process'" % mode)
+        self.workers = workers or multiprocessing.cpu_count()
+        self.mode = mode
+        if mode == 'thread':
+            from multiprocessing.pool import ThreadPool
+            self.pool = ThreadPool(self.workers)
+        else:
+            self.pool = multiprocessing.Pool(self.workers)
+        logger.info("started shard query pool of %i %s workers" % (self.workers, mode))
+
+    def __str__(self):
+        return "ShardQueryPool(%i %s workers)" % (self.workers, self.mode)
+
+    def map(self, query, shards, num_best=None, normalize=True):
+        """Return the list of `shard.query(query, num_best, normalize)` results, one for each shard in `shards`."""
+        return self.pool.map(query_shard, [(query, shard, num_best, normalize) for shard in shards], chunksize=1)
+
+    def imap(self, query, shards, num_best=None, normalize=True):
+        """Like `map`, but yield the results one by one, as they become available (in order)."""
+        return self.pool.imap(query_shard, [(query, shard, num_best, normalize) for shard in shards], chunksize=1)
+
+    def close(self):
+        """Stop all workers. The pool is not usable after calling this method."""
+        self.pool.terminate()
+        self.pool.join()
+#endclass ShardQueryPool
+
+
 
 class Similarity(interfaces.SimilarityABC):
     """
@@ -154,7 +264,8 @@ class Similarity(interfaces.SimilarityABC):
     The shards themselves are simply stored as files to disk and mmap'ed back as needed.
 
     """
-    def __init__(self, output_prefix, corpus, num_features, num_best=None, chunksize=256, shardsize=32768):
+    def __init__(self, output_prefix, corpus, num_features, num_best=None, chunksize=256, shardsize=32768,
+                 quantize=None, rerank=None, inverted=False):
         """
         Construct the index from `corpus`. The index can be later extended by calling
         the `add_documents` method. **Note**: documents are split (internally, transparently)
@@ -188,6 +299,13 @@ class Similarity(interfaces.SimilarityABC):
         You can also override `num_best` dynamically, simply by setting e.g.
         `self.num_best = 10` before doing a query.
 
+        Set `quantize` to 'int8' or 'float16' to store dense shards as compressed
+        `QuantizedMatrixSimilarity` indexes, optionally re-ranking the top `rerank`
+        candidates of each shard exactly. Sparse shards are not affected.
+
+        Set `inverted=True` to store sparse shards as `InvertedIndexSimilarity`
+        indexes, which answer `num_best` queries faster.
+
         """
         if output_prefix is None:
             # undocumented feature: set output_prefix=None to create the server in temp
@@ -200,8 +318,17 @@ class Similarity(interfaces.SimilarityABC):
         self.normalize = True
         self.chunksize = int(chunksize)
         self.shardsize = shardsize
+        self.quantize = quantize
+        self.rerank = rerank
+        self.inverted = inverted
         self.shards = []
-        self.fresh_docs, self.fresh_nnz = [], 0
+        self.fresh_docs, self.fresh_nnz, self.fresh_ids = [], 0, []
+        self.next_id = 0  # id of the next added document, unless given explicitly
+        self.next_shardid = 0
+        self.id2loc = None  # external id => (shard, position in shard); built on demand
+        self.lock = threading.RLock()
+        self.query_pool = None
+        self.latencies = deque(maxlen=10000)  # wall-clock seconds of the most recent queries
 
         if corpus is not None:
             self.add_documents(corpus)
@@ -211,23 +338,61 @@ class Similarity(interfaces.SimilarityABC):
         return len(self.fresh_docs) + sum([len(shard) for shard in self.shards])
 
 
+    def num_deleted(self):
+        """Return the number of deleted documents, which still take up space until `compact()`."""
+        return sum([len(getattr(shard, 'deleted', ())) for shard in self.shards])
+
+
+    def mutex(self):
+        """Return the lock that guards all modifications of the index (which may run in the background)."""
+        if getattr(self, 'lock', None) is None:
+            self.lock = threading.RLock()  # index loaded from disk or an older version
+        return self.lock
+
+
     def __str__(self):
         return ("Similarity index with %i documents in %i shards (stored under %s)" %
                 (len(self), len(self.shards), self.output_prefix))
 
 
-    def add_documents(self, corpus):
+    def add_documents(self, corpus, ids=None):
         """
         Extend the index with new documents.
 
+        `ids` are the external ids of the documents (any hashable objects, such as strings),
+        one for each document in `corpus`. The ids are used in query results with `num_best`
+        and by `delete_documents()`; they must be unique. By default, documents are numbered
+        0, 1, 2... in the order they were added, i.e. the id is the document position, until
+        the index is compacted.
+
+        Raise ValueError if an id is repeated or already in the index, or if the number of
+        ids and documents differs (for a `corpus` without len(), the documents before the
+        mismatch are added).
+
         Internally, documents are buffered and then spilled to disk when there's
         `self.shardsize` of them (or when a query is issued).
         """
+        with self.mutex():
+            self._add_documents(corpus, ids)
+
+
+    def _add_documents(self, corpus, ids):
+        if not hasattr(self, 'fresh_ids'):
+            # index created by an older version: document ids are document positions
+            self.fresh_ids, self.next_id = None, len(self)
+        if ids is not None:
+            ids = list(ids)
+            self._check_new_ids(ids)
+            if hasattr(corpus, '__len__') and len(corpus) != len(ids):
+                raise ValueError("got %i ids for %i documents" % (len(ids), len(corpus)))
+            num_added = 0
         min_ratio = 1.0 # 0.5 to only reopen shards that are <50% complete
         if self.shards and len(self.shards[-1]) < min_ratio * self.shardsize:
             # The last shard was incomplete (<; load it back and add the documents there, don't start a new shard
             self.reopen_shard()
         for doc in corpus:
+            if ids is not None and num_added == len(ids):
+                raise ValueError("got %i ids for more documents" % len(ids))
             if isinstance(doc, numpy.ndarray):
                 doclen = len(doc)
             elif scipy.sparse.issparse(doc):
@@ -240,10 +405,36 @@ class Similarity(interfaces.SimilarityABC):
                     doc = matutils.unitvec(matutils.sparse2full(doc, self.num_features))
             self.fresh_docs.append(doc)
             self.fresh_nnz += doclen
+            if ids is not None:
+                docid = ids[num_added]
+                num_added += 1
+            else:
+                docid = self.next_id
+                self.next_id += 1
+            if self.fresh_ids is not None:
+                self.fresh_ids.append(docid)
+            self.id2loc = None  # rebuild on next use
             if len(self.fresh_docs) >= self.shardsize:
                 self.close_shard()
             if len(self.fresh_docs) % 10000 == 0:
                 logger.info("PROGRESS: fresh_shard size=%i" % len(self.fresh_docs))
+        if ids is not None and num_added != len(ids):
+            raise ValueError("got %i ids for %i documents" % (len(ids), num_added))
+
+
+    def _check_new_ids(self, ids):
+        """Raise ValueError if any of the document ids `ids` is repeated, or already in the index."""
+        if len(set(ids)) != len(ids):
+            raise ValueError("document ids must be unique")
+        fresh_ids = set(self.fresh_ids or ())
+        for docid in ids:
+            if docid in fresh_ids:
+                raise ValueError("document %r already in index" % (docid,))
+            try:
+                self.locate(docid)
+            except KeyError:
+                continue
+            raise ValueError("document %r already in index" % (docid,))
 
 
     def shardid2filename(self, shardid):
@@ -264,20 +455,27 @@ class Similarity(interfaces.SimilarityABC):
         """
         if not self.fresh_docs:
             return
-        shardid = len(self.shards)
+        shardid = getattr(self, 'next_shardid', len(self.shards))
+        self.next_shardid = shardid + 1
         # consider the shard sparse if its density is < 30%
         issparse = 0.3 > 1.0 * self.fresh_nnz / (len(self.fresh_docs) * self.num_features)
         if issparse:
-            index = SparseMatrixSimilarity(self.fresh_docs, num_terms=self.num_features,
-                                           num_docs=len(self.fresh_docs), num_nnz=self.fresh_nnz)
+            cls = InvertedIndexSimilarity if getattr(self, 'inverted', False) else SparseMatrixSimilarity
+            index = cls(self.fresh_docs, num_terms=self.num_features,
+                        num_docs=len(self.fresh_docs), num_nnz=self.fresh_nnz)
+        elif getattr(self, 'quantize', None):
+            index = QuantizedMatrixSimilarity(self.fresh_docs, num_features=self.num_features,
+                                              quantize=self.quantize, rerank=self.rerank)
         else:
             index = MatrixSimilarity(self.fresh_docs, num_features=self.num_features)
         logger.info("creating %s shard #%s" % ('sparse' if issparse else 'dense', shardid))
-        shard = Shard(self.shardid2filename(shardid), index)
+        shard = Shard(self.shardid2filename(shardid), index, ids=getattr(self, 'fresh_ids', None))
         shard.num_best = self.num_best
         shard.num_nnz = self.fresh_nnz
         self.shards.append(shard)
         self.fresh_docs, self.fresh_nnz = [], 0
+        if getattr(self, 'fresh_ids', None) is not None:
+            self.fresh_ids = []
 
 
     def reopen_shard(self):
@@ -288,30 +486,228 @@ class Similarity(interfaces.SimilarityABC):
         last_index = last_shard.get_index()
         logger.info("reopening an incomplete shard of %i documents" % len(last_shard))
 
-        self.fresh_docs = list(last_index.index)
-        self.fresh_nnz = last_shard.num_nnz
+        # deleted documents are not carried over
+        deleted = getattr(last_shard, 'deleted', ())
+        keep = [pos for pos in xrange(len(last_shard)) if pos not in deleted]
+        self.fresh_docs = [last_index.index[pos] for pos in keep]
+        self.fresh_nnz = int(round(1.0 * last_shard.num_nnz * len(keep) / len(last_shard)))
+        if getattr(last_shard, 'ids', None) is not None:
+            self.fresh_ids = [last_shard.ids[pos] for pos in keep]
+        next_shardid = getattr(self, 'next_shardid', len(self.shards))
+        if last_shard.fname == os.path.basename(self.shardid2filename(next_shardid - 1)):
+            next_shardid -= 1  # closing the reopened shard will simply overwrite its file
+        self.next_shardid = next_shardid
+        self.id2loc = None
         del self.shards[-1] # remove the shard from index, *but its file on disk is not deleted*
         logger.debug("reopen complete")
 
 
-    def query_shards(self, query):
+    def locate(self, docid):
+        """
+        Return `(shard, position within shard)` of the (not deleted) document with
+        external id `docid`. Raise KeyError if there is no such document.
+
+        """
+        if getattr(self, 'id2loc', None) is None:
+            logger.info("building document id mapping for %i documents" % len(self))
+            id2loc, offset = {}, 0
+            for shard in self.shards:
+                ids, deleted = getattr(shard, 'ids', None), getattr(shard, 'deleted', ())
+                for pos in xrange(len(shard)):
+                    if pos not in deleted:
+                        id2loc[offset + pos if ids is None else ids[pos]] = (shard, pos)
+                offset += len(shard)
+            self.id2loc = id2loc
+        try:
+            return self.id2loc[docid]
+        except KeyError:
+            raise KeyError("document %r not in index" % (docid,))
+
+
+    def delete_documents(self, ids):
+        """
+        Delete the documents with external ids `ids` from the index.
+
+        Deleted documents are never returned in `num_best` query results, and their
+        similarity is 0 in full query results. The documents still take up space on disk,
+        until the shards that contain them are rewritten by `compact()`.
+
+        Raise KeyError if any of the ids is not in the index (then nothing is deleted).
+
+        """
+        ids = list(ids)  # iterated twice below
+        with self.mutex():
+            self.close_shard()
+            locations = [self.locate(docid) for docid in ids]
+            for docid, (shard, pos) in zip(ids, locations):
+                if not hasattr(shard, 'deleted'):
+                    shard.deleted = set()
+                shard.deleted.add(pos)
+                self.id2loc.pop(docid, None)
+            logger.info("deleted %i documents, %i deleted documents in index" % (len(locations), self.num_deleted()))
+
+
+    def update_documents(self, corpus, ids):
+        """
+        Replace the documents with external ids `ids` by the new documents in `corpus`.
+        Ids that are not in the index yet are simply added.
+
+        The old version of each document is deleted and the new version appended
+        to the index, so that positions of updated documents change.
+
+        """
+        ids = list(ids)
+        with self.mutex():
+            self.close_shard()
+            existing = []
+            for docid in ids:
+                try:
+                    self.locate(docid)
+                    existing.append(docid)
+                except KeyError:
+                    pass
+            self.delete_documents(existing)
+            self.add_documents(corpus, ids=ids)
+
+
+    def compact(self, min_deleted=0.1, background=False):
+        """
+        Rewrite all shards in which deleted documents make up at least a `min_deleted`
+        fraction of all documents, dropping the deleted documents for good. Shards that end
+        up empty are removed. Positions of the remaining documents change, but their
+        external ids (see `add_documents()`) stay the same.
+
+        The rewritten shards are built without blocking queries; each is swapped into
+        the index once it is complete. Documents deleted in the meantime stay deleted.
+
+        With `background=True`, run the compaction in a new thread, and return the thread.
+        Otherwise, return the number of rewritten shards.
+
+        """
+        if background:
+            thread = threading.Thread(target=self.compact, kwargs={'min_deleted': min_deleted})
+            thread.daemon = True
+            thread.start()
+            return thread
+
+        with self.mutex():
+            self.close_shard()
+            if self.shards and getattr(self.shards[0], 'ids', None) is None:
+                # index created by an older version: store the (implicit) ids explicitly before
+                # compaction changes the document positions
+                offset = 0
+                for shard in self.shards:
+                    shard.ids = list(xrange(offset, offset + len(shard)))
+                    offset += len(shard)
+                self.fresh_ids, self.next_id = [], max(getattr(self, 'next_id', 0), offset)
+            todo = [(shard, frozenset(shard.deleted)) for shard in self.shards
+                    if getattr(shard, 'deleted', None) and len(shard.deleted) >= min_deleted * len(shard)]
+
+        for shard, deleted in todo:
+            keep = [pos for pos in xrange(len(shard)) if pos not in deleted]
+            logger.info("compacting %s: dropping %i deleted documents" % (shard, len(deleted)))
+            new_shard = None
+            if keep:
+                index = shard.get_index()
+                compacted = copy.copy(index)
+                compacted.index = index.index[keep]
+                if isinstance(compacted, QuantizedMatrixSimilarity):
+                    compacted.quantize()
+                elif isinstance(compacted, InvertedIndexSimilarity):
+                    compacted.index.sort_indices()
+                with self.mutex():
+                    shardid = getattr(self, 'next_shardid', len(self.shards))
+                    self.next_shardid = shardid + 1
+                new_shard = Shard(self.shardid2filename(shardid), compacted, ids=[shard.ids[pos] for pos in keep])
+                new_shard.num_best = self.num_best
+                new_shard.num_nnz = int(round(1.0 * shard.num_nnz * len(keep) / len(shard)))
+            with self.mutex():
+                shard_no = [i for i, other in enumerate(self.shards) if other is shard]
+                if not shard_no:
+                    # the shard was reopened (or compacted) in the meantime; throw away our version
+                    if new_shard is not None:
+                        self.remove_shard_files(new_shard)
+                    continue
+                if new_shard is None:
+                    del self.shards[shard_no[0]]
+                else:
+                    # carry over documents deleted while we were compacting
+                    new_pos = dict((pos, i) for i, pos in enumerate(keep))
+                    new_shard.deleted = set(new_pos[pos] for pos in shard.deleted - deleted)
+                    self.shards[shard_no[0]] = new_shard
+                self.id2loc = None
+            self.remove_shard_files(shard)
+        logger.info("compacted %i shards; %s" % (len(todo), self))
+        return len(todo)
+
+
+    def remove_shard_files(self, shard):
+        """Delete the files of `shard`, which must not be a part of this index anymore."""
+        import glob
+        for fname in [shard.fullname()] + glob.glob(shard.fullname() + '.*'):
+            logger.debug("deleting %s" % fname)
+            os.remove(fname)
+
+
+    def start_query_pool(self, workers=None, mode='thread'):
+        """
+        Start a pool of `workers` (default: number of CPUs) that query the shards in
+        parallel from now on, until `close_query_pool()` is called. The workers are
+        reused by all subsequent queries; see `ShardQueryPool` for the `mode` options.
+
+        """
+        self.close_query_pool()
+        self.query_pool = ShardQueryPool(workers, mode=mode)
+
+
+    def close_query_pool(self):
+        """Stop the workers started by `start_query_pool`, if any."""
+        if getattr(self, 'query_pool', None) is not None:
+            self.query_pool.close()
+            self.query_pool = None
+
+
+    def query_shards(self, query, shards=None, num_best=None, normalize=None):
         """
         Return the result of applying shard[query] for each shard in self.shards,
-        as a sequence.
+        as a list; `num_best` and `normalize` default to those of the index.
 
-        If PARALLEL_SHARDS is set, the shards are queried in parallel, using
-        the multiprocessing module.
+        The shards are queried in parallel by the pool started by `start_query_pool`,
+        if any. Otherwise, if PARALLEL_SHARDS is set, a pool of PARALLEL_SHARDS
+        processes is started for this query only.
         """
-        args = zip([query] * len(self.shards), self.shards)
-        if PARALLEL_SHARDS and PARALLEL_SHARDS > 1:
-            logger.debug("spawning %i query processes" % PARALLEL_SHARDS)
-            pool = multiprocessing.Pool(PARALLEL_SHARDS)
-            result = pool.imap(query_shard, args, chunksize=1 + len(args) / PARALLEL_SHARDS)
-        else:
-            # serial processing, one shard after another
-            pool = None
-            result = imap(query_shard, args)
-        return pool, result
+        if shards is None:
+            shards = self.shards
+        if num_best is None:
+            num_best = self.num_best
+        if normalize is None:
+            normalize = self.normalize
+        if len(shards) > 1:
+            if getattr(self, 'query_pool', None) is not None:
+                return self.query_pool.map(query, shards, num_best, normalize)
+            if PARALLEL_SHARDS and PARALLEL_SHARDS > 1:
+                logger.debug("spawning %i query processes" % PARALLEL_SHARDS)
+                pool = ShardQueryPool(PARALLEL_SHARDS, mode='process')
+                try:
+                    return pool.map(query, shards, num_best, normalize)
+                finally:
+                    pool.close()
+        # serial processing, one shard after another
+        return [query_shard((query, shard, num_best, normalize)) for shard in shards]
+
+
+    def latency_stats(self):
+        """
+        Return statistics of the wall-clock latency (in seconds) of the most recent
+        queries to this index, as a dict with keys `queries` (number of queries the
+        statistics are computed from), `mean`, `p50` (median) and `p99`.
+
+        """
+        latencies = numpy.array(getattr(self, 'latencies', []), dtype=float)
+        if not len(latencies):
+            return {'queries': 0, 'mean': None, 'p50': None, 'p99': None}
+        p50, p99 = numpy.percentile(latencies, [50, 99])
+        return {'queries': len(latencies), 'mean': latencies.mean(), 'p50': p50, 'p99': p99}
 
 
     def __getitem__(self, query):
@@ -323,34 +719,39 @@ class Similarity(interfaces.SimilarityABC):
         of all query documents vs. all corpus document. This batch query is more
         efficient than computing the similarities one document after another.
         """
-        self.close_shard() # no-op if no documents added to index since last query
-
-        # reset num_best and normalize parameters, in case they were changed dynamically
-        for shard in self.shards:
-            shard.num_best = self.num_best
-            shard.normalize = self.normalize
+        start = default_timer()
+        with self.mutex():
+            self.close_shard() # no-op if no documents added to index since last query
+            shards = list(self.shards) # the shards may be swapped by a concurrent compaction
 
         # there are 4 distinct code paths, depending on whether input `query` is
         # a corpus (or numpy/scipy matrix) or a single document, and whether the
         # similarity result should be a full array or only num_best most similar
         # documents.
-        pool, shard_results = self.query_shards(query)
-        if self.num_best is None:
+        # the current num_best and normalize (they may be changed dynamically) are passed
+        # along with the query, rather than set on the shards shared by concurrent queries
+        num_best = self.num_best
+        shard_results = self.query_shards(query, shards, num_best, self.normalize)
+        if num_best is None:
             # user asked for all documents => just stack the sub-results into a single matrix
             # (works for both corpus / single doc query)
             result = numpy.hstack(shard_results)
         else:
             # the following uses a lot of lazy evaluation and (optionally) parallel
             # processing, to improve query latency and minimize memory footprint.
-            offsets = numpy.cumsum([0] + [len(shard) for shard in self.shards])
-            convert = lambda doc, shard_no: [(doc_index + offsets[shard_no], sim)
-                                             for doc_index, sim in doc]
+            offsets = numpy.cumsum([0] + [len(shard) for shard in shards])
+
+            def convert(doc, shard_no):
+                # convert positions within the shard to external document ids
+                docids = self.docids(shards[shard_no], offsets[shard_no], [doc_index for doc_index, _ in doc])
+                return list(zip(docids, [sim for _, sim in doc]))
             is_corpus, query = utils.is_corpus(query)
             is_corpus = is_corpus or hasattr(query, 'ndim') and query.ndim > 1 and query.shape[0] > 1
             if not is_corpus:
                 # user asked for num_best most similar and query is a single doc
+                # each shard result is already sorted => only merge the heads of the sorted lists
                 results = (convert(result, shard_no) for shard_no, result in enumerate(shard_results))
-                result = heapq.nlargest(self.num_best, itertools.chain(*results), key=lambda item: item[1])
+                result = topk.merge(results, num_best)
             else:
                 # the trickiest combination: returning num_best results when query was a corpus
                 results = []
@@ -359,16 +760,117 @@ class Similarity(interfaces.SimilarityABC):
                     results.append(shard_result)
                 result = []
                 for parts in izip(*results):
-                    merged = heapq.nlargest(self.num_best, itertools.chain(*parts), key=lambda item: item[1])
+                    merged = topk.merge(parts, num_best)
                     result.append(merged)
-        if pool:
-            # gc doesn't seem to collect the Pools, eventually leading to
-            # "IOError 24: too many open files". so let's terminate it manually.
-            pool.terminate()
 
+        if not hasattr(self, 'latencies'):
+            self.latencies = deque(maxlen=10000)  # index loaded from an older version
+        self.latencies.append(default_timer() - start)
         return result
 
 
+    def docids(self, shard, offset, positions):
+        """
+        Return the external ids of the documents at `positions` within `shard`, which
+        starts at (global) document position `offset` in the index.
+
+        """
+        ids = getattr(shard, 'ids', None)
+        if ids is None:
+            return [int(offset + pos) for pos in positions]
+        return [ids[pos] for pos in positions]
+
+
+    def query_chunks(self, queries, chunksize=None, num_best=None, threshold=None):
+        """
+        Query the index with every document of the corpus `queries`, processing
+        `chunksize` (default: `self.chunksize`) query documents at a time.
+
+        For each chunk, yield a list with one sparse result per query document: a list of
+        `(document id, similarity)` 2-tuples. With `num_best`, each result holds the
+        `num_best` most similar documents (most similar first), as in `self[query]`. Otherwise,
+        it holds all documents whose similarity is at least `threshold` (all non-zero
+        similarities by default), in index order.
+
+        Unlike `self[queries]` with `num_best=None`, which builds a dense matrix of
+        `len(queries) x len(self)` floats, this needs memory for `chunksize x shardsize`
+        floats at a time (per worker of the query pool, if one was started), plus the
+        sparse results of one chunk.
+
+        """
+        if chunksize is None:
+            chunksize = self.chunksize
+        with self.mutex():
+            self.close_shard()
+            shards = list(self.shards)
+        offsets = numpy.cumsum([0] + [len(shard) for shard in shards])
+        normalize = self.normalize
+
+        for chunk in utils.grouper(queries, chunksize):
+            if getattr(self, 'query_pool', None) is not None and len(shards) > 1:
+                shard_results = self.query_pool.imap(chunk, shards, num_best, normalize)
+            else:
+                shard_results = (query_shard((chunk, shard, num_best, normalize)) for shard in shards)
+            parts = [[] for _ in chunk]  # for each query document, its results from each shard
+            for shard_no, shard_result in enumerate(shard_results):
+                shard = shards[shard_no]
+                if num_best is not None:
+                    for query_parts, doc in zip(parts, shard_result):
+                        docids = self.docids(shard, offsets[shard_no], [pos for pos, _ in doc])
+                        query_parts.append([(docid, float(sim)) for docid, (_, sim) in zip(docids, doc)
+                                            if threshold is None or sim >= threshold])
+                else:
+                    # convert the dense `len(chunk) x len(shard)` block to sparse right away
+                    shard_result = numpy.atleast_2d(shard_result)
+                    if threshold is None:
+                        selected = numpy.abs(shard_result) > 1e-9
+                    else:
+                        selected = shard_result >= threshold
+                    deleted = getattr(shard, 'deleted', None)
+                    if deleted:
+                        # deleted documents have similarity 0, which may pass a threshold <= 0
+                        selected[:, sorted(deleted)] = False
+                    rows, cols = numpy.nonzero(selected)
+                    sims = shard_result[rows, cols]
+                    docids = self.docids(shard, offsets[shard_no], cols)
+                    bounds = numpy.searchsorted(rows, numpy.arange(len(chunk) + 1))
+                    for row, query_parts in enumerate(parts):
+                        start, end = bounds[row], bounds[row + 1]
+                        query_parts.append(list(zip(docids[start: end], sims[start: end].tolist())))
+            if num_best is not None:
+                yield [topk.merge(query_parts, num_best) for query_parts in parts]
+            else:
+                yield [list(itertools.chain(*query_parts)) for query_parts in parts]
+
+
+    def save_similarities(self, fname, queries, chunksize=None, num_best=None, threshold=None):
+        """
+        Query the index with every document of the corpus `queries` (see `query_chunks`)
+        and store the results to disk under `fname`, as a `MmCorpus` with one "document"
+        per query, whose features are ids of the similar documents, so that results never
+        need to fit in RAM. Document ids must be integers (which they are, unless given
+        explicitly to `add_documents`).
+
+        Return the number of stored results.
+
+        >>> index.save_similarities('/tmp/sims.mm', corpus, threshold=0.8)
+        >>> sims = MmCorpus('/tmp/sims.mm')  # sims[i] = documents similar to corpus[i], with their similarity
+
+        """
+        from gensim.corpora import MmCorpus
+
+        num_queries = [0]
+
+        def results():
+            for chunk_results in self.query_chunks(queries, chunksize=chunksize, num_best=num_best, threshold=threshold):
+                for result in chunk_results:
+                    num_queries[0] += 1
+                    yield result
+
+        MmCorpus.serialize(fname, results())
+        return num_queries[0]
+
+
     def vector_by_id(self, docpos):
         """
         Return indexed vector corresponding to the document at position `docpos`.
@@ -458,9 +960,12 @@ class Similarity(interfaces.SimilarityABC):
         Calls `close_shard` internally to spill any unfinished shards to disk first.
 
         """
-        self.close_shard()
+        with self.mutex():
+            self.close_shard()
         if fname is None:
             fname = self.output_prefix
+        # worker pools and locks can't be stored; the id mapping is rebuilt on demand
+        kwargs['ignore'] = sorted(set(kwargs.get('ignore', [])) | set(['query_pool', 'lock', 'id2loc']))
         super(Similarity, self).save(fname, *args, **kwargs)
 
     def destroy(self):
@@ -470,6 +975,7 @@ class Similarity(interfaces.SimilarityABC):
 
         """
         import glob
+        self.close_query_pool()
         for fname in glob.glob(self.output_prefix + '*'):
             logger.info("deleting %s" % fname)
             os.remove(fname)
@@ -544,6 +1050,19 @@ class MatrixSimilarity(interfaces.SimilarityABC):
 
         **Do not use this function directly; use the self[query] syntax instead.**
 
+        """
+        query = self.dense_query(query)
+
+        # do a little transposition dance to stop numpy from making a copy of
+        # self.index internally in numpy.dot (very slow).
+        result = numpy.dot(self.index, query.T).T  # return #queries x #index
+        return result  # XXX: removed casting the result from array to list; does anyone care?
+
+    def dense_query(self, query):
+        """
+        Convert `query` (a document or a corpus, see `get_similarities`) to a dense
+        1d (single document) or 2d (one row per document) array of the index dtype.
+
         """
         is_corpus, query = utils.is_corpus(query)
         if is_corpus:
@@ -559,17 +1078,108 @@ class MatrixSimilarity(interfaces.SimilarityABC):
                 # default case: query is a single vector in sparse gensim format
                 query = matutils.sparse2full(query, self.num_features)
             query = numpy.asarray(query, dtype=self.index.dtype)
-
-        # do a little transposition dance to stop numpy from making a copy of
-        # self.index internally in numpy.dot (very slow).
-        result = numpy.dot(self.index, query.T).T  # return #queries x #index
-        return result  # XXX: removed casting the result from array to list; does anyone care?
+        return query
 
     def __str__(self):
         return "%s<%i docs, %i features>" % (self.__class__.__name__, len(self), self.index.shape[1])
 #endclass MatrixSimilarity
 
 
+class QuantizedMatrixSimilarity(MatrixSimilarity):
+    """
+    Like `MatrixSimilarity`, but similarities are computed from a compressed copy
+    of the index:
+
+    * `quantize='int8'`: each document vector is stored as 8-bit integers, plus one
+      float scaling factor per document (~4x smaller than float32),
+    * `quantize='float16'`: half-precision floats (2x smaller).
+
+    The similarities are therefore approximate. To make the top of the result exact,
+    set `rerank` to a number of candidates: the `rerank` most similar documents of each
+    query get their similarity recomputed from the exact (float32) vectors.
+
+    The exact vectors are stored in `self.index`, as in `MatrixSimilarity`. When the
+    index is saved and loaded back with `load(fname, mmap='r')`, queries only read the
+    compressed codes (plus the exact vectors of the re-ranked candidates), so that only
+    the codes need to fit into RAM / the OS page cache, not the exact vectors.
+
+    Use as a stand-alone index, or as the dense shard type of a `Similarity` index
+    (see its `quantize` parameter).
+
+    """
+    def __init__(self, corpus, num_best=None, num_features=None, chunksize=256, corpus_len=None,
+                 quantize='int8', rerank=None, blocksize=65536):
+        """
+        `blocksize` is the number of documents decoded from the compressed codes at once
+        during a query. See `MatrixSimilarity` for the other parameters.
+
+        """
+        if quantize not in ('int8', 'float16'):
+            raise ValueError("unknown quantization %r; expected 'int8' or 'float16'" % quantize)
+        self.quantization = quantize
+        self.rerank = rerank
+        self.blocksize = blocksize
+        super(QuantizedMatrixSimilarity, self).__init__(
+            corpus, num_best=num_best, dtype=numpy.float32, num_features=num_features,
+            chunksize=chunksize, corpus_len=corpus_len)
+        if corpus is not None:
+            self.quantize()
+
+    def quantize(self):
+        """(Re)compute the compressed codes from the exact document vectors in `self.index`."""
+        num_docs = len(self)
+        if self.quantization == 'float16':
+            self.codes = numpy.empty(self.index.shape, dtype=numpy.float16)
+            self.scales = None
+        else:
+            self.codes = numpy.empty(self.index.shape, dtype=numpy.int8)
+            self.scales = numpy.empty(num_docs, dtype=numpy.float32)
+        for start in xrange(0, num_docs, self.blocksize):
+            block = numpy.asarray(self.index[start: start + self.blocksize], dtype=numpy.float32)
+            if self.scales is None:
+                self.codes[start: start + self.blocksize] = block
+            else:
+                # symmetric scaling, so that the greatest magnitude in each row maps to +-127
+                scales = numpy.abs(block).max(axis=1) / 127.0 if block.shape[1] else numpy.ones(len(block))
+                scales[scales == 0] = 1.0
+                self.codes[start: start + self.blocksize] = numpy.rint(block / scales[:, numpy.newaxis])
+                self.scales[start: start + self.blocksize] = scales
+        logger.info("quantized %i documents to %s: %i bytes instead of %i",
+                    num_docs, self.quantization, self.codes.nbytes, self.index.nbytes)
+
+    def get_similarities(self, query):
+        """
+        Return the (approximate) similarity of `query` to all documents in the index;
+        see `MatrixSimilarity.get_similarities`.
+
+        **Do not use this function directly; use the self[query] syntax instead.**
+
+        """
+        query = self.dense_query(query)
+        queries = numpy.atleast_2d(query)
+        result = numpy.empty((len(queries), len(self)), dtype=numpy.float32)
+        for start in xrange(0, len(self), self.blocksize):
+            end = min(len(self), start + self.blocksize)
+            sims = numpy.dot(queries, self.codes[start: end].astype(numpy.float32).T)
+            if self.scales is not None:
+                sims *= self.scales[start: end]
+            result[:, start: end] = sims
+
+        if self.rerank:
+            # recompute the most similar candidates from the exact vectors
+            candidates, _ = topk.topk_rows(result, self.rerank, reverse=True)
+            for row, docs in enumerate(candidates):
+                docs = numpy.sort(docs)  # read the (possibly mmap'ed) index sequentially
+                result[row, docs] = numpy.dot(self.index[docs], queries[row])
+
+        return result[0] if query.ndim == 1 else result
+
+    def __str__(self):
+        return "%s<%i docs, %i features, %s>" % (
+            self.__class__.__name__, len(self), self.index.shape[1], self.quantization)
+#endclass QuantizedMatrixSimilarity
+
+
 class SparseMatrixSimilarity(interfaces.SimilarityABC):
     """
     Compute similarity against a corpus of documents by storing the sparse index
@@ -658,3 +1268,144 @@ class SparseMatrixSimilarity(interfaces.SimilarityABC):
             result = result.toarray().T
         return result
 #endclass SparseMatrixSimilarity
+
+
+class InvertedIndexSimilarity(SparseMatrixSimilarity):
+    """
+    Like `SparseMatrixSimilarity`, but stored as an inverted index (for each feature,
+    the list of documents that contain it, with their weights), so that top-N queries
+    (`num_best` set) only touch the postings of the query features and never build a
+    similarity vector over all documents.
+
+    Queries are scored term-at-a-time with MaxScore pruning: query features are
+    processed in the order of decreasing contribution upper bounds. As soon as the
+    remaining features can no longer lift a document that hasn't been seen yet into
+    the top-N, only the already collected candidate documents are scored further.
+    The pruning is exact (same top-N as a full scan) for non-negative weights, such as
+    tf-idf; with negative weights, all postings of the query features are scored.
+
+    Use this for sparse, high-dimensional indexes (bag-of-words, tf-idf) queried with
+    `num_best`. Queries without `num_best` behave exactly as in `SparseMatrixSimilarity`.
+
+    """
+    def __init__(self, corpus, num_features=None, num_terms=None, num_docs=None, num_nnz=None,
+                 num_best=None, chunksize=500, dtype=numpy.float32):
+        super(InvertedIndexSimilarity, self).__init__(
+            corpus, num_features=num_features, num_terms=num_terms, num_docs=num_docs, num_nnz=num_nnz,
+            num_best=num_best, chunksize=chunksize, dtype=dtype)
+        if corpus is not None:
+            # documents x features in CSC = the postings list of each feature, sorted by document
+            self.index = self.index.tocsc()
+            self.index.sort_indices()
+            data = abs(self.index.data)
+            self.max_weights = numpy.zeros(self.index.shape[1], dtype=self.index.dtype)
+            nonempty = numpy.diff(self.index.indptr) > 0
+            self.max_weights[nonempty] = numpy.maximum.reduceat(data, self.index.indptr[:-1][nonempty])
+            self.nonnegative = not len(self.index.data) or self.index.data.min() >= 0
+            logger.info("created inverted index over %i features" % self.index.shape[1])
+
+    def __getitem__(self, query):
+        """
+        Get similarities of `query` (a document or a corpus) to the indexed documents,
+        see `SimilarityABC.__getitem__`.
+
+        """
+        if self.num_best is None:
+            return super(InvertedIndexSimilarity, self).__getitem__(query)
+        if scipy.sparse.issparse(query):
+            rows = [query.getrow(row) for row in xrange(query.shape[0])]
+            return self.top_similar(rows[0]) if len(rows) == 1 else [self.top_similar(row) for row in rows]
+        if isinstance(query, numpy.ndarray) and query.ndim == 2:
+            return [self.top_similar(row) for row in query]
+        is_corpus, query = utils.is_corpus(query)
+        if is_corpus:
+            return [self.top_similar(doc) for doc in query]
+        return self.top_similar(query)
+
+    def query_terms(self, query):
+        """Return the features and weights of a single query document, as two arrays."""
+        if scipy.sparse.issparse(query):
+            query = [(termid, weight) for termid, weight in matutils.scipy2sparse(query) if weight]
+        elif isinstance(query, numpy.ndarray):
+            query = matutils.full2sparse(query)
+        if self.normalize:
+            # normalized whatever the input type, so scores are on the same scale for all of them
+            query = matutils.unitvec(query)
+        # sum the weights of repeated features, like a matrix product would
+        weights = {}
+        for termid, weight in query:
+            if 0 <= termid < self.index.shape[1]:
+                weights[int(termid)] = weights.get(int(termid), 0.0) + weight
+        terms = numpy.fromiter(iter(weights.keys()), dtype=numpy.intp, count=len(weights))
+        return terms, numpy.array([weights[termid] for termid in terms.tolist()], dtype=self.index.dtype)
+
+    @staticmethod
+    def sum_postings(docs, scores):
+        """
+        Sum the `scores` of the same documents over several postings lists (`docs`);
+        return the sorted unique documents and their total scores.
+
+        """
+        docs, scores = numpy.concatenate(docs), numpy.concatenate(scores)
+        docs, inverse = numpy.unique(docs, return_inverse=True)
+        return docs, numpy.bincount(inverse.ravel(), weights=scores, minlength=len(docs)).astype(scores.dtype)
+
+    def top_similar(self, query, eps=1e-9):
+        """
+        Return the `num_best` most similar documents to a single `query` document,
+        as a list of `(document position, similarity)` 2-tuples, most similar first.
+
+        """
+        topn = self.num_best
+        if topn <= 0:
+            return []
+        terms, weights = self.query_terms(query)
+        indptr, indices, data = self.index.indptr, self.index.indices, self.index.data
+        bounds = numpy.abs(weights) * self.max_weights[terms]
+        order = numpy.argsort(-bounds, kind='mergesort')
+        prune = self.nonnegative and (weights >= 0).all()
+        remaining = bounds.sum()  # upper bound on the similarity that the unprocessed terms can add
+
+        # candidate documents (sorted) with their partial similarities, plus postings not summed in yet
+        docs = numpy.zeros(0, dtype=indices.dtype)
+        scores = numpy.zeros(0, dtype=self.index.dtype)
+        pending_docs, pending_scores, num_pending = [], [], 0
+        collecting = True  # may documents that haven't been seen yet still enter the top-N?
+        for term, weight, bound in zip(terms[order], weights[order], bounds[order]):
+            remaining = max(0.0, remaining - bound)  # clip rounding errors
+            start, end = indptr[term], indptr[term + 1]
+            term_docs, term_scores = indices[start: end], data[start: end] * weight
+            if collecting:
+                pending_docs.append(term_docs)
+                pending_scores.append(term_scores)
+                num_pending += end - start
+                # summing up the postings costs a sort, so only do it (and check the threshold)
+                # once the pending postings outnumber the candidates collected so far
+                if prune and num_pending >= max(len(docs), topn):
+                    docs, scores = self.sum_postings([docs] + pending_docs, [scores] + pending_scores)
+                    pending_docs, pending_scores, num_pending = [], [], 0
+                    if len(docs) >= topn:
+                        threshold = -numpy.partition(-scores, topn - 1)[topn - 1]
+                        # any unseen document scores at most `remaining`; scores only grow
+                        collecting = remaining > threshold
+                        if not collecting:
+                            keep = scores + remaining >= threshold
+                            docs, scores = docs[keep], scores[keep]
+            else:
+                # only update the existing candidates that occur in this term's postings
+                positions = numpy.searchsorted(term_docs, docs)
+                positions[positions == len(term_docs)] = 0
+                found = term_docs[positions] == docs if len(term_docs) else numpy.zeros(len(docs), dtype=bool)
+                scores[found] += term_scores[positions[found]]
+                # drop candidates that cannot reach the top-N anymore
+                threshold = -numpy.partition(-scores, topn - 1)[topn - 1]
+                keep = scores + remaining >= threshold
+                docs, scores = docs[keep], scores[keep]
+        if pending_docs:
+            docs, scores = self.sum_postings([docs] + pending_docs, [scores] + pending_scores)
+
+        nonzero = numpy.abs(scores) > eps
+        docs, scores = docs[nonzero], scores[nonzero]
+        best = topk.argtopk(scores, topn, reverse=True)
+        return [(int(docs[pos]), float(scores[pos])) for pos in best]
+#endclass InvertedIndexSimilarity
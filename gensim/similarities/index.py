@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+This module contains approximate nearest neighbour ("ANN") indexes over dense,
+L2-normalized vectors, such as word vectors of a `Word2Vec` model or document
+vectors of a `Doc2Vec` model.
+
+An exact `most_similar` query computes the cosine similarity of the query to
+every single vector, which is O(number of vectors * dimensionality) per query.
+An indexer only looks at a small set of candidate vectors that are likely to be
+close to the query, and ranks these candidates exactly. The result is approximate:
+some of the true nearest neighbours may be missed.
+
+The indexer plugs into the existing API of the models:
+
+>>> indexer = RandomProjectionIndexer(model, num_trees=10)
+>>> model.most_similar('king', topn=10, indexer=indexer)  # approximate result
+>>> model.most_similar('king', topn=10)  # exact result, as before
+
+and for document vectors:
+
+>>> indexer = RandomProjectionIndexer(doc2vec_model.docvecs, num_trees=10)
+>>> doc2vec_model.docvecs.most_similar(42, indexer=indexer)
+
+Any object with a `most_similar(vector, topn)` method that returns a list of
+`(vector index, cosine similarity)` 2-tuples can be used as an indexer.
+
+"""
+
+
+import heapq
+import logging
+
+import numpy
+
+from gensim import utils, matutils
+from six.moves import xrange
+
+
+logger = logging.getLogger('gensim.similarities.index')
+
+
+class RandomProjectionIndexer(utils.SaveLoad):
+    """
+    Approximate nearest neighbour search by cosine similarity, using a forest of
+    random projection trees (the method of the Annoy library).
+
+    Each tree recursively splits the vectors by random hyperplanes (through the
+    origin, perpendicular to the difference of two randomly picked vectors) until
+    at most `leaf_size` vectors remain in each leaf. A query walks all trees at
+    once, always descending into the most promising unexplored branch, until it has
+    collected `search_k` candidate vectors, and returns the candidates most similar
+    to the query.
+
+    More trees (`num_trees`) mean better accuracy and a larger index; a larger
+    `search_k` means better accuracy and slower queries.
+
+    The index can be stored with `save()` and loaded with `load(fname, mmap='r')`,
+    in which case the trees and vectors are memory-mapped (and shared among all
+    processes that load them), instead of being read into RAM.
+
+    """
+    def __init__(self, model=None, num_trees=10, leaf_size=64, search_k=None, seed=1):
+        """
+        If given, build the index over the normalized vectors of `model`
+        straight away: `model` is either a `Word2Vec` model (its word vectors are
+        indexed) or a `DocvecsArray` (document vectors, e.g. `doc2vec_model.docvecs`).
+        Alternatively, call `build()` with any 2d array of unit-length vectors later.
+
+        `search_k` is the default number of candidates inspected by a query;
+        if not set, `10 * topn * num_trees` candidates are inspected.
+
+        """
+        self.num_trees = num_trees
+        self.leaf_size = leaf_size
+        self.search_k = search_k
+        self.seed = seed
+        self.vectors = None
+        if model is not None:
+            model.init_sims()
+            if hasattr(model, 'doctag_syn0norm'):
+                self.build(model.doctag_syn0norm)
+            else:
+                self.build(model.syn0norm)
+
+    def __str__(self):
+        return "%s<%i trees over %s vectors>" % (
+            self.__class__.__name__, self.num_trees, None if self.vectors is None else len(self.vectors))
+
+    def __len__(self):
+        return 0 if self.vectors is None else len(self.vectors)
+
+    def build(self, vectors):
+        """
+        Build the trees over `vectors`, a 2d array with one unit-length vector per row.
+
+        The index keeps a reference to `vectors` (no copy is made), for ranking
+        the candidates of each query exactly.
+
+        """
+        rand = numpy.random.RandomState(self.seed)
+        num_vectors = len(vectors)
+        logger.info("building %i random projection trees over %i vectors", self.num_trees, num_vectors)
+
+        # internal nodes are `(hyperplane_no, left child, right child)`;
+        # leaves are `(-1, start, end)`, a range of `leaf_items`
+        hyperplanes, nodes, leaf_items, roots = [], [], [], []
+        num_leaf_items = 0
+        for treeno in xrange(self.num_trees):
+            roots.append(len(nodes))
+            nodes.append(None)
+            stack = [(roots[-1], numpy.arange(num_vectors))]
+            while stack:
+                nodeno, items = stack.pop()
+                if len(items) <= self.leaf_size:
+                    nodes[nodeno] = (-1, num_leaf_items, num_leaf_items + len(items))
+                    leaf_items.append(items)
+                    num_leaf_items += len(items)
+                    continue
+                first, second = rand.choice(len(items), 2, replace=False)
+                hyperplane = vectors[items[first]] - vectors[items[second]]
+                is_left = self._margins(vectors, items, hyperplane) > 0
+                if is_left.all() or not is_left.any():
+                    # identical vectors cannot be separated; split them at random
+                    hyperplane = numpy.zeros_like(hyperplane)
+                    is_left = numpy.zeros(len(items), dtype=bool)
+                    is_left[rand.permutation(len(items))[:len(items) // 2]] = True
+                left, right = len(nodes), len(nodes) + 1
+                nodes[nodeno] = (len(hyperplanes), left, right)
+                nodes.extend([None, None])
+                hyperplanes.append(hyperplane)
+                stack.append((left, items[is_left]))
+                stack.append((right, items[~is_left]))
+            logger.debug("built tree #%i, %i nodes in total so far", treeno, len(nodes))
+
+        self.vectors = vectors
+        self.hyperplanes = numpy.array(hyperplanes, dtype=vectors.dtype).reshape(len(hyperplanes), vectors.shape[1])
+        self.nodes = numpy.array(nodes, dtype=numpy.int64).reshape(len(nodes), 3)
+        self.leaf_items = numpy.concatenate(leaf_items).astype(numpy.int64) if leaf_items else numpy.zeros(0, dtype=numpy.int64)
+        self.roots = numpy.array(roots, dtype=numpy.int64)
+        logger.info("built %i trees with %i nodes", self.num_trees, len(self.nodes))
+
+    @staticmethod
+    def _margins(vectors, items, hyperplane, blocksize=65536):
+        # dot(vectors[items], hyperplane), without copying out all the vectors at once
+        if len(items) == len(vectors):
+            return numpy.dot(vectors, hyperplane)
+        result = numpy.empty(len(items), dtype=hyperplane.dtype)
+        for start in xrange(0, len(items), blocksize):
+            result[start: start + blocksize] = numpy.dot(vectors[items[start: start + blocksize]], hyperplane)
+        return result
+
+    def candidates(self, vector, search_k):
+        """
+        Return the indexes of (at least) `search_k` vectors that lie closest to
+        `vector` in the trees, or of all vectors if there are fewer.
+
+        """
+        # priority queue of (-margin, node), where margin is the smallest distance of `vector`
+        # to the splitting hyperplanes on the path to node, signed by the side taken: the
+        # branch that lies most clearly on `vector`'s side of all its splits is explored first
+        heap = [(-numpy.inf, root) for root in self.roots]
+        heapq.heapify(heap)
+        found = set()  # the same vector is typically found in several trees
+        while heap and len(found) < search_k:
+            priority, nodeno = heapq.heappop(heap)
+            split, left, right = self.nodes[nodeno]
+            if split < 0:
+                found.update(self.leaf_items[left: right].tolist())
+            else:
+                margin = float(numpy.dot(self.hyperplanes[split], vector))
+                heapq.heappush(heap, (max(priority, -margin), left))
+                heapq.heappush(heap, (max(priority, margin), right))
+        return numpy.fromiter(found, dtype=numpy.int64, count=len(found))
+
+    def most_similar(self, vector, topn=10, search_k=None):
+        """
+        Find the approximate `topn` most similar vectors to `vector` (a unit-length
+        vector), as a list of `(vector index, cosine similarity)` 2-tuples, most
+        similar first.
+
+        `search_k` overrides the number of candidates to inspect (see `__init__`).
+
+        """
+        if search_k is None:
+            search_k = self.search_k or 10 * topn * self.num_trees
+        candidates = self.candidates(vector, max(search_k, topn))
+        sims = numpy.dot(self.vectors[candidates], vector)
+        best = matutils.argsort(sims, topn=topn, reverse=True)
+        return [(int(candidates[pos]), float(sims[pos])) for pos in best]
+#endclass RandomProjectionIndexer
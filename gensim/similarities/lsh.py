@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+This module contains a locality-sensitive hashing ("LSH") index over sparse
+documents, for finding near-duplicates without comparing a query to every
+single indexed document.
+
+Each document is hashed into a short signature, such that similar documents
+are likely to have similar signatures:
+
+* `method='minhash'` computes MinHash signatures of the set of features (word ids)
+  of bag-of-words documents, ignoring their weights. Two signatures agree in
+  each position with probability equal to the Jaccard similarity of the two sets.
+* `method='simhash'` computes random-hyperplane (SimHash) signatures of weighted
+  vectors, such as tf-idf or LSI vectors. Two signatures agree in each bit with
+  probability `1 - angle / pi`, where `angle` is the angle between the two vectors.
+
+The signature is cut into `num_bands` bands of `rows_per_band` values; documents
+that agree on all values of at least one band become candidates. With similarity
+`s` (Jaccard or `1 - angle / pi`), this happens with probability
+`1 - (1 - s ** rows_per_band) ** num_bands`, an S-shaped curve with its steepest
+point around `(1 / num_bands) ** (1 / rows_per_band)`. The candidates are then
+scored exactly, by their cosine similarity to the query (`matutils.cossim`).
+
+Deduplicating a stream of documents as they come in:
+
+>>> index = LshIndex(method='minhash', num_bands=20, rows_per_band=5)
+>>> for doc in corpus:
+...     if not index.most_similar(doc, topn=1, threshold=0.9):
+...         index.add_documents([doc])  # not a near-duplicate of anything seen so far
+
+"""
+
+
+import logging
+
+import numpy
+
+from gensim import utils, matutils
+from six.moves import xrange
+
+
+logger = logging.getLogger('gensim.similarities.lsh')
+
+
+EMPTY_MINHASH = numpy.uint32(0xffffffff)  # MinHash signature value of empty documents
+
+
+class LshIndex(utils.SaveLoad):
+    """
+    Index of sparse documents (lists of `(feature id, weight)` 2-tuples), for retrieving
+    the documents most similar to a query, from the candidates found by locality-sensitive
+    hashing (see the module docstring).
+
+    Documents are numbered by the order in which they were added, starting from 0.
+
+    The index can be stored with `save()` and loaded back with `load()`; more documents
+    can be added at any time with `add_documents()`.
+
+    """
+    def __init__(self, corpus=None, method='minhash', num_features=None, num_bands=20, rows_per_band=5,
+                 store_documents=True, chunksize=256, seed=1):
+        """
+        `method` is either 'minhash' (for bag-of-words documents) or 'simhash' (for weighted
+        vectors, e.g. tf-idf or LSI); SimHash needs the dimensionality of the vectors, `num_features`.
+
+        Signatures consist of `num_bands * rows_per_band` hash values (bits, for SimHash).
+        More bands find more candidates (higher recall, slower queries); more rows per band
+        find fewer candidates, which are more similar to the query.
+
+        If `store_documents` is set, the index keeps a copy of all added documents, and ranks
+        candidates by their exact cosine similarity to the query. Otherwise, it ranks them
+        by the similarity estimated from their signatures, which needs much less memory.
+
+        If `corpus` is given, add its documents straight away, `chunksize` documents at a time.
+
+        """
+        if method not in ('minhash', 'simhash'):
+            raise ValueError("unknown LSH method %r, expected 'minhash' or 'simhash'" % method)
+        if method == 'simhash' and num_features is None:
+            raise ValueError("num_features must be set for method='simhash'")
+        self.method = method
+        self.num_features = num_features
+        self.num_bands = num_bands
+        self.rows_per_band = rows_per_band
+        self.num_hashes = num_bands * rows_per_band
+        self.chunksize = chunksize
+
+        rand = numpy.random.RandomState(seed)
+        if method == 'minhash':
+            # multiply-shift hash functions `((a * feature_id + b) mod 2**64) >> 32`, one per signature
+            # value, with odd `a`; unlike `mod prime` hashing, they need no (slow) integer division
+            self.hash_a = numpy.frombuffer(rand.bytes(8 * self.num_hashes), dtype=numpy.uint64) | numpy.uint64(1)
+            self.hash_b = numpy.frombuffer(rand.bytes(8 * self.num_hashes), dtype=numpy.uint64).copy()
+            self.signature_width = self.num_hashes
+        else:
+            self.hyperplanes = rand.standard_normal((num_features, self.num_hashes)).astype(numpy.float32)
+            self.signature_width = (self.num_hashes + 7) // 8  # bits packed into bytes
+
+        self.num_docs = 0
+        self.signatures = numpy.empty((0, self.signature_width), dtype=self.signature_dtype())
+        self.buckets = [{} for _ in xrange(num_bands)]  # for each band: band value => list of document numbers
+        self.documents = [] if store_documents else None
+
+        if corpus is not None:
+            self.add_documents(corpus)
+
+    def __str__(self):
+        return "%s<%i docs, %s with %i bands x %i rows>" % (
+            self.__class__.__name__, self.num_docs, self.method, self.num_bands, self.rows_per_band)
+
+    def __len__(self):
+        return self.num_docs
+
+    def signature_dtype(self):
+        return numpy.uint32 if self.method == 'minhash' else numpy.uint8
+
+    def get_signatures(self, documents):
+        """
+        Return the signatures of `documents` (a list of sparse documents), as a 2d array with
+        one row per document.
+
+        """
+        if self.method == 'minhash':
+            return self._minhash(documents)
+        return self._simhash(documents)
+
+    def _minhash(self, documents):
+        result = numpy.empty((len(documents), self.num_hashes), dtype=numpy.uint32)
+        # the signature of an empty document never matches anything (see `band_keys`)
+        result.fill(EMPTY_MINHASH)
+        lengths = numpy.array([len(doc) for doc in documents], dtype=numpy.int64)
+        nonempty = numpy.flatnonzero(lengths)
+        if len(nonempty):
+            feature_ids = numpy.fromiter(
+                (feature_id for doc in documents for feature_id, _ in doc), dtype=numpy.uint64, count=lengths.sum())
+            # hash all features of all documents at once (overflow wraps around, mod 2**64), then take
+            # the minimum over each document; the shift is monotonic, so it's applied to the minima only
+            hashes = numpy.outer(self.hash_a, feature_ids)
+            hashes += self.hash_b[:, numpy.newaxis]
+            starts = numpy.concatenate([[0], numpy.cumsum(lengths)[:-1]])[nonempty]
+            result[nonempty] = (numpy.minimum.reduceat(hashes, starts, axis=1) >> numpy.uint64(32)).T
+        return result
+
+    def _simhash(self, documents):
+        vectors = matutils.corpus2csc(documents, num_terms=self.num_features, dtype=numpy.float32,
+                                      num_docs=len(documents)).T
+        projections = numpy.asarray(vectors.dot(self.hyperplanes))
+        return numpy.packbits(projections > 0, axis=1)
+
+    def band_keys(self, signature):
+        """
+        Return the list of bucket keys of `signature`, one per band; None for bands that must
+        not match anything (those of empty documents).
+
+        """
+        if self.method == 'minhash':
+            if (signature == EMPTY_MINHASH).all():
+                return [None] * self.num_bands
+            width = self.rows_per_band
+            return [signature[band * width: (band + 1) * width].tobytes() for band in xrange(self.num_bands)]
+        bits = numpy.unpackbits(signature)[:self.num_hashes]
+        if not bits.any():
+            return [None] * self.num_bands
+        width = self.rows_per_band
+        return [numpy.packbits(bits[band * width: (band + 1) * width]).tobytes() for band in xrange(self.num_bands)]
+
+    def add_documents(self, corpus):
+        """
+        Add all documents from `corpus` (an iterable of sparse documents) to the index.
+
+        """
+        added = 0
+        for chunk in utils.grouper(corpus, self.chunksize):
+            chunk = list(chunk)
+            signatures = self.get_signatures(chunk)
+            if self.num_docs + len(chunk) > len(self.signatures):
+                # grow the signatures array geometrically, so that adding documents one by one stays cheap
+                capacity = max(2 * len(self.signatures), self.num_docs + len(chunk))
+                grown = numpy.empty((capacity, self.signature_width), dtype=self.signatures.dtype)
+                grown[:self.num_docs] = self.signatures[:self.num_docs]
+                self.signatures = grown
+            self.signatures[self.num_docs: self.num_docs + len(chunk)] = signatures
+            for docno, signature in enumerate(signatures, start=self.num_docs):
+                for buckets, key in zip(self.buckets, self.band_keys(signature)):
+                    if key is not None:
+                        buckets.setdefault(key, []).append(docno)
+            if self.documents is not None:
+                self.documents.extend(list(doc) for doc in chunk)
+            self.num_docs += len(chunk)
+            added += len(chunk)
+        logger.info("added %i documents to %s", added, self)
+
+    def candidates(self, signature):
+        """
+        Return the sorted array of numbers of the indexed documents that share at least one
+        band with `signature`.
+
+        """
+        found = set()
+        for buckets, key in zip(self.buckets, self.band_keys(signature)):
+            if key is not None:
+                found.update(buckets.get(key, ()))
+        return numpy.array(sorted(found), dtype=numpy.int64)
+
+    def estimate_similarities(self, signature, docnos):
+        """
+        Estimate the similarity of the document with `signature` to the indexed documents
+        `docnos` from their signatures: the Jaccard similarity for MinHash, the cosine
+        similarity for SimHash.
+
+        """
+        signatures = self.signatures[docnos]
+        if self.method == 'minhash':
+            return (signatures == signature).mean(axis=1)
+        differences = numpy.unpackbits(signatures ^ signature, axis=1)[:, :self.num_hashes].sum(axis=1)
+        return numpy.cos(numpy.pi * differences / float(self.num_hashes))
+
+    def most_similar(self, document, topn=10, threshold=None):
+        """
+        Find the indexed documents most similar to `document` (a sparse document), among
+        the candidates found by LSH. Return a list of `(document number, similarity)`
+        2-tuples, most similar first: at most `topn` of them (all if `topn` is None),
+        with similarity at least `threshold` (if set).
+
+        Similarities are exact cosine similarities if the index stores its documents,
+        estimated from the signatures otherwise (see `estimate_similarities`).
+
+        """
+        document = list(document)
+        signature = self.get_signatures([document])[0]
+        docnos = self.candidates(signature)
+        if not len(docnos):
+            return []
+        if self.documents is not None:
+            sims = numpy.array([matutils.cossim(document, self.documents[docno]) for docno in docnos])
+        else:
+            sims = self.estimate_similarities(signature, docnos)
+        if threshold is not None:
+            keep = sims >= threshold
+            docnos, sims = docnos[keep], sims[keep]
+        best = matutils.argsort(sims, topn=topn, reverse=True)
+        return [(int(docnos[pos]), float(sims[pos])) for pos in best]
+
+    def __getitem__(self, document):
+        """Return `most_similar(document)`, with the default `topn`."""
+        return self.most_similar(document)
+
+    def save(self, *args, **kwargs):
+        # don't store the unused, preallocated part of the signatures array
+        self.signatures = self.signatures[:self.num_docs].copy()
+        super(LshIndex, self).save(*args, **kwargs)
+#endclass LshIndex
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+USAGE: %(program)s CORPUS.mm [NUMDOCS [NUMTOPICS]]
+    Run speed test of the LDA E-step: compare the per-document inference loop \
+(`LdaModel.inference`) against the vectorized, whole-chunk engine \
+(`LdaModel.inference_chunk`), in documents per second. Only use the first \
+NUMDOCS documents of the corpus (or use all if no NUMDOCS is given).
+    The vectorized engine pays off most on corpora of short documents (tweets, \
+queries, titles).
+
+Example: ./ldaspeed.py tweets.mm 20000 100
+"""
+
+import logging
+import sys
+import itertools
+import os
+from time import time
+
+import numpy
+
+import gensim
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.INFO)
+    logging.info("running %s" % " ".join(sys.argv))
+
+    # check and process cmdline input
+    program = os.path.basename(sys.argv[0])
+    if len(sys.argv) < 2:
+        print(globals()['__doc__'] % locals())
+        sys.exit(1)
+
+    corpus = gensim.corpora.MmCorpus(sys.argv[1])
+    NUMTERMS = corpus.num_terms
+    NUMDOCS = int(sys.argv[2]) if len(sys.argv) > 2 else len(corpus)
+    NUMTOPICS = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    corpus = list(itertools.islice(corpus, NUMDOCS))
+    avglen = 1.0 * sum(len(doc) for doc in corpus) / max(1, len(corpus))
+
+    # train a model first, so that inference runs against realistic topics
+    id2word = dict((termid, str(termid)) for termid in range(NUMTERMS))
+    model = gensim.models.LdaModel(corpus, id2word=id2word, num_topics=NUMTOPICS)
+    logging.info("E-step speed on %i documents (%.1f unique words/document on average), %i topics" %
+                 (len(corpus), avglen, NUMTOPICS))
+
+    for chunksize in [1, 10, 100, 1000, 2000, 5000]:
+        chunks = list(gensim.utils.chunkize_serial(corpus, chunksize, as_numpy=False))
+        results = {}
+        for method in ['inference', 'inference_chunk']:
+            infer = getattr(model, method)
+            numpy.random.seed(42)
+            start = time()
+            results[method] = [infer(chunk, collect_sstats=True) for chunk in chunks]
+            taken = time() - start
+            logging.info("chunksize=%i, %s: %i documents in %.4fs = %.1f docs/s" %
+                         (chunksize, method, len(corpus), taken, len(corpus) / taken))
+        diff = max(abs(loop[0] - vectorized[0]).max()
+                   for loop, vectorized in zip(results['inference'], results['inference_chunk']))
+        logging.info("chunksize=%i: max difference in gamma between the two engines %.2e" % (chunksize, diff))
+
+    logging.info("finished running %s" % program)
@@ -160,4 +160,27 @@ if __name__ == '__main__':
                      (chunksize, taken, len(corpus_sparse) / taken, queries / taken))
     index_sparse.num_best = None
 
+    # quantized dense indexes: how much accuracy and speed do we trade for the smaller index?
+    query = list(itertools.islice(corpus_dense, 1000))
+    index_dense.num_best = 10
+    exact = [set(docno for docno, _ in sims) for sims in index_dense[query]]
+    index_dense.num_best = None
+    logging.info("test 7 (dense, quantized): top-10 of %i docs vs. quantized index (%i documents, %i dense features), "
+                 "float32 index takes %i bytes" % (len(query), len(index_dense), index_dense.num_features, index_dense.index.nbytes))
+    for quantize, rerank in [('int8', None), ('int8', 50), ('float16', None), ('float16', 50)]:
+        index_quantized = gensim.similarities.QuantizedMatrixSimilarity(
+            corpus_dense, num_features=index_dense.num_features, num_best=10, quantize=quantize, rerank=rerank)
+        memory = index_quantized.codes.nbytes
+        if index_quantized.scales is not None:
+            memory += index_quantized.scales.nbytes
+        start = time()
+        sims = []
+        for chunk in gensim.utils.chunkize_serial(query, 256):
+            sims.extend(index_quantized[chunk])
+        taken = time() - start
+        recall = numpy.mean([len(expected & set(docno for docno, _ in approx)) / 10.0
+                             for expected, approx in zip(exact, sims)])
+        logging.info("%s, rerank=%s: time=%.4fs (%.2f docs/s), recall@10=%.3f, codes take %i bytes" %
+                     (quantize, rerank, taken, len(query) / taken, recall, memory))
+
     logging.info("finished running %s" % program)
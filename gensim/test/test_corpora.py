@@ -15,11 +15,14 @@ import tempfile
 import itertools
 
 import numpy
+import scipy.sparse
 
+from gensim import matutils, utils
 from gensim.utils import to_unicode, smart_extension
 from gensim.interfaces import TransformedCorpus
 from gensim.corpora import (bleicorpus, mmcorpus, lowcorpus, svmlightcorpus,
-                            ucicorpus, malletcorpus, textcorpus, indexedcorpus)
+                            ucicorpus, malletcorpus, textcorpus, indexedcorpus,
+                            csccorpus)
 
 # needed because sample data files are located in the same folder
 module_path = os.path.dirname(__file__)
@@ -220,6 +223,98 @@ class TestMmCorpus(CorpusTestCase):
         # MmCorpus needs file write with seek => doesn't support compressed output (only input)
         pass
 
+    def test_iter_chunks(self):
+        corpus = self.corpus_class(datapath('testcorpus.mm'))
+        expected = matutils.corpus2csc(list(corpus), num_terms=corpus.num_terms)
+        for chunksize in [1, 2, 4, 100]:
+            blocks = list(corpus.iter_chunks(chunksize))
+            self.assertEqual(sum(block.shape[1] for block in blocks), len(corpus))
+            self.assertTrue(all(block.shape[1] <= chunksize for block in blocks))
+            self.assertEqual(abs(scipy.sparse.hstack(blocks) - expected).sum(), 0)
+
+    def test_iter_chunks_small_buffer(self):
+        # documents straddling the read buffer must come out whole
+        corpus = self.corpus_class(datapath('testcorpus.mm'))
+        expected = matutils.corpus2csc(list(corpus), num_terms=corpus.num_terms)
+        for chunksize, buffer_lines in [(2, 3), (None, 1), (None, 4), (3, 1)]:
+            blocks = list(corpus.iter_chunks(chunksize, buffer_lines=buffer_lines))
+            self.assertEqual(abs(scipy.sparse.hstack(blocks) - expected).sum(), 0)
+
+    def test_sparse2corpus_iter_chunks(self):
+        corpus = self.corpus_class(datapath('testcorpus.mm'))
+        sparse = matutils.corpus2csc(corpus)
+        blocks = list(matutils.Sparse2Corpus(sparse).iter_chunks(4))
+        self.assertEqual([block.shape[1] for block in blocks], [4, 4, 1])
+        self.assertEqual(abs(scipy.sparse.hstack(blocks) - sparse).sum(), 0)
+
+
+class TestCscCorpus(CorpusTestCase):
+    def setUp(self):
+        self.corpus_class = csccorpus.CscCorpus
+        self.file_extension = '.csc'
+
+    def tearDown(self):
+        super(TestCscCorpus, self).tearDown()
+        for ext in ['.indptr', '.indices', '.data']:
+            try:
+                os.remove(testfile() + ext)
+            except OSError:
+                pass
+
+    def test_empty_input(self):
+        self.corpus_class.serialize(testfile(), [])
+        corpus = self.corpus_class(testfile())
+        self.assertEqual(len(corpus), 0)
+        self.assertEqual(list(corpus), [])
+        self.assertEqual(list(corpus.iter_chunks()), [])
+
+    def test_serialize_compressed(self):
+        # CscCorpus mmaps raw arrays => doesn't support compressed output
+        pass
+
+    def test_mmap(self):
+        self.corpus_class.serialize(testfile(), self.TEST_CORPUS)
+        for mmap in [None, 'r']:
+            corpus = self.corpus_class(testfile(), mmap=mmap)
+            self.assertEqual(list(corpus), self.TEST_CORPUS)
+            self.assertEqual(isinstance(corpus.data, numpy.memmap), mmap is not None)
+
+    def test_slice_is_view(self):
+        corpus = self.corpus_class(datapath('testcorpus.csc'))
+        sliced = corpus[2:5]
+        self.assertTrue(isinstance(sliced, csccorpus.CscCorpus))
+        self.assertTrue(sliced.data is corpus.data)
+        self.assertEqual(list(sliced), list(corpus)[2:5])
+        self.assertEqual(list(sliced[1:]), list(corpus)[3:5])
+
+    def test_iter_chunks(self):
+        corpus = self.corpus_class(datapath('testcorpus.csc'))
+        expected = matutils.corpus2csc(list(corpus), num_terms=corpus.num_terms)
+        blocks = list(corpus.iter_chunks(chunksize=4))
+        self.assertEqual([block.shape[1] for block in blocks], [4, 4, 1])
+        self.assertTrue(all(scipy.sparse.isspmatrix_csc(block) for block in blocks))
+        self.assertTrue(numpy.allclose(scipy.sparse.hstack(blocks).toarray(), expected.toarray()))
+        # corpus2csc takes the blocks directly
+        self.assertTrue(numpy.allclose(matutils.corpus2csc(corpus).toarray(), expected.toarray()))
+        # ... unless asked for explicit sizes, which are then checked as for any other corpus
+        result = matutils.corpus2csc(corpus, num_docs=corpus.num_docs, num_nnz=corpus.num_nnz)
+        self.assertTrue(numpy.allclose(result.toarray(), expected.toarray()))
+        self.assertRaises(AssertionError, matutils.corpus2csc, corpus, num_nnz=corpus.num_nnz + 1)
+
+    def test_large_feature_ids(self):
+        # feature ids beyond 32 bits are stored as 64bit, if known in advance
+        docs = [[(0, 1.0), (2 ** 31, 2.0)], [(1, 3.0)]]
+        self.assertRaises(ValueError, self.corpus_class.serialize, testfile(), docs)
+        self.corpus_class.serialize(testfile(), docs, id2word=utils.FakeDict(2 ** 31 + 1))
+        corpus = self.corpus_class(testfile())
+        self.assertEqual(corpus.indices.dtype, numpy.int64)
+        self.assertEqual(list(corpus), docs)
+
+    def test_serialize_from_chunks(self):
+        corpus = self.corpus_class(datapath('testcorpus.csc'))
+        self.corpus_class.serialize(testfile(), corpus[1:])
+        self.assertEqual(list(self.corpus_class(testfile())), list(corpus)[1:])
+
 
 class TestSvmLightCorpus(CorpusTestCase):
     def setUp(self):
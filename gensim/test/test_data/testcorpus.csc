@@ -0,0 +1 @@
+}q(Unum_docsqK	Uindptr_dtypeqU<i8Unum_nnzqKUdtypeqU<f8U	num_termsqKUindices_dtypeqU<i4u.
\ No newline at end of file
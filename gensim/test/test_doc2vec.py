@@ -88,6 +88,16 @@ class TestDoc2VecModel(unittest.TestCase):
         self.assertEqual(len(model.docvecs.doctag_syn0), 300)
         self.assertEqual(model.docvecs[0].shape, (300,))
         self.assertRaises(KeyError, model.__getitem__, '_*0')
+        # numpy integers (e.g. from argsort) are int tags too
+        self.assertTrue(np.allclose(model.docvecs[np.int64(5)], model.docvecs[5]))
+        self.assertTrue(np.int64(299) in model.docvecs and np.int64(300) not in model.docvecs)
+        model = doc2vec.Doc2Vec(min_count=1)
+        model.build_vocab([doc2vec.TaggedDocument(doc.words, [np.int64(doc.tags[0])]) for doc in corpus])
+        self.assertEqual(len(model.docvecs.doctag_syn0), 300)
+
+        # documents aren't scanned in parallel: tag offsets depend on their order
+        shards = [list(corpus)[:150], list(corpus)[150:]]
+        self.assertRaises(ValueError, doc2vec.Doc2Vec(min_count=1).build_vocab, shards, workers=2)
 
     def test_string_doctags(self):
         """Test doc2vec doctag alternatives"""
@@ -212,6 +222,53 @@ class TestDoc2VecModel(unittest.TestCase):
             model = doc2vec.Doc2Vec(corpus, workers=workers)
             self.model_sanity(model)
 
+    def test_compact_doctags(self):
+        """Test the compact doctag store"""
+        corpus = list(DocsLeeCorpus(True))
+        corpus = corpus[0:10] + corpus  # force duplicated tags
+
+        model = doc2vec.Doc2Vec(min_count=1, docvecs=doc2vec.CompactDocvecsArray())
+        model.build_vocab(corpus)
+        reference = doc2vec.Doc2Vec(min_count=1)
+        reference.build_vocab(corpus)
+        self.assertEqual(len(model.docvecs.doctag_syn0), 300)
+        self.assertEqual(list(model.docvecs.index2doctag), reference.docvecs.index2doctag)
+        self.assertEqual(dict(model.docvecs.doctags.items()), reference.docvecs.doctags)
+        self.assertTrue(all(model.docvecs['_*0'] == model.docvecs[0]))
+        self.assertTrue('_*299' in model.docvecs and '_*300' not in model.docvecs and 299 in model.docvecs)
+        self.assertTrue(all(model.docvecs['_*0'] == model.docvecs[np.int64(0)]) and np.int64(299) in model.docvecs)
+        self.assertRaises(KeyError, lambda: model.docvecs.doctags['_*300'])
+        self.assertTrue(abs(model.docvecs.doctag_syn0).max() <= 0.5 / model.vector_size)
+
+        model.train(corpus)
+        sims = model.docvecs.most_similar('_*0')
+        self.assertTrue(all(tag.startswith('_*') for tag, _ in sims))
+
+        # the tag store can be memory-mapped back
+        model.save(testfile(), sep_limit=0)
+        model2 = doc2vec.Doc2Vec.load(testfile(), mmap='r')
+        self.models_equal(model, model2)
+        self.assertEqual(model2.docvecs.doctags['_*5'], model.docvecs.doctags['_*5'])
+        self.assertEqual(sims, model2.docvecs.most_similar('_*0'))
+
+    def test_infer_vectors(self):
+        """Test bulk inference of document vectors."""
+        documents = [doc.words for doc in list_corpus[:20]]
+        for params in [dict(dm=0), dict(dm=1, hs=0, negative=5, sample=0.001), dict(dm=1, dm_concat=1, window=2)]:
+            model = doc2vec.Doc2Vec(list_corpus, size=20, min_count=2, iter=5, **params)
+            vectors = model.infer_vectors(iter(documents), workers=1, chunksize=3)
+            self.assertEqual(vectors.shape, (len(documents), model.vector_size))
+            # results don't depend on the number of threads, nor on the other documents
+            out = np.zeros((len(documents) + 1, model.vector_size))
+            self.assertTrue(model.infer_vectors(documents, out=out, workers=3, chunksize=2) is out)
+            self.assertTrue(np.allclose(vectors, out[:-1]))
+            self.assertTrue(np.allclose(vectors[5:], model.infer_vectors(documents[5:], workers=2)))
+        self.assertRaises(ValueError, model.infer_vectors, documents, out=np.zeros((3, model.vector_size)))
+        # a failing job is re-raised in the caller, instead of hanging the producer
+        bad_documents = [[1, 2]] + [['graph']] * 50
+        for workers in [1, 3]:
+            self.assertRaises(TypeError, model.infer_vectors, bad_documents, workers=workers, chunksize=1)
+
     def test_deterministic_hs(self):
         """Test doc2vec results identical with identical RNG seed."""
         # hs
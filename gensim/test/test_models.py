@@ -14,6 +14,7 @@ import unittest
 import os
 import os.path
 import tempfile
+import time
 
 import numpy
 import scipy.linalg
@@ -252,6 +253,62 @@ class TestLdaModel(unittest.TestCase):
 
         model.top_topics(self.corpus)
 
+    def testInferenceChunk(self):
+        # a scipy.sparse chunk gives the same result as a list of documents
+        model = self.class_(id2word=dictionary, num_topics=2, passes=1)
+        numpy.random.seed(0)
+        gamma, _ = model.inference(list(self.corpus))
+        numpy.random.seed(0)
+        gamma_sparse, _ = model.inference(matutils.corpus2csc(self.corpus))
+        self.assertTrue(numpy.allclose(gamma, gamma_sparse))
+
+    def testVectorizedInference(self):
+        # the whole-chunk E-step gives the same gamma and sstats as the per-document loop
+        model = self.class_(self.corpus, id2word=dictionary, num_topics=2, passes=2)
+        for chunk in [list(self.corpus), matutils.corpus2csc(self.corpus), list(self.corpus)[:1]]:
+            numpy.random.seed(0)
+            gamma, sstats = model.inference(chunk, collect_sstats=True)
+            numpy.random.seed(0)
+            gamma_chunk, sstats_chunk = model.inference_chunk(chunk, collect_sstats=True)
+            self.assertTrue(numpy.allclose(gamma, gamma_chunk))
+            self.assertTrue(numpy.allclose(sstats, sstats_chunk))
+
+    def testInferenceThreads(self):
+        # splitting the E-step across threads doesn't change the result
+        model = self.class_(self.corpus, id2word=dictionary, num_topics=2, passes=2)
+        numpy.random.seed(0)
+        gamma, sstats = model.inference(list(self.corpus), collect_sstats=True)
+        model.threads = 3
+        numpy.random.seed(0)
+        gamma_threads, sstats_threads = model.inference(list(self.corpus), collect_sstats=True)
+        self.assertTrue(numpy.allclose(gamma, gamma_threads))
+        self.assertTrue(numpy.allclose(sstats, sstats_threads))
+
+        # an error in any of the threads is raised in the caller
+        def failing_inference_docs(model, indptr, indices, data, gamma, expElogtheta, ratio, start, end):
+            if start > 0:
+                raise ValueError("failed")
+            return inference_docs(model, indptr, indices, data, gamma, expElogtheta, ratio, start, end)
+
+        inference_docs = ldamodel.inference_docs
+        ldamodel.inference_docs = failing_inference_docs
+        try:
+            self.assertRaises(ValueError, model.inference, list(self.corpus))
+        finally:
+            ldamodel.inference_docs = inference_docs
+
+    def testVectorizedTransform(self):
+        # a model trained with the vectorized engine converges to the same topics
+        passed = False
+        for i in range(5): # restart at most 5 times, as in testTransform
+            model = self.class_(id2word=dictionary, num_topics=2, passes=100, vectorized=True)
+            model.update(self.corpus)
+            vec = matutils.sparse2full(model[list(corpus)[0]], 2)
+            passed = numpy.allclose(sorted(vec), sorted([0.13, 0.87]), atol=1e-2)
+            if passed:
+                break
+        self.assertTrue(passed)
+
     def testPasses(self):
         # long message includes the original error message with a custom one
         self.longMessage = True
@@ -370,11 +427,76 @@ class TestLdaModel(unittest.TestCase):
 #endclass TestLdaModel
 
 
+class DelayedQueue(object):
+    """Queue proxy that delays each put(), like a worker process slow to report its result."""
+    def __init__(self, queue, delay):
+        self.queue, self.delay = queue, delay
+
+    def put(self, item):
+        time.sleep(self.delay)
+        self.queue.put(item)
+
+
+def delayed_e_step(input_queue, result_queue, *args):
+    worker_e_step(input_queue, DelayedQueue(result_queue, 0.5), *args)
+
+
+worker_e_step = ldamulticore.worker_e_step
+
+
 class TestLdaMulticore(TestLdaModel):
     def setUp(self):
         self.corpus = mmcorpus.MmCorpus(datapath('testcorpus.mm'))
         self.class_ = ldamulticore.LdaMulticore
 
+    def testReduceBuffers(self):
+        # the parallel reduction sums up the workers' sstats and empties their buffers
+        buffers = [numpy.random.rand(5, 7) for _ in range(3)]
+        expected = sum(buffers) + 1.0
+        out = numpy.ones((5, 7))
+        ldamulticore.reduce_buffers(buffers, out)
+        self.assertTrue(numpy.allclose(out, expected))
+        self.assertTrue(all(not buf.any() for buf in buffers))
+
+    def testForcedUpdate(self):
+        # sstats reach the shared buffers before their result message; a worker that's slow
+        # to report must neither trigger an early update, nor an extra, empty one that
+        # shrinks the topics at the end of the pass
+        class CountingLda(self.class_):
+            def do_mstep(self, *args, **kwargs):
+                self.msteps = getattr(self, 'msteps', 0) + 1
+                return super(CountingLda, self).do_mstep(*args, **kwargs)
+
+        def train():
+            numpy.random.seed(0)
+            model = CountingLda(id2word=dictionary, num_topics=2, workers=1, chunksize=len(corpus))
+            model.update(corpus)
+            return model
+
+        baseline = train()
+        ldamulticore.worker_e_step = delayed_e_step
+        try:
+            model = train()
+        finally:
+            ldamulticore.worker_e_step = worker_e_step
+        # a single chunk makes for a single update
+        self.assertEqual(baseline.msteps, 1)
+        self.assertEqual(model.msteps, 1)
+        self.assertTrue(numpy.allclose(model.state.sstats, baseline.state.sstats))
+
+    def testCleanupOnError(self):
+        # a failing update still stops the workers and removes its temporary files
+        class WrongLength(list):
+            def __len__(self):
+                return 100
+
+        tmpdirs = lambda: set(fname for fname in os.listdir(tempfile.gettempdir())
+                              if fname.startswith('gensim_ldamulticore_'))
+        before = tmpdirs()
+        model = self.class_(id2word=dictionary, num_topics=2, workers=2)
+        self.assertRaises(RuntimeError, model.update, WrongLength(corpus))
+        self.assertEqual(tmpdirs(), before)
+
 #endclass TestLdaMulticore
 
 
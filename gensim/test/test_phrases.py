@@ -90,6 +90,15 @@ class TestPhrasesModel(unittest.TestCase):
         """Test that max_vocab_size parameter is respected."""
         bigram = Phrases(sentences, max_vocab_size=5)
         self.assertTrue(len(bigram.vocab) <= 5)
+
+    def testParallelVocab(self):
+        """Test that counting shards in parallel gives the same counts as counting serially."""
+        shards = [sentences[:3], sentences[3:4], sentences[4:]]
+        bigram = Phrases(shards, min_count=1, threshold=1, workers=2)
+        serial = Phrases(sentences, min_count=1, threshold=1)
+        self.assertEqual(list(bigram.vocab.items()), list(serial.vocab.items()))
+        self.assertEqual(bigram.min_reduce, serial.min_reduce)
+        self.assertTrue(len(Phrases(shards, max_vocab_size=5, workers=2).vocab) <= 5)
 #endclass TestPhrasesModel
 
 
@@ -123,6 +123,17 @@ class TestShardedCorpus(unittest.TestCase):
 
         self.assertEqual(ilist.all(), dslice.all())
 
+    def test_iter_chunks(self):
+
+        blocks = list(self.corpus.iter_chunks(150))
+        self.assertEqual([b.shape[1] for b in blocks], [150] * 6 + [100])
+        self.assertTrue(all(sparse.isspmatrix(b) for b in blocks))
+        self.assertEqual(blocks[0].shape[0], self.corpus.dim)
+
+        # columns are documents
+        expected = self.corpus[160:170]
+        self.assertTrue(numpy.allclose(blocks[1][:, 10:20].T.toarray(), expected))
+
     def test_getitem_dense2sparse(self):
 
         corpus = ShardedCorpus(self.tmp_fname, self.data, shardsize=100,
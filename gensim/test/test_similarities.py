@@ -13,11 +13,14 @@ import logging
 import unittest
 import os
 import tempfile
+import threading
 
 import numpy
 
 from gensim.corpora import mmcorpus, Dictionary
 from gensim import matutils, utils, similarities
+from gensim.similarities import docsim
+from gensim.models import word2vec, doc2vec
 
 
 module_path = os.path.dirname(__file__) # needed because sample data files are located in the same folder
@@ -263,6 +266,105 @@ class TestSparseMatrixSimilarity(unittest.TestCase, _TestSimilarityABC):
         self.cls = similarities.SparseMatrixSimilarity
 
 
+class TestInvertedIndexSimilarity(unittest.TestCase, _TestSimilarityABC):
+    def setUp(self):
+        self.cls = similarities.InvertedIndexSimilarity
+
+    def testPruning(self):
+        # random non-negative documents: pruned top-N must equal the exhaustive top-N
+        rand = numpy.random.RandomState(0)
+        docs = []
+        for _ in range(300):
+            ids = numpy.unique(rand.zipf(1.5, 20) % 200)
+            docs.append(list(zip(ids.tolist(), rand.rand(len(ids)).tolist())))
+        full = similarities.SparseMatrixSimilarity(docs, num_features=200)
+        for num_best in [1, 10, 400]:
+            index = similarities.InvertedIndexSimilarity(docs, num_features=200, num_best=num_best)
+            for query in docs[:20] + [[(0, 1.0)], [(5, 0.2), (199, 0.5)]]:
+                sims = index[query]
+                expected = matutils.full2sparse_clipped(full[query], num_best)
+                self.assertEqual(len(sims), len(expected))
+                self.assertTrue(numpy.allclose([sim for _, sim in sims], [sim for _, sim in expected], atol=1e-6))
+            # batch queries, as lists of documents or as sparse matrices
+            self.assertEqual(index[docs[:3]], [index[doc] for doc in docs[:3]])
+            batch = matutils.corpus2csc(docs[:3], num_terms=200).T
+            self.assertEqual(
+                [[docno for docno, _ in sims] for sims in index[batch]],
+                [[docno for docno, _ in sims] for sims in index[docs[:3]]])
+            # queries are normalized whatever their type, so all score on the same scale
+            query = [(5, 2.0), (199, 3.0)]
+            expected = index[query]
+            for same_query in [matutils.corpus2csc([query], num_terms=200).T, matutils.sparse2full(query, 200)]:
+                sims = index[same_query]
+                self.assertEqual([docno for docno, _ in sims], [docno for docno, _ in expected])
+                self.assertTrue(numpy.allclose([sim for _, sim in sims], [sim for _, sim in expected]))
+
+    def testNegativeWeights(self):
+        docs = [[(0, 1.0), (1, -1.0)], [(0, 1.0), (1, 1.0)], [(1, 1.0)]]
+        index = similarities.InvertedIndexSimilarity(docs, num_features=2, num_best=2)
+        self.assertFalse(index.nonnegative)
+        sims = index[[(1, 1.0)]]
+        self.assertEqual([docno for docno, _ in sims], [2, 1])
+
+    def testSimilarityShards(self):
+        # plenty of (unused) features, so that all shards are sparse
+        index = similarities.Similarity(None, corpus, num_features=100, shardsize=4, inverted=True)
+        self.assertTrue(all(shard.cls is similarities.InvertedIndexSimilarity for shard in index.shards))
+        index.num_best = 3
+        expected = [(0, 0.99999994), (2, 0.28867513), (3, 0.23570226)]
+        self.assertTrue(numpy.allclose([sim for _, sim in index[corpus[0]]], [sim for _, sim in expected]))
+        index.delete_documents([2])
+        index.compact(min_deleted=0.1)
+        self.assertTrue(numpy.allclose([sim for _, sim in index[corpus[0]]], [0.99999994, 0.23570226, 0.23570226]))
+        index.destroy()
+
+
+class TestQuantizedMatrixSimilarity(unittest.TestCase):
+    def setUp(self):
+        self.exact = similarities.MatrixSimilarity(corpus, num_features=len(dictionary))
+
+    def testApproximate(self):
+        for quantize, tolerance in [('int8', 1e-2), ('float16', 1e-3)]:
+            index = similarities.QuantizedMatrixSimilarity(corpus, num_features=len(dictionary), quantize=quantize)
+            self.assertTrue(numpy.allclose(self.exact[corpus], index[corpus], atol=tolerance))
+            self.assertTrue(numpy.allclose(self.exact[corpus[0]], index[corpus[0]], atol=tolerance))
+            self.assertTrue(index.codes.nbytes < index.index.nbytes)
+        self.assertRaises(ValueError, similarities.QuantizedMatrixSimilarity, corpus, quantize='int4')
+
+    def testRerank(self):
+        index = similarities.QuantizedMatrixSimilarity(corpus, num_features=len(dictionary), rerank=3)
+        sims, expected = index[corpus], self.exact[corpus]
+        for row, exact in zip(sims, expected):
+            best = matutils.argsort(exact, topn=3, reverse=True)
+            self.assertTrue(numpy.allclose(row[best], exact[best]))
+        index.num_best = 2
+        self.exact.num_best = 2
+        self.assertEqual([docno for docno, _ in index[corpus[1]]], [docno for docno, _ in self.exact[corpus[1]]])
+
+    def testPersistency(self):
+        fname = testfile()
+        index = similarities.QuantizedMatrixSimilarity(corpus, num_features=len(dictionary), rerank=2)
+        index.save(fname, sep_limit=0)
+        index2 = similarities.QuantizedMatrixSimilarity.load(fname, mmap='r')
+        self.assertTrue(isinstance(index2.codes, numpy.memmap))
+        self.assertTrue(numpy.allclose(index[corpus], index2[corpus]))
+
+    def testSimilarityShards(self):
+        docs = [matutils.unitvec(matutils.sparse2full(doc, len(dictionary))) for doc in corpus]
+        index = similarities.Similarity(None, docs, num_features=len(dictionary), shardsize=4, quantize='int8', rerank=2)
+        self.assertTrue(all(shard.cls is similarities.QuantizedMatrixSimilarity for shard in index.shards))
+        index.num_best = 2
+        self.exact.num_best = 2
+        self.assertEqual([docno for docno, _ in index[corpus[1]]], [docno for docno, _ in self.exact[corpus[1]]])
+        index.delete_documents([1, 2])
+        index.compact(min_deleted=0.1)
+        sims = index[corpus[1]]
+        self.assertEqual(sims[0][0], 4)
+        self.assertTrue(numpy.allclose(sims[0][1], self.exact[corpus[1]][1][1]))
+        index.destroy()
+#endclass TestQuantizedMatrixSimilarity
+
+
 class TestSimilarity(unittest.TestCase, _TestSimilarityABC):
     def setUp(self):
         self.cls = similarities.Similarity
@@ -289,6 +391,348 @@ class TestSimilarity(unittest.TestCase, _TestSimilarityABC):
         # turns out this test doesn't exercise this because there are no arrays
         # to be mmaped!
 
+    def testDeleteUpdate(self):
+        """test deleting and updating documents, in both sparse and dense shards"""
+        for dense in [False, True]:
+            docs = [matutils.unitvec(matutils.sparse2full(doc, len(dictionary))) for doc in corpus] if dense else corpus
+            index = similarities.Similarity(None, docs, num_features=len(dictionary), shardsize=4)
+            index.num_best = 4
+            self.assertEqual([docid for docid, _ in index[corpus[0]]][:2], [0, 2])
+            index.delete_documents(iter([0, 2]))  # any iterable of ids, even a one-shot one
+            self.assertEqual(index.num_deleted(), 2)
+            sims = index[corpus[0]]
+            self.assertFalse(set([0, 2]) & set(docid for docid, _ in sims))
+            self.assertRaises(KeyError, index.delete_documents, [0])
+            self.assertRaises(KeyError, index.delete_documents, [100])
+
+            # full similarity vectors keep all positions, deleted documents have similarity 0
+            index.num_best = None
+            sims = index[corpus[0]]
+            self.assertEqual(len(sims), len(corpus))
+            self.assertEqual((sims[0], sims[2]), (0.0, 0.0))
+
+            # updated documents keep their id
+            index.num_best = 3
+            index.update_documents([corpus[0], corpus[1]], [1, 'new'])
+            self.assertEqual(index.num_deleted(), 3)
+            self.assertEqual(len(index), len(corpus) + 2)
+            sims = dict(index[corpus[0]])
+            self.assertTrue(numpy.allclose([sims[1], sims['new']], [1.0, 0.23570226]))
+            self.assertEqual(index.locate('new')[1], 2)  # appended to the last shard, after documents 8 and 1
+
+            # one unique, new id per added document; nothing is added otherwise
+            for ids in [['a'], ['a', 'b', 'c'], ['a', 'a'], ['a', 'new'], ['a', 3]]:
+                self.assertRaises(ValueError, index.add_documents, corpus[:2], ids)
+            self.assertEqual(len(index), len(corpus) + 2)
+            index.add_documents([corpus[2]], ['b'])  # not yet in a shard
+            self.assertRaises(ValueError, index.add_documents, [corpus[3]], ['b'])
+            index.add_documents([corpus[3]], [0])  # ids of deleted documents may be reused
+            # a stream without len() is only checked while adding
+            self.assertRaises(ValueError, index.add_documents, iter(corpus[:2]), ['a'])
+            self.assertEqual(len(index), len(corpus) + 5)
+            index.close_shard()
+            self.assertEqual(index.locate('a')[1], index.locate(0)[1] + 1)
+            index.destroy()
+
+    def testCompact(self):
+        """test that compaction drops deleted documents and keeps document ids"""
+        for dense in [False, True]:
+            docs = [matutils.unitvec(matutils.sparse2full(doc, len(dictionary))) for doc in corpus] if dense else corpus
+            index = similarities.Similarity(None, docs, num_features=len(dictionary), shardsize=3)
+            index.num_best = 5
+            index.delete_documents([0, 1, 2, 4])
+            expected = index[corpus[0]]
+            fnames = [shard.fullname() for shard in index.shards]
+            self.assertEqual(index.compact(min_deleted=0.3), 2)  # first shard is removed, second rewritten
+            self.assertEqual(len(index.shards), 2)
+            self.assertEqual(len(index), len(corpus) - 4)
+            self.assertEqual(index.num_deleted(), 0)
+            self.assertFalse(os.path.exists(fnames[0]))
+            self.assertTrue(numpy.allclose(numpy.array(index[corpus[0]], dtype=float), numpy.array(expected, dtype=float)))
+
+            # ids survive compaction, new documents get new ids
+            index.delete_documents([5])
+            index.add_documents(corpus[:1])
+            index.compact(min_deleted=0.1, background=True).join()
+            self.assertEqual(index.num_deleted(), 0)
+            self.assertEqual(index[corpus[0]][0][0], len(corpus))
+            self.assertFalse(5 in [docid for docid, _ in index[corpus[5]]])
+            fname = testfile()
+            index.save(fname)
+            index2 = similarities.Similarity.load(fname)
+            self.assertEqual(index2[corpus[0]], index[corpus[0]])
+            index2.delete_documents([3])
+            index.destroy()
+
+    def testQueryPool(self):
+        """test querying shards through a persistent pool of workers"""
+        for mode in ['thread', 'process']:
+            index = similarities.Similarity(None, corpus, num_features=len(dictionary), shardsize=2)
+            expected = index[corpus]
+            index.num_best = 3
+            expected_best = index[corpus[0]]
+            index.num_best = None
+            index.start_query_pool(2, mode=mode)
+            try:
+                for _ in range(3):
+                    self.assertTrue(numpy.allclose(expected, index[corpus]))
+                # a reopened shard is rewritten to disk; workers must not use their stale copy
+                index.add_documents(corpus[:1])
+                sims = index[corpus[0]]
+                self.assertEqual(len(sims), len(corpus) + 1)
+                self.assertTrue(numpy.allclose(expected[0], sims[:len(corpus)]))
+                index.num_best = 3
+                self.assertEqual(index[corpus[0]][:1], expected_best[:1])
+                # a custom `ignore` must not cause the live pool to be pickled
+                fname = testfile()
+                index.save(fname, ignore=['num_best'])
+                index2 = similarities.Similarity.load(fname)
+                self.assertTrue(index2.query_pool is None and index2.num_best is None)
+                self.assertEqual(len(index2[corpus[0]]), len(corpus) + 1)
+            finally:
+                index.close_query_pool()
+            self.assertTrue(index.query_pool is None)
+            index.destroy()
+
+    def testConcurrentQueries(self):
+        """test that concurrent queries with different settings don't see each other's settings"""
+        index = similarities.Similarity(None, corpus, num_features=len(dictionary), shardsize=2)
+        expected = index[corpus]
+        expected_best = list(index.query_chunks(corpus, num_best=2))
+        settings = [(shard.get_index().num_best, shard.get_index().normalize) for shard in index.shards]
+        index.start_query_pool(4, mode='thread')
+        results, errors = [], []
+
+        def query(num_best):
+            try:
+                for _ in range(20):
+                    if num_best is None:
+                        results.append(numpy.allclose(expected, index[corpus]))
+                    else:
+                        results.append(list(index.query_chunks(corpus, num_best=num_best)) == expected_best)
+            except Exception as err:
+                errors.append(err)
+
+        try:
+            threads = [threading.Thread(target=query, args=(num_best,)) for num_best in [None, 2, None, 2]]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            index.close_query_pool()
+        self.assertEqual(errors, [])
+        self.assertTrue(len(results) == 80 and all(results))
+        # queries leave the shared shard indexes alone
+        self.assertEqual(settings, [(shard.get_index().num_best, shard.get_index().normalize) for shard in index.shards])
+
+        # PARALLEL_SHARDS queries through a pool of their own, which doesn't outlive the query
+        parallel_shards = docsim.PARALLEL_SHARDS
+        docsim.PARALLEL_SHARDS = 2
+        try:
+            self.assertTrue(numpy.allclose(expected, index[corpus]))
+        finally:
+            docsim.PARALLEL_SHARDS = parallel_shards
+        self.assertTrue(getattr(index, 'query_pool', None) is None)
+        index.destroy()
+
+    def testLatencyStats(self):
+        index = similarities.Similarity(None, corpus, num_features=len(dictionary), shardsize=2)
+        self.assertEqual(index.latency_stats()['queries'], 0)
+        for query in corpus:
+            index[query]
+        stats = index.latency_stats()
+        self.assertEqual(stats['queries'], len(corpus))
+        self.assertTrue(0 <= stats['p50'] <= stats['p99'])
+        index.destroy()
+
+    def testQueryChunks(self):
+        index = similarities.Similarity(None, corpus, num_features=len(dictionary), shardsize=2)
+        # top-N results per query, same as querying one by one
+        chunks = list(index.query_chunks(corpus, chunksize=3, num_best=4))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 3])
+        expected = [similarities.Similarity(None, corpus, num_features=len(dictionary), shardsize=2, num_best=4)[query] for query in corpus]
+        for got, sims in zip(sum(chunks, []), expected):
+            self.assertEqual([docid for docid, _ in got], [docid for docid, _ in sims])
+            self.assertTrue(numpy.allclose([sim for _, sim in got], [sim for _, sim in sims]))
+        # thresholded sparse rows, same as the dense result
+        dense = index[corpus]
+        results = sum(index.query_chunks(corpus, chunksize=4, threshold=0.3), [])
+        self.assertEqual(len(results), len(corpus))
+        for got, row in zip(results, dense):
+            self.assertEqual([docid for docid, _ in got], [docid for docid, sim in enumerate(row) if sim >= 0.3])
+            self.assertTrue(numpy.allclose([sim for _, sim in got], row[row >= 0.3]))
+        # deleted documents are never returned
+        index.delete_documents([0, 5])
+        for threshold in [None, 0.0]:
+            for result in sum(index.query_chunks(corpus, chunksize=4, threshold=threshold), []):
+                self.assertFalse(set([0, 5]) & set(docid for docid, _ in result))
+        index.destroy()
+
+    def testSaveSimilarities(self):
+        from gensim.corpora import MmCorpus
+        index = similarities.Similarity(None, corpus, num_features=len(dictionary), shardsize=2)
+        fname = testfile() + '.mm'
+        self.assertEqual(index.save_similarities(fname, corpus, chunksize=4, threshold=0.1), len(corpus))
+        dense = index[corpus]
+        sims = MmCorpus(fname)
+        self.assertEqual(len(sims), len(corpus))
+        for doc, row in zip(sims, dense):
+            expected = matutils.full2sparse(numpy.where(row >= 0.1, row, 0.0))
+            self.assertEqual([docid for docid, _ in doc], [docid for docid, _ in expected])
+            self.assertTrue(numpy.allclose([sim for _, sim in doc], [sim for _, sim in expected], atol=1e-6))
+        index.destroy()
+
+
+class TestRandomProjectionIndexer(unittest.TestCase):
+    def setUp(self):
+        vectors = numpy.random.RandomState(0).randn(500, 20).astype(numpy.float32)
+        self.vectors = vectors / numpy.sqrt((vectors ** 2).sum(1))[:, numpy.newaxis]
+
+    def testExhaustive(self):
+        # inspecting all vectors gives the exact result
+        index = similarities.RandomProjectionIndexer(num_trees=3, leaf_size=10)
+        index.build(self.vectors)
+        for query in self.vectors[:10]:
+            exact = matutils.argsort(numpy.dot(self.vectors, query), topn=5, reverse=True)
+            approx = index.most_similar(query, topn=5, search_k=len(self.vectors))
+            self.assertEqual(list(exact), [pos for pos, _ in approx])
+
+    def testRecall(self):
+        index = similarities.RandomProjectionIndexer(num_trees=10, leaf_size=10)
+        index.build(self.vectors)
+        found = 0
+        for query in self.vectors[:20]:
+            exact = matutils.argsort(numpy.dot(self.vectors, query), topn=10, reverse=True)
+            found += len(set(exact) & set(pos for pos, _ in index.most_similar(query, topn=10)))
+        self.assertTrue(found >= 0.8 * 20 * 10)
+
+    def testPersistence(self):
+        fname = testfile()
+        index = similarities.RandomProjectionIndexer(num_trees=3, leaf_size=10)
+        index.build(self.vectors)
+        index.save(fname, sep_limit=0)
+        for mmap in [None, 'r']:
+            index2 = similarities.RandomProjectionIndexer.load(fname, mmap=mmap)
+            self.assertEqual(index.most_similar(self.vectors[0]), index2.most_similar(self.vectors[0]))
+
+    def testWord2Vec(self):
+        model = word2vec.Word2Vec(texts, size=10, min_count=1, seed=42)
+        index = similarities.RandomProjectionIndexer(model, num_trees=2, search_k=1000)
+        self.assertEqual(len(index), len(model.vocab))
+        exact = model.most_similar('graph', topn=5)
+        approx = model.most_similar('graph', topn=5, indexer=index)
+        self.assertEqual([word for word, _ in exact], [word for word, _ in approx])
+        self.assertTrue(numpy.allclose([sim for _, sim in exact], [sim for _, sim in approx]))
+
+    def testDocvecs(self):
+        documents = [doc2vec.TaggedDocument(words, ['doc%i' % docno]) for docno, words in enumerate(texts)]
+        model = doc2vec.Doc2Vec(documents, size=10, min_count=1, seed=42)
+        index = similarities.RandomProjectionIndexer(model.docvecs, num_trees=2, search_k=1000)
+        self.assertEqual(len(index), len(documents))
+        exact = model.docvecs.most_similar('doc0', topn=3)
+        approx = model.docvecs.most_similar('doc0', topn=3, indexer=index)
+        self.assertEqual([doc for doc, _ in exact], [doc for doc, _ in approx])
+
+
+class TestAllPairs(unittest.TestCase):
+    def setUp(self):
+        vectors = numpy.random.RandomState(0).randn(50, 5).astype(numpy.float32)
+        self.vectors = vectors / numpy.sqrt((vectors ** 2).sum(1))[:, numpy.newaxis]
+        self.sims = numpy.dot(self.vectors, self.vectors.T)
+        numpy.fill_diagonal(self.sims, -numpy.inf)
+
+    def assertSimsEqual(self, got, expected):
+        self.assertEqual([docid for docid, _ in got], [docid for docid, _ in expected])
+        self.assertTrue(numpy.allclose([sim for _, sim in got], [sim for _, sim in expected], atol=1e-5))
+
+    def testThreshold(self):
+        for blocksize in [7, 50, 100]:
+            result = list(similarities.all_pairs(self.vectors, threshold=0.5, blocksize=blocksize))
+            self.assertEqual(len(result), len(self.vectors))
+            for got, row in zip(result, self.sims):
+                self.assertSimsEqual(got, [(docid, sim) for docid, sim in enumerate(row) if sim >= 0.5])
+
+    def testNumBest(self):
+        for blocksize in [3, 7, 50]:
+            result = list(similarities.all_pairs(self.vectors, num_best=4, blocksize=blocksize))
+            for got, row in zip(result, self.sims):
+                best = matutils.argsort(row, topn=4, reverse=True)
+                self.assertSimsEqual(got, [(docid, row[docid]) for docid in best])
+        # combined with a threshold
+        for got, row in zip(similarities.all_pairs(self.vectors, num_best=4, threshold=0.8, blocksize=7), self.sims):
+            best = matutils.argsort(row, topn=4, reverse=True)
+            self.assertSimsEqual(got, [(docid, row[docid]) for docid in best if row[docid] >= 0.8])
+
+    def testIndex(self):
+        # sparse index, same result as iterating over the index; documents are similar to themselves
+        index = similarities.SparseMatrixSimilarity(corpus, num_features=len(dictionary))
+        for got, row in zip(similarities.all_pairs(index, blocksize=4, include_self=True), index):
+            self.assertSimsEqual(got, matutils.full2sparse(row))
+        # sharded indexes aren't supported
+        index = similarities.Similarity(None, corpus, num_features=len(dictionary))
+        self.assertRaises(TypeError, list, similarities.all_pairs(index))
+        self.assertRaises(TypeError, similarities.save_all_pairs, testfile() + '.mm', index)
+
+    def testWorkers(self):
+        fname = testfile() + '.mm'
+        similarities.save_all_pairs(fname, self.vectors, threshold=0.5, blocksize=10, workers=2)
+        result = list(mmcorpus.MmCorpus(fname))
+        self.assertEqual(len(result), len(self.vectors))
+        expected = similarities.all_pairs(self.vectors, threshold=0.5, blocksize=10)
+        for got, sims in zip(result, expected):
+            self.assertSimsEqual(got, sims)
+
+
+class TestLshIndex(unittest.TestCase):
+    def setUp(self):
+        # documents 0-49 are random; documents 50-99 are near-duplicates of documents 0-49
+        rand = numpy.random.RandomState(0)
+        self.docs = [sorted((int(wordid), 1.0) for wordid in rand.choice(1000, 50, replace=False)) for _ in range(50)]
+        self.docs += [doc[:-2] for doc in self.docs]
+
+    def testMinHash(self):
+        index = similarities.LshIndex(self.docs[:50], method='minhash', chunksize=7)
+        self.assertEqual(len(index), 50)
+        for docno, doc in enumerate(self.docs[50:]):
+            sims = index.most_similar(doc, topn=3)
+            self.assertEqual(sims[0][0], docno)
+            self.assertAlmostEqual(sims[0][1], matutils.cossim(doc, self.docs[docno]))
+        self.assertEqual(index.most_similar([]), [])
+
+    def testSimHash(self):
+        tfidf = [[(wordid, float(wordid % 7 + 1)) for wordid, _ in doc] for doc in self.docs]
+        index = similarities.LshIndex(tfidf[:50], method='simhash', num_features=1000, num_bands=16, rows_per_band=4)
+        found = 0
+        for docno, doc in enumerate(tfidf[50:]):
+            sims = index.most_similar(doc, topn=1)
+            found += [docid for docid, _ in sims] == [docno]
+        self.assertTrue(found >= 45)
+
+    def testIncremental(self):
+        index = similarities.LshIndex(method='minhash')
+        for doc in self.docs:
+            # dedupe the stream: add only documents that aren't near-duplicates of one already added
+            if not index.most_similar(doc, topn=1, threshold=0.9):
+                index.add_documents([doc])
+        self.assertEqual(len(index), 50)
+
+    def testEstimate(self):
+        index = similarities.LshIndex(self.docs[:50], num_bands=50, rows_per_band=2, store_documents=False)
+        sims = index.most_similar(self.docs[50], topn=1)
+        self.assertEqual(sims[0][0], 0)
+        self.assertTrue(abs(sims[0][1] - 48.0 / 50) < 0.1)  # Jaccard similarity
+
+    def testPersistence(self):
+        fname = testfile()
+        for method in ['minhash', 'simhash']:
+            index = similarities.LshIndex(self.docs[:10], method=method, num_features=1000)
+            index.save(fname)
+            index2 = similarities.LshIndex.load(fname)
+            self.assertEqual(index.most_similar(self.docs[55]), index2.most_similar(self.docs[55]))
+            index2.add_documents(self.docs[10:50])
+            self.assertEqual(index2.most_similar(self.docs[55], topn=1)[0][0], 5)
+
 
 if __name__ == '__main__':
     logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
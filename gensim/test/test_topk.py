@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+Automated tests for checking the top-N selection functions.
+"""
+
+
+import logging
+import unittest
+
+import numpy
+
+from gensim import matutils, topk
+
+
+class TestTopK(unittest.TestCase):
+    def setUp(self):
+        self.x = numpy.random.RandomState(0).uniform(-1, 1, size=(5, 100))
+
+    def test_argtopk(self):
+        vec = self.x[0]
+        for topn in [1, 5, 99, 100, 200]:
+            self.assertEqual(list(topk.argtopk(vec, topn)), list(numpy.argsort(vec)[:topn]))
+            self.assertEqual(list(topk.argtopk(vec, topn, reverse=True)), list(numpy.argsort(-vec)[:topn]))
+        self.assertEqual(list(topk.argtopk(vec, 0)), [])
+        self.assertEqual(list(topk.argtopk(vec, reverse=True)), list(numpy.argsort(-vec)))
+
+    def test_argtopk_exclude(self):
+        vec = self.x[0]
+        full = list(numpy.argsort(-vec))
+        exclude = set(full[:3] + full[5:6])
+        expected = [index for index in full if index not in exclude]
+        self.assertEqual(list(topk.argtopk(vec, 4, reverse=True, exclude=exclude)), expected[:4])
+        self.assertEqual(list(topk.argtopk(vec, 1000, reverse=True, exclude=exclude)), expected)
+
+    def test_topk_rows(self):
+        exclude = [[], [3, 5], list(range(98)), [], list(range(100))]
+        for topn in [1, 3, 100]:
+            indices, values = topk.topk_rows(self.x, topn, reverse=True, exclude=exclude)
+            self.assertEqual(indices.shape, (5, topn))
+            for row, ignore in enumerate(exclude):
+                expected = list(topk.argtopk(self.x[row], topn, reverse=True, exclude=ignore))
+                self.assertEqual(list(indices[row][:len(expected)]), expected)
+                self.assertTrue(numpy.allclose(values[row][:len(expected)], self.x[row][expected]))
+                self.assertTrue(numpy.all(values[row][len(expected):] == -numpy.inf))
+        indices, values = topk.topk_rows(self.x, 4)
+        self.assertTrue(numpy.allclose(values, numpy.sort(self.x, axis=1)[:, :4]))
+
+    def test_clip_rows(self):
+        x = self.x.copy()
+        x[1, :] = 0.0
+        x[2, 10:] = 0.0
+        for topn in [0, 3, 20, 100]:
+            expected = [matutils.full2sparse_clipped(row, topn) for row in x]
+            self.assertEqual(topk.clip_rows(x, topn), expected)
+
+    def test_merge(self):
+        parts = [matutils.full2sparse_clipped(row, 10) for row in self.x]
+        expected = sorted(sum(parts, []), key=lambda item: -item[1])
+        for topn in [1, 7, 50, 100]:
+            self.assertEqual(topk.merge(parts, topn), expected[:topn])
+        self.assertEqual(topk.merge([[], []], 5), [])
+
+    def test_merge_blocks(self):
+        blocksize = 30
+        blocks = [(start, topk.topk_rows(self.x[:, start: start + blocksize], 7, reverse=True))
+                  for start in range(0, self.x.shape[1], blocksize)]
+        indices, values = topk.merge_blocks(blocks, 7, reverse=True)
+        expected_indices, expected_values = topk.topk_rows(self.x, 7, reverse=True)
+        self.assertTrue(numpy.all(indices == expected_indices))
+        self.assertTrue(numpy.allclose(values, expected_values))
+#endclass TestTopK
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(asctime)s : %(levelname)s : %(message)s', level=logging.DEBUG)
+    unittest.main()
@@ -15,11 +15,13 @@ import os
 import tempfile
 import itertools
 import bz2
+import io
 
 import numpy
 
 from gensim import utils, matutils
 from gensim.models import word2vec
+from gensim.models.keyedvectors import KeyedVectors
 
 module_path = os.path.dirname(__file__) # needed because sample data files are located in the same folder
 datapath = lambda fname: os.path.join(module_path, 'test_data', fname)
@@ -90,6 +92,38 @@ class TestWord2VecModel(unittest.TestCase):
         binary_model_with_vocab = word2vec.Word2Vec.load_word2vec_format(testfile(), testvocab, binary=True)
         self.assertEqual(model.vocab['human'].count, binary_model_with_vocab.vocab['human'].count)
 
+    def testLoadWord2VecFormatOptions(self):
+        """Test loading a limited number of vectors, as float16, into a memmap."""
+        model = word2vec.Word2Vec(sentences, min_count=1)
+        model.save_word2vec_format(testfile(), binary=False)
+        limited = word2vec.Word2Vec.load_word2vec_format(testfile(), binary=False, norm_only=False, limit=5,
+                                                         datatype=numpy.float16, mapfile_path=testfile() + '.syn0')
+        self.assertEqual(len(limited.vocab), 5)
+        self.assertTrue(isinstance(limited.syn0, numpy.memmap))
+        self.assertEqual(limited.syn0.dtype, numpy.float16)
+        for word in limited.index2word:
+            self.assertTrue(numpy.allclose(model[word], limited[word], atol=1e-3))
+
+        # intersecting words adopt the file's weights
+        other = word2vec.Word2Vec(sentences, min_count=1, seed=7)
+        other.intersect_word2vec_format(testfile(), binary=False)
+        self.assertTrue(numpy.allclose(other['human'], model['human'], atol=1e-6))
+        self.assertEqual(other.syn0_lockf[other.vocab['human'].index], 0.0)
+
+    def testReadWord2VecChunks(self):
+        """Test reading binary records across buffer refills, with and without newlines."""
+        vectors = numpy.arange(30, dtype=numpy.float32).reshape(10, 3)
+        vectors[4] = 32.0  # b' ' inside vector bytes must not be taken for a word boundary
+        words = [u'w%i' % i for i in range(10)]
+        for separator in [b'\n', b'']:
+            data = separator.join(word.encode('utf8') + b' ' + vector.tobytes() for word, vector in zip(words, vectors))
+            chunks = list(word2vec.read_word2vec_chunks(io.BytesIO(data), 10, 3, binary=True, chunksize=3))
+            self.assertEqual([len(chunk_words) for chunk_words, _ in chunks], [3, 3, 3, 1])
+            self.assertEqual(sum((chunk_words for chunk_words, _ in chunks), []), words)
+            self.assertTrue(numpy.all(numpy.vstack([chunk for _, chunk in chunks]) == vectors))
+        self.assertRaises(EOFError, list, word2vec.read_word2vec_chunks(io.BytesIO(data), 11, 3, binary=True))
+        self.assertRaises(ValueError, list, word2vec.read_word2vec_chunks(io.BytesIO(b'a 1 2\nb 1\n'), 2, 2))
+
     def test_zero_workers_mode(self):
         model = word2vec.Word2Vec(sentences, min_count=1)
         model0 = word2vec.Word2Vec(sentences, min_count=1, workers=0)
@@ -106,6 +140,25 @@ class TestWord2VecModel(unittest.TestCase):
         # make sure mmaping the arrays back works, too
         self.models_equal(model, word2vec.Word2Vec.load(testfile(), mmap='r'))
 
+    def testParallelVocab(self):
+        """Test vocabulary scanning in parallel processes, with and without pruning."""
+        shards = word2vec.LineSentence(datapath('lee_background.cor')).shards(3)
+        model = word2vec.Word2Vec(min_count=1)
+        model.build_vocab(shards, workers=3)
+        serial = word2vec.Word2Vec(min_count=1)
+        serial.build_vocab(word2vec.LineSentence(datapath('lee_background.cor')))
+        self.assertEqual(model.corpus_count, serial.corpus_count)
+        # words of equal count may be ordered differently (dict order isn't stable on all pythons)
+        self.assertEqual(sorted(model.index2word), sorted(serial.index2word))
+        for word in serial.index2word:
+            self.assertEqual(model.vocab[word].count, serial.vocab[word].count)
+            self.assertTrue(numpy.allclose(model[word], serial[word]))
+
+        model = word2vec.Word2Vec(min_count=1, max_vocab_size=500)
+        model.scan_vocab(shards, workers=3)
+        self.assertTrue(len(model.raw_vocab) <= 500)
+        self.assertEqual(model.corpus_count, serial.corpus_count)
+
     def testVocab(self):
         """Test word2vec vocabulary building."""
         corpus = LeeCorpus()
@@ -132,6 +185,43 @@ class TestWord2VecModel(unittest.TestCase):
         # input not empty, but rather completely filtered out
         self.assertRaises(RuntimeError, word2vec.Word2Vec, corpus, min_count=total_words+1)
 
+    def testCompactVocab(self):
+        """Test the array-backed vocabulary and its Vocab-like items."""
+        model = word2vec.Word2Vec(sentences, size=10, min_count=1, seed=42, workers=1)
+        vocab = model.vocab
+        self.assertTrue(isinstance(vocab, word2vec.CompactVocab))
+        self.assertEqual(sorted(vocab), sorted(model.index2word))
+        for word, v in vocab.items():
+            self.assertEqual(model.index2word[v.index], word)
+            self.assertEqual(v.count, vocab.counts[v.index])
+            self.assertEqual(v.point[0], len(vocab) - 2)  # all paths start at the root
+
+        # huffman codes are prefix-free, and frequent words get the shorter codes
+        codes = dict((word, ''.join(map(str, vocab[word].code))) for word in vocab)
+        for word, other in itertools.permutations(vocab, 2):
+            self.assertFalse(codes[other].startswith(codes[word]))
+            if vocab[word].count > vocab[other].count:
+                self.assertTrue(len(codes[word]) <= len(codes[other]))
+
+        # dict of Vocab objects, as stored by older models
+        old_vocab = dict((word, word2vec.Vocab(count=v.count, index=v.index, sample_int=v.sample_int,
+                                               code=v.code.copy(), point=v.point.copy()))
+                         for word, v in vocab.items())
+        converted = word2vec.CompactVocab.from_dict(old_vocab)
+        for attr in ['counts', 'sample_ints', 'code_offsets', 'codes', 'points']:
+            self.assertTrue(numpy.all(getattr(converted, attr) == getattr(vocab, attr)))
+        model.vocab = old_vocab
+        model.save(testfile())
+        self.assertTrue(isinstance(word2vec.Word2Vec.load(testfile()).vocab, word2vec.CompactVocab))
+
+        # training reads the (memory-mapped) arrays directly
+        model.vocab = vocab
+        model.save(testfile(), sep_limit=0)
+        model = word2vec.Word2Vec.load(testfile(), mmap='c')
+        self.assertTrue(isinstance(model.vocab.codes, numpy.memmap))
+        model.train(sentences)
+        self.assertEqual(model.vocab['graph'].count, 3)
+
     def testTraining(self):
         """Test word2vec training."""
         # build vocabulary, don't train yet
@@ -163,6 +253,40 @@ class TestWord2VecModel(unittest.TestCase):
         scores = model.score(sentences)
         self.assertEqual(len(scores),len(sentences))
 
+    def testScoringBatch(self):
+        """Test word2vec batch scoring, with negative sampling and preallocated output."""
+        for sg in range(2):  # test both cbow and sg
+            model = word2vec.Word2Vec(sentences, size=2, min_count=1, sg=sg, hs=1, negative=5)
+            scores = model.score(sentences)
+            self.assertEqual(len(scores), len(sentences))
+            self.assertTrue((scores <= 0).all() and scores.any())  # log probabilities
+
+            # the same scores from score_batch, into a preallocated array, and scoring is deterministic
+            out = numpy.zeros(len(sentences), dtype=numpy.float32)
+            model.workers = 2
+            self.assertTrue(model.score_batch(sentences, out=out) is out)
+            self.assertTrue(numpy.allclose(scores, out))
+            self.assertTrue(numpy.allclose(scores, model.score(iter(sentences), out=numpy.zeros_like(out))))
+            self.assertRaises(ValueError, model.score_batch, sentences, out=numpy.zeros(len(sentences)))
+            # errors in worker threads are raised in the caller
+            self.assertRaises(TypeError, model.score_batch, sentences + [None])
+
+
+    def testTrainWorkers(self):
+        """Test training from lists (sharded) and from streams (shared), in threads or in the calling thread."""
+        num_words = sum(len(sentence) for sentence in sentences)
+        for workers in (0, 1, 3):
+            model = word2vec.Word2Vec(size=2, min_count=1, sample=0, iter=2, workers=workers)
+            model.build_vocab(sentences)
+            self.assertEqual(model.train(sentences, chunksize=2), 2 * num_words)
+            self.assertEqual(model.train(tuple(sentences), chunksize=100), 2 * num_words)
+            model.iter = 1
+            self.assertEqual(model.train(iter(sentences), chunksize=2), num_words)
+
+            def broken_corpus():
+                yield sentences[0]
+                raise ValueError("broken corpus")
+            self.assertRaises(ValueError, model.train, broken_corpus(), chunksize=1)
 
     def testLocking(self):
         """Test word2vec training doesn't change locked vectors."""
@@ -300,6 +424,71 @@ class TestWord2VecModel(unittest.TestCase):
         self.assertTrue(model.n_similarity(['graph', 'trees'], ['trees', 'graph']))
         self.assertTrue(model.n_similarity(['graph'], ['trees']) == model.similarity('graph', 'trees'))
 
+    def testInitSims(self):
+        """Test blocked normalization of the word vectors, in RAM, into a memmap and in place."""
+        model = word2vec.Word2Vec(sentences, size=10, min_count=1, seed=42, workers=1)
+        expected = model.syn0 / numpy.sqrt((model.syn0 ** 2).sum(-1))[:, numpy.newaxis]
+        model.init_sims(blocksize=3, workers=2)
+        self.assertTrue(numpy.allclose(model.syn0norm, expected))
+        sims = model.most_similar('graph')
+
+        model.init_sims(replace=True, blocksize=5)  # load the model back memory-mapped, normalize into a memmap
+        model.save(testfile(), sep_limit=0)
+        model = word2vec.Word2Vec.load(testfile(), mmap='r')
+        model.init_sims(mapfile_path=testfile() + '.syn0norm', blocksize=4)
+        self.assertTrue(isinstance(model.syn0norm, numpy.memmap))
+        self.assertTrue(numpy.allclose(model.syn0norm, expected))
+        self.assertEqual([word for word, _ in model.most_similar('graph')], [word for word, _ in sims])
+
+        # zero vectors stay zero
+        self.assertTrue(numpy.all(matutils.unitvec_rows(numpy.zeros((3, 2))) == 0))
+
+    def testMostSimilarBatch(self):
+        """Test batched most_similar queries against one-by-one queries."""
+        model = word2vec.Word2Vec(sentences, size=10, min_count=1, seed=42, workers=1)
+        queries = [
+            (['graph', 'trees'], ['computer']),
+            (['human'], []),
+            ('system', []),
+            ([(model['user'], 1.0), 'eps'], [('time', -0.5)]),
+        ]
+        for topn in [1, 3, 100]:
+            batch = model.most_similar_batch(queries, topn=topn, chunksize=3)
+            self.assertEqual(len(batch), len(queries))
+            for (positive, negative), sims in zip(queries, batch):
+                expected = model.most_similar(positive=positive, negative=negative, topn=topn)
+                self.assertEqual([word for word, sim in sims], [word for word, sim in expected])
+                self.assertTrue(numpy.allclose([sim for word, sim in sims], [sim for word, sim in expected], atol=1e-6))
+
+        # the search blocks over the vocabulary must merge into the same result
+        model.init_sims()
+        means = numpy.array([model._query_vector(['graph'])[0], model._query_vector(['user'])[0]])
+        ignores = [set([model.vocab['graph'].index]), set()]
+        positions, sims = model._most_similar_rows(means, ignores, model.syn0norm, 4)
+        positions2, sims2 = model._most_similar_rows(means, ignores, model.syn0norm, 4, blocksize=3)
+        self.assertTrue(numpy.allclose(sims, sims2))
+        self.assertFalse(model.vocab['graph'].index in positions[0])
+
+    def testAccuracy(self):
+        """Test batched accuracy against one question at a time."""
+        model = word2vec.Word2Vec(list_corpus, size=20, min_count=5, seed=42, workers=1, iter=1)
+        words = sorted(model.vocab, key=lambda word: -model.vocab[word].count)[:40]
+        with utils.smart_open(testfile(), 'wb') as fout:
+            for sectionno in range(3):
+                fout.write(utils.to_utf8(": section%i\n" % sectionno))
+                for questionno in range(20):
+                    question = [words[(7 * questionno + 3 * pos + sectionno) % len(words)] for pos in range(4)]
+                    fout.write(utils.to_utf8(' '.join(question) + "\n"))
+                fout.write(utils.to_utf8("oov_word oov_word oov_word oov_word\n"))
+        try:
+            batched = model.accuracy(testfile(), restrict_vocab=30, chunksize=7)
+            one_by_one = model.accuracy(testfile(), restrict_vocab=30, most_similar=word2vec.Word2Vec.most_similar)
+        finally:
+            os.unlink(testfile())
+        self.assertEqual([s['section'] for s in batched], ['section0', 'section1', 'section2', 'total'])
+        self.assertEqual(batched, one_by_one)
+        self.assertTrue(len(batched[-1]['correct']) + len(batched[-1]['incorrect']) > 0)
+
     def testParallel(self):
         """Test word2vec parallel training."""
         if word2vec.FAST_VERSION < 0:  # don't test the plain NumPy version for parallelism (too slow)
@@ -355,6 +544,15 @@ class TestWord2VecSentenceIterators(unittest.TestCase):
             for words in sentences:
                 self.assertEqual(words, utils.to_unicode(orig.readline()).split())
 
+    def testLineSentenceShards(self):
+        """Do LineSentence shards yield all lines of the file, each exactly once?"""
+        sentences = list(word2vec.LineSentence(datapath('head500.noblanks.cor')))
+        for num_shards in [1, 3, 7]:
+            shards = word2vec.LineSentence(datapath('head500.noblanks.cor')).shards(num_shards)
+            self.assertEqual(len(shards), num_shards)
+            self.assertEqual(list(itertools.chain(*shards)), sentences)
+        self.assertRaises(ValueError, word2vec.LineSentence(datapath('head500.noblanks.cor.bz2')).shards, 2)
+
     def testLineSentenceWorksWithNormalFile(self):
         """Does LineSentence work with a file object argument, rather than filename?"""
         with utils.smart_open(datapath('head500.noblanks.cor')) as orig:
@@ -364,6 +562,31 @@ class TestWord2VecSentenceIterators(unittest.TestCase):
                     self.assertEqual(words, utils.to_unicode(orig.readline()).split())
 #endclass TestWord2VecSentenceIterators
 
+
+class TestKeyedVectors(unittest.TestCase):
+    def testQueries(self):
+        """Test memory-mapped KeyedVectors against the queries of the model they were made from."""
+        model = word2vec.Word2Vec(list_corpus, size=20, min_count=1, seed=42, workers=1)
+        KeyedVectors(model).save(testfile())
+        vectors = KeyedVectors.load(testfile())
+        self.assertTrue(isinstance(vectors.syn0norm, numpy.memmap))
+        self.assertEqual(len(vectors), len(model.vocab))
+        self.assertEqual(list(vectors.index2word), model.index2word)
+        self.assertEqual(vectors.vocab['the'].index, model.vocab['the'].index)
+        self.assertEqual(vectors.vocab['the'].count, model.vocab['the'].count)
+        self.assertTrue('the' in vectors)
+        self.assertFalse('not-a-word' in vectors)
+        self.assertRaises(KeyError, vectors.__getitem__, 'not-a-word')
+
+        self.assertTrue(numpy.allclose(vectors['the'], model.syn0norm[model.vocab['the'].index]))
+        self.assertEqual(vectors.most_similar('the'), model.most_similar('the'))
+        self.assertEqual(vectors.most_similar(positive=['man', 'king'], negative=['woman'], topn=3),
+                         model.most_similar(positive=['man', 'king'], negative=['woman'], topn=3))
+        self.assertAlmostEqual(vectors.similarity('man', 'woman'), model.similarity('man', 'woman'), places=5)
+        words = ['man', 'woman', 'king', 'car']
+        self.assertEqual(vectors.doesnt_match(words), model.doesnt_match(words))
+#endclass TestKeyedVectors
+
 if not hasattr(TestWord2VecModel, 'assertLess'):
     # workaround for python 2.6
     def assertLess(self, a, b, msg=None):
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Licensed under the GNU LGPL v2.1 - http://www.gnu.org/licenses/lgpl.html
+
+"""
+This module contains functions for selecting the top-N (greatest or smallest)
+elements of a vector, of each row of a matrix, or of several partial results, without
+sorting all the elements.
+
+A full sort of `n` elements costs O(n log n); partitioning out the top-N with
+`numpy.argpartition` costs O(n), plus O(N log N) to sort the (few) selected elements.
+When `n` is large (similarity of a query to millions of documents or words) and N is
+small (`num_best=10`), the selection is dominated by a single linear pass:
+
+>>> argtopk(sims, 10, reverse=True)  # positions of the 10 greatest similarities, greatest first
+>>> argtopk(sims, 10, reverse=True, exclude=[3, 17])  # same, but never return positions 3 and 17
+
+"""
+
+import heapq
+
+import numpy
+
+
+def argtopk(x, topn=None, reverse=False, exclude=None):
+    """
+    Return indices of the `topn` smallest elements in 1d array `x`, in ascending order.
+
+    If `reverse` is True, return the greatest elements instead, in descending order.
+
+    Indices in `exclude` (a collection of ints) are never returned, so fewer than `topn`
+    indices come back only if `x` doesn't have enough other elements.
+
+    """
+    x = numpy.asarray(x)  # unify code path for when `x` is not a numpy array (list, tuple...)
+    exclude = set(exclude) if exclude else ()
+    if topn is None:
+        topn = x.size
+    if topn <= 0:
+        return []
+    if reverse:
+        x = -x
+    selected = topn + len(exclude)  # excluded elements may be among the best; select enough to drop them
+    if selected >= x.size or not hasattr(numpy, 'argpartition'):
+        best = numpy.argsort(x)
+    else:
+        # numpy >= 1.8 has a fast partial argsort, use that!
+        most_extreme = numpy.argpartition(x, selected - 1)[:selected]
+        best = most_extreme.take(numpy.argsort(x.take(most_extreme)))  # resort topn into order
+    if exclude:
+        best = numpy.array([index for index in best if index not in exclude], dtype=best.dtype)
+    return best[:topn]
+
+
+def topk_rows(x, topn, reverse=False, exclude=None):
+    """
+    Select the `topn` smallest elements of each row of 2d array `x`, in ascending order
+    (greatest elements in descending order if `reverse` is True).
+
+    `exclude`, if given, is a sequence with one collection of column indices per row; these
+    columns are never selected for that row.
+
+    Return a 2-tuple of (column indices, values), both 2d arrays with one row per row of `x`
+    and `min(topn, x.shape[1])` columns. If a row has fewer than `topn` columns that aren't
+    excluded, the rest of that row is filled by excluded columns, with value +inf (-inf
+    if `reverse`).
+
+    """
+    x = numpy.asarray(x)
+    num_rows, num_cols = x.shape
+    if exclude is None:
+        exclude = [()] * num_rows
+    topn = min(topn, num_cols)
+    selected = min(num_cols, topn + max([len(ignore) for ignore in exclude] or [0]))
+    rows = numpy.arange(num_rows)[:, numpy.newaxis]
+    keys = -x if reverse else x
+    if selected < num_cols:
+        indices = numpy.argpartition(keys, selected - 1, axis=1)[:, :selected]
+    else:
+        indices = numpy.arange(num_cols)[numpy.newaxis, :].repeat(num_rows, axis=0)
+    selected_keys = keys[rows, indices]  # a copy; only `selected` columns per row
+    for row, ignore in enumerate(exclude):
+        if ignore:
+            selected_keys[row, [pos for pos, index in enumerate(indices[row]) if index in ignore]] = numpy.inf
+    order = numpy.argsort(selected_keys, axis=1, kind='mergesort')[:, :topn]
+    indices, selected_keys = indices[rows, order], selected_keys[rows, order]
+    return indices, -selected_keys if reverse else selected_keys
+
+
+def clip_rows(x, topn, eps=1e-9):
+    """
+    Like `matutils.full2sparse_clipped`, for each row of 2d array `x` at once: return a list
+    with one list of `(column index, value)` 2-tuples per row, of the `topn` greatest
+    values whose magnitude is above `eps`, greatest first.
+
+    """
+    if topn <= 0:
+        return [[] for row in x]
+    x = numpy.asarray(x, dtype=float)
+    # near-zero elements must never be selected, even when there are fewer than `topn`
+    # other elements; mask them in one vectorized pass
+    masked = numpy.where(numpy.abs(x) > eps, x, -numpy.inf)
+    indices, values = topk_rows(masked, topn, reverse=True)
+    result = []
+    for row_indices, row_values in zip(indices, values):
+        valid = row_values > -numpy.inf
+        result.append(list(zip(row_indices[valid], row_values[valid])))
+    return result
+
+
+def merge(parts, topn, key=lambda item: item[1]):
+    """
+    Merge several partial top-N results into a single top-`topn` list.
+
+    `parts` is an iterable of lists (e.g. one per index shard), each already sorted by `key`
+    in descending order, such as the output of `matutils.full2sparse_clipped`. Only the
+    heads of the lists are compared, so the cost is O(topn * log(number of parts)),
+    independent of the length of the lists.
+
+    """
+    parts = [part if isinstance(part, list) else list(part) for part in parts]
+    heap = [(-key(part[0]), part_no, 0) for part_no, part in enumerate(parts) if part]
+    heapq.heapify(heap)
+    result = []
+    while heap and len(result) < topn:
+        _, part_no, pos = heapq.heappop(heap)
+        part = parts[part_no]
+        result.append(part[pos])
+        if pos + 1 < len(part):
+            heapq.heappush(heap, (-key(part[pos + 1]), part_no, pos + 1))
+    return result
+
+
+def merge_blocks(blocks, topn, reverse=False):
+    """
+    Combine `topk_rows` results computed separately over column blocks of a matrix into the
+    result over the whole matrix.
+
+    `blocks` is an iterable of `(start, (indices, values))` 2-tuples, where `start` is the
+    first column of the block and `(indices, values)` is the output of `topk_rows` on that
+    block. Return `(indices, values)` of the `topn` best columns per row, in the same format
+    as `topk_rows`, with indices relative to the whole matrix.
+
+    """
+    all_indices, all_values = [], []
+    for start, (indices, values) in blocks:
+        all_indices.append(indices + start)
+        all_values.append(values)
+    indices, values = numpy.hstack(all_indices), numpy.hstack(all_values)
+    best, values = topk_rows(values, topn, reverse=reverse)
+    return indices[numpy.arange(len(indices))[:, numpy.newaxis], best], values
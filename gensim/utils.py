@@ -32,6 +32,7 @@ from functools import wraps  # for `synchronous` function lock
 import multiprocessing
 import shutil
 import sys
+from collections import defaultdict
 from contextlib import contextmanager
 
 import numpy
@@ -1105,3 +1106,33 @@ def prune_vocab(vocab, min_reduce):
     logger.info("pruned out %i tokens with count <=%i (before %i, after %i)",
                 old_len - len(vocab), min_reduce, old_len, len(vocab))
     return result
+
+
+def merge_vocabs(parts, max_vocab_size=None):
+    """
+    Merge partial word counts, collected separately (e.g. by parallel workers) over
+    consecutive parts of a corpus, into a single count dictionary.
+
+    `parts` is an iterable of `(vocab, min_reduce)` 2-tuples, where `vocab` is a dict of
+    word => count and `min_reduce` is the next pruning threshold of the worker that
+    collected it (1 if it never pruned, see `prune_vocab`).
+
+    If the merged dictionary grows beyond `max_vocab_size` words, it's pruned with the
+    highest `min_reduce` seen so far, which is then incremented, like in a single pass over
+    the whole corpus. Without any pruning, the result is identical to counting serially,
+    including the order in which the words were first seen.
+
+    Return a 3-tuple `(vocab, min_reduce, pruned)`: the merged counts (a defaultdict), the
+    next pruning threshold, and the sum of all counts pruned during the merge.
+
+    """
+    merged = defaultdict(int)
+    min_reduce, pruned = 1, 0
+    for vocab, part_min_reduce in parts:
+        min_reduce = max(min_reduce, part_min_reduce)
+        for word, count in iteritems(vocab):
+            merged[word] += count
+        while max_vocab_size and len(merged) > max_vocab_size:
+            pruned += prune_vocab(merged, min_reduce)
+            min_reduce += 1
+    return merged, min_reduce, pruned
@@ -118,6 +118,9 @@ setup(
         Extension('gensim.models.doc2vec_inner',
             sources=['./gensim/models/doc2vec_inner.c'],
             include_dirs=[model_dir]),
+        Extension('gensim.models.ldamodel_inner',
+            sources=['./gensim/models/ldamodel_inner.c'],
+            include_dirs=[model_dir]),
     ],
     cmdclass={'build_ext': custom_build_ext},
     packages=find_packages(),